@@ -109,6 +109,8 @@ from sklearn.metrics import r2_score  # Import r2_score function
 #import requests
 import scipy.interpolate as interp
 from scipy.interpolate import CubicSpline
+from interpolation import batched_cubic_interpolation, cached_batched_cubic_interpolation
+from raw_data import load_dbase_csv
 #from mpl_toolkits.axes_grid1 import make_axes_locatable
 import base64
 from datetime import datetime
@@ -1533,7 +1535,7 @@ def smooth_transition(value, min_val, max_val, transition_range=0.2):
 # Global variable to store original values
 original_values = {}
 
-def cubic_interpolation(df, kw):
+def cubic_interpolation(df, kw, splined=None):
     # Extract actual data points (non-NaN values)
     actual_data = df[~df[kw].isna()]
     
@@ -1545,98 +1547,29 @@ def cubic_interpolation(df, kw):
     if kw not in original_values:
          original_values[kw] = actual_data[kw].copy()
     
-    # Get the min and max values from original data for STRICT clipping
-    original_min = actual_data[kw].min()
-    original_max = actual_data[kw].max()
-    # NO MARGIN - Clip strictly to original data range
-    clip_min = original_min
-    clip_max = original_max 
-    
-    # Ensure index is sorted AND has correct type (datetime64[ns])
-    actual_data = actual_data.sort_index()
-    actual_data.index = pd.to_datetime(actual_data.index)
-    
-    # Convert dates to numerical values (days since epoch)
-    x = (actual_data.index - pd.Timestamp('1970-01-01')).days.values.astype(float)
-    y = actual_data[kw].values
-    
-    # Create Cubic Spline
-    cs = CubicSpline(x, y, bc_type='natural')
-
-    # --- 1. Interpolate at Daily frequency --- 
-    daily_date_range = pd.date_range(
-        start=actual_data.index.min(), 
-        end=actual_data.index.max(), 
-        freq='D' 
-    )
-    if daily_date_range.empty and not actual_data.empty:
-         daily_date_range = pd.date_range(start=actual_data.index.min(), periods=1, freq='D')
-    if daily_date_range.empty:
-        print(f"[Debug] Warning: Could not generate date range for {kw}. Returning empty DataFrame.")
-        return pd.DataFrame(columns=df.columns, index=pd.to_datetime([]))
-        
-    x_interp_daily = (daily_date_range - pd.Timestamp('1970-01-01')).days.values.astype(float)
-    y_interp_daily = cs(x_interp_daily)
-    
-    # --- 2. Clip daily values STRICTLY --- 
-    y_interp_daily_clipped = np.clip(y_interp_daily, clip_min, clip_max) # Use strict min/max
-    df_daily_clipped = pd.DataFrame(y_interp_daily_clipped, index=daily_date_range, columns=[kw])
-
-    # --- 3. Force original points into DAILY data --- 
-    for idx, val in actual_data[kw].items():
-         # Ensure idx is a Timestamp before checking
-         idx_ts = pd.Timestamp(idx)
-         if idx_ts in df_daily_clipped.index:
-              df_daily_clipped.loc[idx_ts, kw] = val # Overwrite daily value with exact original
-         else:
-              # Add original point if its exact date wasn't in the daily range
-              print(f"[Debug] Adding original point {idx_ts} ({val}) explicitly to DAILY data for {kw}")
-              new_row = pd.DataFrame({kw: [val]}, index=[idx_ts])
-              df_daily_clipped = pd.concat([df_daily_clipped, new_row])
-              
-    df_daily_clipped = df_daily_clipped.sort_index()
-
-    # --- Debug Print (Optional Daily Data) --- 
-    # print(f"\n--- [Debug] Intermediate Daily Data for {kw} (Originals Forced) ---")
-    # print(df_daily_clipped.to_string()) 
-    # print("---------------------------------------------------------------------")
-
-    # --- 4. Resample to MONTH START ('MS') --- 
-    df_monthly = df_daily_clipped[[kw]].resample('MS').mean()
+    # --- 1-4. Natural cubic spline at Daily frequency, clipped STRICTLY to the original
+    # ---      min/max, originals forced in, resampled to MONTH START ('MS') and originals
+    # ---      forced into the monthly data again (see interpolation.py).
+    # ---      get_file_data passes the batched fit of all columns sharing the same dates.
+    if splined is None or kw not in splined:
+        splined = batched_cubic_interpolation(df, [kw], daily=True)
+    df_monthly = splined[kw].to_frame()
 
-    # --- 5. Force original points into MONTHLY data (Final Pass) --- 
-    # ---    AND calculate/store Z-score & SV for Menu 5 --- 
+    # --- 5. Calculate/store Z-score & SV for Menu 5 --- 
     if kw not in original_calc_details:
          original_calc_details[kw] = {} # Initialize dict for this keyword
          
-    for idx, val in actual_data[kw].items():
-        idx_ts = pd.Timestamp(idx).normalize() 
-        
-        # Calculate Z-score and SV *before* forcing into monthly data
-        if menu == 5:
-             try:
-                  z_score = (val - 50) / 22.0 
-                  fundamental_value = (z_score * 0.891609) + 3.0
-                  # Store calculated values globally, keyed by timestamp
-                  original_calc_details[kw][idx_ts] = {'z_score': z_score, 'sv': fundamental_value}
-             except Exception as calc_e:
-                  print(f"[Warning] Could not calculate Z/SV values for {kw} at {idx_ts}: {calc_e}")
-                  original_calc_details[kw][idx_ts] = {'z_score': np.nan, 'sv': np.nan} # Store NaN on error
-        
-        # Force original value into monthly data
-        if idx_ts in df_monthly.index:
-             # print(f"[Debug] Forcing original {kw} point {idx_ts} ({val}) onto exact monthly index.") # Optional debug
-             df_monthly.loc[idx_ts, kw] = val
-        else:
-             # print(f"[Debug] Adding original point {idx_ts} ({val}) explicitly to MONTHLY data for {kw} as exact index missing.") # Optional debug
-             df_monthly.loc[idx_ts] = val
-
-    df_monthly = df_monthly.sort_index()
-
-    # --- Debug Print (Optional Monthly Data) --- 
-    # print(f"\n--- [Debug] Final Monthly Data for {kw} (Originals Forced) ---")
-    # print(df_monthly.to_string())
-    # print("=====================================================================")
+    if menu == 5:
+        for idx, val in actual_data[kw].items():
+            idx_ts = pd.Timestamp(idx).normalize() 
+            try:
+                 z_score = (val - 50) / 22.0 
+                 fundamental_value = (z_score * 0.891609) + 3.0
+                 # Store calculated values globally, keyed by timestamp
+                 original_calc_details[kw][idx_ts] = {'z_score': z_score, 'sv': fundamental_value}
+            except Exception as calc_e:
+                 print(f"[Warning] Could not calculate Z/SV values for {kw} at {idx_ts}: {calc_e}")
+                 original_calc_details[kw][idx_ts] = {'z_score': np.nan, 'sv': np.nan} # Store NaN on error
 
     return df_monthly
 
@@ -1920,9 +1853,8 @@ def get_file_data(filename, menu):
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"El archivo {filename} no existe en la carpeta 'dbase'.")
     
-    # Read the CSV file into a pandas DataFrame
-    df = pd.read_csv(file_path, index_col=0)  # Set the first column as index
-    df.index = df.index.str.strip()  # Remove leading/trailing whitespace from index values
+    # Read the CSV file into a pandas DataFrame (parsed files are reused from the raw data cache)
+    df = load_dbase_csv(file_path)  # First column as index, leading/trailing whitespace removed
     
     # Convert the index to datetime format
     if menu == 2:
@@ -1952,9 +1884,12 @@ def get_file_data(filename, menu):
     if menu == 3 or menu == 5:
         # Apply bspline interpolation for menus 3 and 5
         interpolated_data = pd.DataFrame()
+        # One spline fit per group of columns sharing the same survey dates,
+        # reused from the shared interpolation cache when the data is unchanged
+        splined = cached_batched_cubic_interpolation(df, daily=True)
         for column in df.columns:
             #interpolated = bspline_interpolation(df, column)
-            interpolated = cubic_interpolation(df, column)
+            interpolated = cubic_interpolation(df, column, splined)
             interpolated_data[column] = interpolated[column]
         
         # Set the index to datetime format
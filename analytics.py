@@ -0,0 +1,316 @@
+"""
+Precomputed per-keyword analytics for the Management Tools Analysis Dashboard.
+
+The dashboard's analysis sections only depend on the stored series of one
+keyword and the selected sources, so the database build computes them once and
+stores them in the analytics table, keyed by (keyword, source set, artifact):
+
+    correlation   pairwise Pearson matrix (every subset)
+    pca           standardized PCA loadings and explained variance (every subset)
+    seasonal      additive decomposition with a 12-month period (single sources)
+    fourier       FFT periodogram and 95th percentile threshold (single sources)
+    annual        yearly mean (GT, Bain) or sum (GB, Crossref) over the subset's dates (every subset)
+
+Source sets are bitmasks of source IDs, and artifacts are stored for the
+canonical (ascending) source order; callbacks reorder them for the selection.
+Payloads hold numbers only, so one row serves every dashboard language. The
+dashboard computes an artifact live with the same functions when it is missing
+or was stored by another ANALYTICS_VERSION.
+"""
+
+import itertools
+import pickle
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Bump when an artifact's computation or payload layout changes, so stored rows are recomputed
+ANALYTICS_VERSION = 1
+
+ARTIFACTS = ("correlation", "pca", "seasonal", "fourier", "annual")
+
+# Sources whose annual value is the sum of the year's months (Google Books, Crossref); others are averaged
+ANNUAL_SUM_SOURCES = frozenset({2, 4})
+
+# Same limits as the dashboard callbacks
+MIN_SEASONAL_POINTS = 24
+MIN_FOURIER_POINTS = 10
+MAX_FFT_SIZE = 10000
+
+
+def source_set_mask(source_ids: Iterable[int]) -> int:
+    """
+    Encode a set of source IDs as a bitmask (bit 0 is source 1).
+
+    Args:
+        source_ids: Source IDs, in any order
+
+    Returns:
+        Bitmask identifying the source set
+    """
+    mask = 0
+    for source_id in source_ids:
+        mask |= 1 << (int(source_id) - 1)
+    return mask
+
+
+def mask_source_ids(mask: int) -> List[int]:
+    """
+    Decode a source set bitmask.
+
+    Args:
+        mask: Bitmask from source_set_mask
+
+    Returns:
+        Source IDs in ascending order
+    """
+    return [bit + 1 for bit in range(mask.bit_length()) if mask >> bit & 1]
+
+
+def source_subsets(source_ids: Iterable[int]) -> List[Tuple[int, ...]]:
+    """
+    List every non-empty subset of the given sources, in ascending source order.
+
+    Args:
+        source_ids: Source IDs
+
+    Returns:
+        Tuples of source IDs, smallest subsets first
+    """
+    ordered = sorted(set(source_ids))
+    return [subset for size in range(1, len(ordered) + 1) for subset in itertools.combinations(ordered, size)]
+
+
+def compute_correlation(wide: pd.DataFrame) -> Optional[Dict[str, Any]]:
+    """
+    Compute the pairwise correlation matrix of the sources.
+
+    Each coefficient only uses the dates where both series have values.
+
+    Args:
+        wide: Frame with one column per source ID
+
+    Returns:
+        Dictionary with "sources" (ascending IDs) and "matrix", or None without columns
+    """
+    sources = sorted(wide.columns)
+    if not sources:
+        return None
+    return {"sources": sources, "matrix": wide[sources].corr().to_numpy()}
+
+
+def compute_pca(wide: pd.DataFrame) -> Optional[Dict[str, Any]]:
+    """
+    Fit a PCA on the standardized sources, using the dates where all of them have values.
+
+    Args:
+        wide: Frame with one column per source ID
+
+    Returns:
+        Dictionary with "sources" (ascending IDs), "components" (one row per
+        component, one column per source) and "explained_variance_ratio", or
+        None with fewer than two complete dates
+    """
+    from sklearn.decomposition import PCA
+    from sklearn.preprocessing import StandardScaler
+
+    sources = sorted(wide.columns)
+    complete = wide[sources].dropna()
+    if not sources or len(complete) < 2:
+        return None
+
+    pca = PCA()
+    pca.fit(StandardScaler().fit_transform(complete))
+    return {"sources": sources, "components": pca.components_,
+            "explained_variance_ratio": pca.explained_variance_ratio_}
+
+
+def pca_components_for(payload: Dict[str, Any], source_ids: List[int]) -> np.ndarray:
+    """
+    Get the PCA loadings of a stored fit for the sources in a selection's order.
+
+    The columns are reordered and each component's sign is chosen as scikit-learn
+    does (largest absolute loading positive), so the result matches a fit on the
+    columns in that order up to rounding.
+
+    Args:
+        payload: Artifact from compute_pca
+        source_ids: Source IDs in the order of the selection
+
+    Returns:
+        Array with one row per component and one column per source
+    """
+    positions = [list(payload["sources"]).index(source_id) for source_id in source_ids]
+    components = payload["components"][:, positions]
+    signs = np.sign(components[np.arange(len(components)), np.argmax(np.abs(components), axis=1)])
+    signs[signs == 0] = 1
+    return components * signs[:, np.newaxis]
+
+
+def compute_seasonal(values: np.ndarray) -> Optional[Dict[str, np.ndarray]]:
+    """
+    Decompose a monthly series into trend, seasonal and residual parts.
+
+    Args:
+        values: Series values in date order, without missing values
+
+    Returns:
+        Dictionary with "observed", "trend", "seasonal" and "resid" arrays, or
+        None with fewer than MIN_SEASONAL_POINTS values
+    """
+    from statsmodels.tsa.seasonal import seasonal_decompose
+
+    values = np.asarray(values, dtype=np.float64)
+    if len(values) < MIN_SEASONAL_POINTS:
+        return None
+
+    decomposition = seasonal_decompose(values, model='additive', period=12)
+    return {"observed": values, "trend": np.asarray(decomposition.trend),
+            "seasonal": np.asarray(decomposition.seasonal), "resid": np.asarray(decomposition.resid)}
+
+
+def compute_fourier(values: np.ndarray) -> Optional[Dict[str, Any]]:
+    """
+    Compute the periodogram of a series, without the DC component.
+
+    Series longer than MAX_FFT_SIZE are downsampled first.
+
+    Args:
+        values: Series values in date order, without missing values
+
+    Returns:
+        Dictionary with "periods" (in samples), "magnitude" and "threshold" (95th
+        percentile of the magnitudes), or None with fewer than MIN_FOURIER_POINTS values
+    """
+    from scipy.fft import fft, fftfreq
+
+    values = np.asarray(values, dtype=np.float64)
+    if len(values) < MIN_FOURIER_POINTS:
+        return None
+    if len(values) > MAX_FFT_SIZE:
+        values = values[::max(1, len(values) // MAX_FFT_SIZE)]
+
+    n = len(values)
+    magnitude = np.abs(fft(values)[:n // 2])[1:]
+    periods = 1 / fftfreq(n)[:n // 2][1:]
+    return {"periods": periods, "magnitude": magnitude, "threshold": np.percentile(magnitude, 95)}
+
+
+def compute_annual(wide: pd.DataFrame) -> Optional[Dict[str, Any]]:
+    """
+    Aggregate the sources by calendar year over the dates of the frame.
+
+    Years covered by the frame but without values sum to 0 and average to NaN,
+    as with resample().
+
+    Args:
+        wide: Frame indexed by month start dates with one column per source ID
+
+    Returns:
+        Dictionary with "sources" (ascending IDs), "index" (datetime64 year-end
+        dates) and "values" (one column per source), or None
+        for an empty frame
+    """
+    sources = sorted(wide.columns)
+    if not sources or wide.empty:
+        return None
+
+    yearly = wide[sources].resample('YE')
+    columns = [yearly[source].sum() if source in ANNUAL_SUM_SOURCES else yearly[source].mean()
+               for source in sources]
+    return {"sources": sources, "index": columns[0].index.to_numpy(),
+            "values": np.column_stack([column.to_numpy() for column in columns])}
+
+
+def compute_keyword_analytics(wide: pd.DataFrame,
+                              source_ids: Optional[Iterable[int]] = None) -> List[Tuple[int, str, Dict[str, Any]]]:
+    """
+    Compute every artifact of one keyword.
+
+    Subset artifacts are also stored under the selections that include sources
+    without data for the keyword; they are computed from the sources that have data,
+    as the dashboard does.
+
+    Args:
+        wide: All sources of the keyword, as returned by
+            DatabaseManager.get_combined_data_for_keyword (columns are source IDs)
+        source_ids: Sources a selection can include (defaults to the columns of wide)
+
+    Returns:
+        List of (source set mask, artifact, payload) tuples
+    """
+    present = sorted(wide.columns)
+    if not present:
+        return []
+
+    artifacts = []
+    for source_id in present:
+        values = wide[source_id].dropna().to_numpy()
+        for name, compute in (("seasonal", compute_seasonal), ("fourier", compute_fourier)):
+            payload = compute(values)
+            if payload is not None:
+                artifacts.append((source_set_mask([source_id]), name, payload))
+
+    computed = {}
+    for subset in source_subsets(source_ids if source_ids is not None else present):
+        columns = tuple(source_id for source_id in subset if source_id in wide.columns)
+        if not columns:
+            continue
+        if columns not in computed:
+            # Same rows as the dashboard's combined dataset for this selection
+            frame = wide[list(columns)].dropna(how='all')
+            computed[columns] = [(name, compute(frame)) for name, compute in
+                                 (("correlation", compute_correlation), ("pca", compute_pca), ("annual", compute_annual))]
+        mask = source_set_mask(subset)
+        artifacts.extend((mask, name, payload) for name, payload in computed[columns] if payload is not None)
+    return artifacts
+
+
+def serialize_payload(payload: Dict[str, Any]) -> bytes:
+    """Encode an artifact payload for the analytics table."""
+    return pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def deserialize_payload(blob: bytes) -> Dict[str, Any]:
+    """Decode an artifact payload read from the analytics table."""
+    return pickle.loads(blob)
+
+
+def build_analytics(db_manager, keywords: Optional[List[str]] = None, force: bool = False) -> Dict[str, Any]:
+    """
+    Precompute the analytics of every keyword that has no current artifacts.
+
+    Data writes drop the artifacts of the keywords they touch, so after an
+    incremental update only those keywords are recomputed.
+
+    Args:
+        db_manager: Writable DatabaseManager of the database to fill
+        keywords: Keywords to consider (defaults to every keyword in the database)
+        force: Recompute keywords that already have current artifacts
+
+    Returns:
+        Dictionary with the number of computed and up-to-date keywords, stored artifacts and seconds
+    """
+    from database import SOURCE_TABLES
+
+    start = time.time()
+    if keywords is None:
+        keywords = db_manager.get_keywords_list()
+    if not force:
+        current = db_manager.get_analytics_keywords()
+        pending = [keyword for keyword in keywords if keyword not in current]
+    else:
+        pending = list(keywords)
+
+    all_sources = sorted(SOURCE_TABLES)
+    artifact_count = 0
+    for keyword in pending:
+        wide, _ = db_manager.get_combined_data_for_keyword(keyword, all_sources)
+        artifacts = compute_keyword_analytics(wide, all_sources)
+        db_manager.store_analytics(keyword, artifacts)
+        artifact_count += len(artifacts)
+
+    return {"computed": len(pending), "up_to_date": len(keywords) - len(pending),
+            "artifacts": artifact_count, "seconds": time.time() - start}
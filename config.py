@@ -81,19 +81,26 @@ class Config:
         defaults = {
             "database.json": {
                 "path": "dashboard_app/data.db",
-                "schema_version": "1.0",
+                "schema_version": "2.2",
                 "tables": {
                     "google_trends": "google_trends",
                     "crossref": "crossref",
                     "google_books": "google_books",
                     "bain_usability": "bain_usability",
                     "bain_satisfaction": "bain_satisfaction",
+                    "keywords": "keywords",
+                    "series_stats": "series_stats",
+                    "analytics": "analytics",
                     "metadata": "metadata"
                 },
                 "connection_pool": {
                     "max_connections": 10,
-                    "timeout": 30.0
-                }
+                    "timeout": 30.0,
+                    "health_check_interval": 60.0,
+                    "mmap_size": 268435456,
+                    "reload_check_interval": 5.0
+                },
+                "metrics": "off"
             },
             "server.json": {
                 "host": "127.0.0.1",
@@ -101,7 +108,17 @@ class Config:
                 "debug": True,
                 "workers": 1,
                 "threaded": True,
-                "processes": 1
+                "processes": 1,
+                "dataset_cache": {
+                    "max_mb": 64
+                },
+                "figure_cache": {
+                    "max_mb": 32
+                },
+                "background_callbacks": {
+                    "enabled": False,
+                    "expire_seconds": 3600
+                }
             },
             "paths.json": {
                 "data_sources": "dbase",
@@ -123,6 +140,10 @@ class Config:
         # Database overrides
         if os.getenv('DASHBOARD_DATABASE_PATH'):
             self.database_config['path'] = os.getenv('DASHBOARD_DATABASE_PATH')
+        if os.getenv('DASHBOARD_DATABASE_READ_ONLY'):
+            self.database_config['read_only'] = os.getenv('DASHBOARD_DATABASE_READ_ONLY').lower() == 'true'
+        if os.getenv('DASHBOARD_DATABASE_METRICS'):
+            self.database_config['metrics'] = os.getenv('DASHBOARD_DATABASE_METRICS')
 
         # Server overrides
         if os.getenv('DASHBOARD_HOST'):
@@ -131,10 +152,22 @@ class Config:
             self.server_config['port'] = int(os.getenv('DASHBOARD_PORT'))
         if os.getenv('DASHBOARD_DEBUG'):
             self.server_config['debug'] = os.getenv('DASHBOARD_DEBUG').lower() == 'true'
+        if os.getenv('DASHBOARD_DATASET_CACHE_MAX_MB'):
+            self.server_config.setdefault('dataset_cache', {})['max_mb'] = float(os.getenv('DASHBOARD_DATASET_CACHE_MAX_MB'))
+        if os.getenv('DASHBOARD_FIGURE_CACHE_MAX_MB'):
+            self.server_config.setdefault('figure_cache', {})['max_mb'] = float(os.getenv('DASHBOARD_FIGURE_CACHE_MAX_MB'))
+        if os.getenv('DASHBOARD_BACKGROUND_CALLBACKS'):
+            self.server_config.setdefault('background_callbacks', {})['enabled'] = os.getenv('DASHBOARD_BACKGROUND_CALLBACKS').lower() == 'true'
 
         # Path overrides
         if os.getenv('DASHBOARD_DATA_SOURCES'):
             self.paths_config['data_sources'] = os.getenv('DASHBOARD_DATA_SOURCES')
+        if os.getenv('DASHBOARD_CACHE_DIR'):
+            self.paths_config['cache'] = os.getenv('DASHBOARD_CACHE_DIR')
+        if os.getenv('DASHBOARD_DATASET_CACHE_DIR'):
+            self.paths_config['dataset_cache'] = os.getenv('DASHBOARD_DATASET_CACHE_DIR')
+        if os.getenv('DASHBOARD_BACKGROUND_CACHE_DIR'):
+            self.paths_config['background_jobs'] = os.getenv('DASHBOARD_BACKGROUND_CACHE_DIR')
         if os.getenv('DASHBOARD_CONFIG_DIR'):
             self.config_dir = Path(os.getenv('DASHBOARD_CONFIG_DIR'))
 
@@ -164,6 +197,45 @@ class Config:
         """Get the full path to the logs directory."""
         return self.project_root / self.paths_config.get("logs", "logs")
 
+    @property
+    def cache_path(self) -> Path:
+        """Get the full path to the on-disk cache directory."""
+        return self.project_root / self.paths_config.get("cache", "cache")
+
+    @property
+    def dataset_cache_path(self) -> Path:
+        """Get the directory of the processed dataset cache shared by dashboard workers."""
+        dataset_cache = self.paths_config.get("dataset_cache")
+        return self.project_root / dataset_cache if dataset_cache else self.cache_path / "datasets"
+
+    @property
+    def dataset_cache_max_bytes(self) -> int:
+        """Get the memory budget of each worker's dataset cache, in bytes."""
+        max_mb = self.server_config.get("dataset_cache", {}).get("max_mb", 64)
+        return int(float(max_mb) * 1024 * 1024)
+
+    @property
+    def figure_cache_max_bytes(self) -> int:
+        """Get the memory budget of each worker's figure cache, in bytes."""
+        max_mb = self.server_config.get("figure_cache", {}).get("max_mb", 32)
+        return int(float(max_mb) * 1024 * 1024)
+
+    @property
+    def background_callbacks_enabled(self) -> bool:
+        """Get whether heavy dashboard callbacks run as background jobs."""
+        return bool(self.server_config.get("background_callbacks", {}).get("enabled", False))
+
+    @property
+    def background_callbacks_expire(self) -> int:
+        """Get how long background callback results are kept, in seconds."""
+        return int(self.server_config.get("background_callbacks", {}).get("expire_seconds", 3600))
+
+    @property
+    def background_cache_path(self) -> Path:
+        """Get the directory of the background job cache shared by dashboard workers."""
+        background_jobs = self.paths_config.get("background_jobs")
+        return self.project_root / background_jobs if background_jobs else self.cache_path / "background_jobs"
+
     @property
     def server_host(self) -> str:
         """Get the server host."""
@@ -10,6 +10,9 @@ Usage:
     python create_database.py --force           # Force full rebuild
     python create_database.py --verbose         # Verbose output
     python create_database.py --status          # Check database status
+    python create_database.py --migrate         # Convert an old database to the current schema
+    python create_database.py --seal            # Update, then seal for read-only serving
+    python create_database.py --force --jobs 4  # Rebuild using 4 worker processes
     python create_database.py --help            # Show help
 
 Environment Variables:
@@ -19,14 +22,16 @@ Environment Variables:
 """
 
 import argparse
+import os
 import sys
 import time
 from pathlib import Path
 from datetime import datetime
 
+from analytics import build_analytics
 from config import get_config
-from database import get_database_manager
-from data_processor import get_data_processor
+from database import SCHEMA_VERSION, DatabaseManager
+from data_processor import DataProcessor
 
 
 def main():
@@ -40,6 +45,10 @@ Examples:
   python create_database.py --force           # Force rebuild
   python create_database.py --verbose         # Verbose output
   python create_database.py --status          # Check status
+  python create_database.py --migrate         # Migrate schema only
+  python create_database.py --seal            # Seal for read-only serving
+  python create_database.py --jobs 0          # Use one worker per CPU
+  python create_database.py --no-cache        # Do not reuse cached CSVs or interpolations
         """
     )
 
@@ -61,6 +70,31 @@ Examples:
         help='Check database status and exit'
     )
 
+    parser.add_argument(
+        '--migrate',
+        action='store_true',
+        help='Migrate an existing database to the current schema and exit'
+    )
+
+    parser.add_argument(
+        '--seal',
+        action='store_true',
+        help='Seal the database after updating so the dashboard serves it read-only'
+    )
+
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=1,
+        help='Worker processes for loading and interpolating data (0 = one per CPU, default: 1)'
+    )
+
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Do not read or write parsed CSVs or interpolation results in the on-disk cache'
+    )
+
     parser.add_argument(
         '--config-dir',
         type=str,
@@ -68,6 +102,7 @@ Examples:
     )
 
     args = parser.parse_args()
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
 
     # Override config directory if specified
     if args.config_dir:
@@ -78,8 +113,10 @@ Examples:
     try:
         # Initialize components
         config_obj = get_config()
-        db_manager = get_database_manager()
-        data_processor = get_data_processor()
+        # The builder always opens the database read-write, even when it is sealed for serving
+        db_manager = DatabaseManager(read_only=False)
+        # Interpolation results are kept on disk so later runs can reuse them
+        data_processor = DataProcessor(disk_cache=not args.no_cache)
 
         if args.status:
             # Show database status
@@ -87,40 +124,61 @@ Examples:
             return
 
         # Check if database needs updating
-        needs_update = check_if_update_needed(db_manager, config_obj, args.force, args.verbose)
+        needs_update = check_if_update_needed(db_manager, data_processor, args.force, args.verbose)
+        needs_migration = db_manager.needs_migration() and not args.force
+
+        # Older databases are converted in place before anything is written to them
+        if needs_migration:
+            if db_manager.is_sealed():
+                print("Unsealing database for migration...")
+                db_manager.unseal()
+            migrate_database(db_manager)
+        elif args.migrate:
+            print("Database schema is already up to date.")
+
+        if args.migrate:
+            return
 
         if not needs_update and not args.force:
             print("Database is up to date. Use --force to rebuild anyway.")
+            if not db_manager.is_sealed():
+                build_analytics_stage(db_manager)
+            if db_manager.get_snapshot() is None:
+                write_data_snapshot(db_manager)
+            if args.seal and not db_manager.is_sealed():
+                seal_database(db_manager)
             return
 
         # Create/update database
         print("Starting database creation/update process...")
         start_time = time.time()
 
-        # Create schema if needed
-        if not db_manager.database_exists():
-            print("Creating database schema...")
-            db_manager.create_schema()
-            print("Schema created successfully.")
-        elif args.force:
-            print("Forcing schema recreation...")
-            # Drop and recreate tables
-            for table in config_obj.database_config.get("tables", {}).keys():
-                db_manager.drop_table(table)
-            db_manager.create_schema()
-            print("Schema recreated successfully.")
-
-        # Process all data
-        print("Processing data..." if not args.verbose else "Processing data (verbose mode)...")
-        stats = data_processor.process_all_data(force=args.force, verbose=args.verbose)
+        if args.force or not db_manager.database_exists():
+            # Full builds are bulk loaded into a side file that replaces the database at the end
+            print("Building new database (bulk load)..." if not args.verbose else "Building new database (bulk load, verbose mode)...")
+            stats = build_database(db_manager, data_processor, verbose=args.verbose, jobs=jobs, seal=args.seal)
+        else:
+            # Dashboard workers may be serving the database, so changed data is applied to a copy
+            print("Updating a copy of the database..." if not args.verbose else "Updating a copy of the database (verbose mode)...")
+            stats = update_database_copy(db_manager, data_processor, verbose=args.verbose, jobs=jobs, seal=args.seal)
 
         # Show results
         elapsed_time = time.time() - start_time
         print("\nDatabase update completed!")
         print(f"Time elapsed: {elapsed_time:.2f} seconds")
         print(f"Records processed: {stats['processed']}")
-        print(f"Records skipped: {stats['skipped']}")
+        print(f"Records deleted: {stats['deleted']}")
+        print(f"Slices unchanged: {stats['unchanged']}")
+        print(f"Slices skipped: {stats['skipped']}")
         print(f"Errors encountered: {stats['errors']}")
+        print(f"Load rate: {stats['rows_per_second']:,.0f} rows/second "
+              f"({stats['processed']} rows in {stats['load_seconds']:.2f} seconds)")
+        cache_stats = data_processor.get_cache_stats()
+        print(f"Interpolation cache: {cache_stats['interpolation_hits']} hits, "
+              f"{cache_stats['interpolation_misses']} misses "
+              f"({cache_stats['interpolation_disk_hits']} read from disk)")
+        print(f"Raw data cache: {cache_stats['raw_cache_hits']} files reused, "
+              f"{cache_stats['raw_files_parsed']} parsed")
 
         # Show final status
         show_database_status(db_manager, config_obj)
@@ -133,13 +191,16 @@ Examples:
         sys.exit(1)
 
 
-def check_if_update_needed(db_manager, config_obj, force=False, verbose=False):
+def check_if_update_needed(db_manager, data_processor, force=False, verbose=False):
     """
     Check if database update is needed.
 
+    Input files are compared against the fingerprints (size, mtime and content
+    hash) recorded in the database metadata by the previous run.
+
     Args:
         db_manager: Database manager instance
-        config_obj: Configuration instance
+        data_processor: Data processor instance
         force: Force update flag
         verbose: Verbose output flag
 
@@ -156,27 +217,14 @@ def check_if_update_needed(db_manager, config_obj, force=False, verbose=False):
             print("Database does not exist.")
         return True
 
-    # Check file modification times
     try:
-        db_mtime = db_manager.db_path.stat().st_mtime
-
-        # Check data source files
-        data_sources_path = config_obj.data_sources_path
-        if data_sources_path.exists():
-            for csv_file in data_sources_path.glob("*.csv"):
-                if csv_file.stat().st_mtime > db_mtime:
-                    if verbose:
-                        print(f"Data source file {csv_file.name} is newer than database.")
-                    return True
-
-        # Check interpolation profile files
-        profiles_path = config_obj.interpolation_profiles_path
-        if profiles_path.exists():
-            for csv_file in profiles_path.glob("*.csv"):
-                if csv_file.stat().st_mtime > db_mtime:
-                    if verbose:
-                        print(f"Interpolation profile {csv_file.name} is newer than database.")
-                    return True
+        changed_slices, _ = data_processor.find_changed_slices(db_manager)
+
+        if changed_slices:
+            if verbose:
+                for keyword, source_id, filename in changed_slices:
+                    print(f"Input for {keyword} (source {source_id}) changed: {filename}")
+            return True
 
         if verbose:
             print("Database is up to date.")
@@ -184,10 +232,172 @@ def check_if_update_needed(db_manager, config_obj, force=False, verbose=False):
 
     except Exception as e:
         if verbose:
-            print(f"Error checking file timestamps: {e}")
+            print(f"Error checking file fingerprints: {e}")
         return True
 
 
+def side_file_path(db_manager):
+    """
+    Get the path of the side file (data.db.new) that updates are built in, removing leftovers.
+
+    Args:
+        db_manager: Database manager for the target database
+
+    Returns:
+        Path of the side file
+    """
+    new_path = db_manager.db_path.with_name(db_manager.db_path.name + ".new")
+    for stale in (new_path, Path(f"{new_path}-journal"), Path(f"{new_path}-wal"), Path(f"{new_path}-shm")):
+        if stale.exists():
+            stale.unlink()
+    return new_path
+
+
+def build_database(db_manager, data_processor, verbose=False, jobs=1, seal=False):
+    """
+    Build the whole database in a side file and atomically swap it into place.
+
+    The side file is loaded in a single transaction with synchronous=OFF and an
+    in-memory journal; if the build fails, the existing database is left untouched.
+
+    Args:
+        db_manager: Database manager for the target database
+        data_processor: Data processor instance
+        verbose: Verbose output flag
+        jobs: Number of worker processes for loading and interpolation
+        seal: Seal the new database before it is published
+
+    Returns:
+        Processing statistics from the data processor
+    """
+    builder = DatabaseManager(db_path=side_file_path(db_manager), read_only=False)
+    try:
+        builder.create_schema(defer_indexes=True)
+        with builder.bulk_load():
+            stats = data_processor.process_all_data(force=True, verbose=verbose, jobs=jobs, db=builder)
+        builder.create_indexes()
+    finally:
+        builder.close()
+
+    publish_database(db_manager, builder, seal=seal)
+    return stats
+
+
+def update_database_copy(db_manager, data_processor, verbose=False, jobs=1, seal=False):
+    """
+    Apply an incremental update to an online backup of the database and swap it into place.
+
+    Dashboard workers never see a half-updated database, and sealed files, which
+    they read through immutable connections, never change while being served. The
+    write lock of the database is held from the backup to the swap, so no other
+    writer can make changes that the swap would discard.
+
+    Args:
+        db_manager: Database manager for the target database
+        data_processor: Data processor instance
+        verbose: Verbose output flag
+        jobs: Number of worker processes for loading and interpolation
+        seal: Seal the updated database before it is published
+
+    Returns:
+        Processing statistics from the data processor
+    """
+    work_path = side_file_path(db_manager)
+    with db_manager.write_lock():
+        db_manager.backup_database(work_path)
+
+        work_manager = DatabaseManager(db_path=work_path, read_only=False)
+        try:
+            work_manager.unseal()
+            stats = data_processor.process_all_data(force=False, verbose=verbose, jobs=jobs, db=work_manager)
+        finally:
+            work_manager.close()
+
+        publish_database(db_manager, work_manager, seal=seal)
+    return stats
+
+
+def publish_database(db_manager, work_manager, seal=False):
+    """
+    Precompute analytics in a finished side file, stamp it with a new data_version,
+    write its snapshot and swap it in.
+
+    Running dashboard workers notice the new file on their next reload check and
+    reopen their connections; requests in flight finish on the old file.
+
+    Args:
+        db_manager: Database manager for the target database
+        work_manager: Database manager for the finished side file
+        seal: Seal the side file before it is published
+    """
+    build_analytics_stage(work_manager)
+    version = work_manager.bump_data_version()
+    write_data_snapshot(work_manager, db_manager.snapshot_path)
+    if seal:
+        work_manager.seal()
+    work_manager.close()
+
+    db_manager.replace_database_file(work_manager.db_path)
+    print(f"Published data version {version} to {db_manager.db_path}" + (" (sealed)" if seal else ""))
+
+
+def migrate_database(db_manager):
+    """
+    Migrate the database to the current schema, reporting the size change.
+
+    Args:
+        db_manager: Database manager instance
+    """
+    print(f"Migrating database schema {db_manager.get_schema_version()} -> {SCHEMA_VERSION}...")
+    size_before = db_manager.get_database_size()
+    start_time = time.time()
+
+    migrated = db_manager.migrate_schema()
+
+    for table, rows in migrated.items():
+        print(f"  {table}: {rows} rows")
+    print(f"Migration completed in {time.time() - start_time:.2f} seconds "
+          f"({size_before} -> {db_manager.get_database_size()} bytes)")
+
+
+def build_analytics_stage(db_manager):
+    """
+    Precompute the dashboard analytics of every keyword whose data changed.
+
+    Args:
+        db_manager: Database manager of the (writable) database to fill
+    """
+    result = build_analytics(db_manager)
+    print(f"Analytics: {result['computed']} keywords computed ({result['artifacts']} artifacts), "
+          f"{result['up_to_date']} up to date in {result['seconds']:.2f} seconds")
+
+
+def write_data_snapshot(db_manager, directory=None):
+    """
+    Write the memory-mapped columnar snapshot used by the dashboard workers.
+
+    Args:
+        db_manager: Database manager instance
+        directory: Snapshot directory (defaults to the database's snapshot path)
+    """
+    directory = directory or db_manager.snapshot_path
+    result = db_manager.write_snapshot(directory)
+    keywords, sources, months = result["shape"]
+    print(f"Data snapshot written to {directory} "
+          f"({keywords} keywords x {sources} sources x {months} months, {result['bytes']} bytes)")
+
+
+def seal_database(db_manager):
+    """
+    Seal the database so dashboard workers open it in immutable read-only mode.
+
+    Args:
+        db_manager: Database manager instance
+    """
+    db_manager.seal()
+    print(f"Database sealed for read-only serving: {db_manager.db_path}")
+
+
 def show_database_status(db_manager, config_obj):
     """
     Display database status information.
@@ -213,8 +423,13 @@ def show_database_status(db_manager, config_obj):
     metadata = db_manager.get_metadata()
     if metadata:
         print("\nMetadata:")
+        fingerprint_count = 0
         for key, value in metadata.items():
+            if key.startswith("fingerprint:"):
+                fingerprint_count += 1
+                continue
             print(f"  {key}: {value}")
+        print(f"  input file fingerprints: {fingerprint_count}")
 
     # Show table statistics
     print("\nTable Statistics:")
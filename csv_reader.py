@@ -13,6 +13,8 @@ import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 
+from raw_data import get_raw_data_loader
+
 # Directory containing the CSV files
 CSV_DIR = "pub-assets"
 
@@ -37,15 +39,17 @@ def read_csv_file(filename, directory=CSV_DIR):
         pandas DataFrame with the CSV data
     """
     file_path = os.path.join(directory, filename)
+    # Parsed files are reused from the shared raw data cache while unchanged
+    loader = get_raw_data_loader()
     
     try:
         # Read the file with UTF-8 encoding and semicolon delimiter
-        df = pd.read_csv(file_path, sep=';', encoding='utf-8')
+        df = loader.read_csv(file_path, sep=';', encoding='utf-8')
         print(f"Successfully read {filename}")
         return df
     except UnicodeDecodeError:
         # Fallback to Latin-1 encoding if UTF-8 fails
-        df = pd.read_csv(file_path, sep=';', encoding='latin1')
+        df = loader.read_csv(file_path, sep=';', encoding='latin1')
         print(f"Read {filename} using Latin-1 encoding")
         return df
     except Exception as e:
@@ -1,5 +1,5 @@
 import dash
-from dash import html, dcc, dash_table
+from dash import html, dcc, dash_table, Patch, no_update
 import dash_bootstrap_components as dbc
 from dash.dependencies import Input, Output, State, ALL
 import pandas as pd
@@ -34,6 +34,11 @@ import os
 sys.path.insert(0, os.path.dirname(__file__))
 from tools import tool_file_dic, get_tool_options, translate_tool_key, get_tool_name
 from database import get_database_manager
+from dataset_service import get_dataset_service, slice_months
+from figure_cache import figure_cache_key, get_figure_cache
+from background_jobs import create_background_manager, heavy_callback, report_step, section_progress_bar
+from config import get_config
+from analytics import compute_correlation, compute_fourier, compute_pca, compute_seasonal, pca_components_for
 # Import centralized source mapping
 from fix_source_mapping import (
     map_display_names_to_source_ids,
@@ -86,7 +91,14 @@ except ImportError as e:
 # Get database manager instance
 db_manager = get_database_manager()
 
-# Notes and DOI data is now loaded from the database
+# Map the columnar snapshot now so preloaded gunicorn workers share it after fork
+db_manager.get_snapshot()
+
+# Load the notes and DOI index once, with the notes already translated for each language
+for notes_language in get_available_languages():
+    if notes_language != 'es':
+        db_manager.get_notes_index().add_translation(
+            notes_language, lambda text, lang=notes_language: translate_database_content(text, lang))
 
 def parse_text_with_links(text):
     """Parse text and return formatted components"""
@@ -112,30 +124,45 @@ def parse_text_with_links(text):
     # Use dcc.Markdown to render the markdown formatting
     return [dcc.Markdown(cleaned_text, style={'fontSize': '12px'})]
 
-# Global cache for processed datasets
-_processed_data_cache = {}
-_cache_max_size = 10
-
-def get_cache_key(keyword, sources):
-    """Generate cache key for processed data"""
-    return f"{keyword}_{'_'.join(map(str, sorted(sources)))}"
-
-def get_cached_processed_data(keyword, selected_sources):
-    """Get cached processed data or None if not cached"""
-    cache_key = get_cache_key(keyword, selected_sources)
-    return _processed_data_cache.get(cache_key)
-
-def cache_processed_data(keyword, selected_sources, data):
-    """Cache processed data with LRU eviction"""
-    global _processed_data_cache
-
-    cache_key = get_cache_key(keyword, selected_sources)
-    _processed_data_cache[cache_key] = data
+# Combined datasets of the selections, built once per data_version and shared by every callback
+# (per-worker LRU in front of a cache shared by all gunicorn workers)
+dataset_service = get_dataset_service()
+dataset_cache = dataset_service.cache
+
+# Figures are built once without a language and localized per request
+figure_cache = get_figure_cache()
+
+# Heavy callbacks run as background jobs when enabled, so they do not hold a sync gunicorn worker
+background_manager = None
+if get_config().background_callbacks_enabled:
+    background_manager = create_background_manager(get_config().background_cache_path,
+                                                   data_version=db_manager.get_data_version,
+                                                   expire=get_config().background_callbacks_expire)
+
+# A new selection or language re-renders the sections, so it cancels their running jobs
+SELECTION_INPUTS = [Input('keyword-dropdown', 'value'),
+                    Input('data-sources-store-v2', 'data'),
+                    Input('language-store', 'data')]
+
+def get_localized_figure(keyword, source_ids, view, language, build):
+    """Get a figure in the given language, calling build(language) with the placeholder language on a miss"""
+    key = figure_cache_key(keyword, source_ids, view, db_manager.get_data_version())
+    return figure_cache.get_figure(key, build, language)
+
+def get_source_names(source_ids, language):
+    """Display names of the given sources in a language"""
+    return [translate_source_name(dbase_options[src_id], language) for src_id in source_ids]
+
+# Sections below the first chart are rendered once scrolled into view: the page script sets the
+# section's visibility store to True, which triggers the callbacks filling that section
+def section_visibility_store(section):
+    """Visibility flag of a lazily rendered section, set by the page script"""
+    return dcc.Store(id={'type': 'section-visible', 'section': section}, data=False)
+
+def section_visible(section):
+    """Input of a section callback that fires when the section is scrolled into view"""
+    return Input({'type': 'section-visible', 'section': section}, 'data')
 
-    # Evict oldest if cache is full
-    if len(_processed_data_cache) > _cache_max_size:
-        oldest_key = next(iter(_processed_data_cache))
-        del _processed_data_cache[oldest_key]
 def get_all_keywords():
     """Extract all keywords from tool_file_dic"""
     all_keywords = []
@@ -152,63 +179,57 @@ def get_cache_stats():
         total_records = sum(stats.get('row_count', 0) for stats in table_stats.values() if 'error' not in stats)
         total_keywords = sum(stats.get('keyword_count', 0) for stats in table_stats.values() if 'error' not in stats)
 
+        cache_stats = dataset_service.stats()
+
         return {
-            'processed_data_cache': len(_processed_data_cache),
-            'cache_max_size': _cache_max_size,
+            'processed_data_cache': cache_stats['entries'],
+            'cache_max_size': cache_stats['max_bytes'],
             'database_records': total_records,
             'database_keywords': total_keywords,
             'database_size_mb': round(db_manager.get_database_size() / 1024 / 1024, 2),
-            'cache_hit_rate': 0  # Could be tracked with more complex caching
+            'cache_hit_rate': cache_stats['hit_rate'],
+            'dataset_cache': cache_stats,
+            'figure_cache': figure_cache.stats(),
+            'connection_pool': db_manager.get_pool_stats()
         }
     except Exception as e:
         print(f"Error getting cache stats: {e}")
         return {
-            'processed_data_cache': 0,
-            'cache_max_size': _cache_max_size,
+            'processed_data_cache': len(dataset_cache),
+            'cache_max_size': dataset_cache.max_bytes,
             'database_records': 0,
             'database_keywords': 0,
             'database_size_mb': 0,
-            'cache_hit_rate': 0
+            'cache_hit_rate': dataset_cache.stats()['hit_rate']
         }
 
 
-def create_combined_dataset(datasets_norm, selected_sources, dbase_options):
-    """Create combined dataset with common date range"""
-    combined_data = pd.DataFrame()
-
-    for source in selected_sources:
-        if source in datasets_norm:
-            df = datasets_norm[source]
-            column_name = dbase_options[source]
-            combined_data[column_name] = df.iloc[:, 0]  # Use first column
-
-    return combined_data
-
-def create_combined_dataset2(datasets_norm, selected_sources, dbase_options):
-    """Create combined dataset with all dates from all sources"""
-    combined_dataset2 = pd.DataFrame()
+# Database column name -> source ID, for looking up precomputed analytics
+SOURCE_ID_BY_COLUMN = {name: source_id for source_id, name in dbase_options.items()}
 
-    # Get all unique dates from all datasets
-    all_dates = set()
-    for source in selected_sources:
-        if source in datasets_norm and not datasets_norm[source].empty:
-            all_dates.update(datasets_norm[source].index)
+def get_precomputed_analytics(keyword, source_ids, artifact):
+    """
+    Get an analytics artifact precomputed by create_database.py.
 
-    # Sort dates
-    all_dates = sorted(list(all_dates))
+    Args:
+        keyword: Selected tool
+        source_ids: Source IDs of the selection, in any order
+        artifact: Artifact name ('correlation', 'pca', 'seasonal', 'fourier' or 'annual')
 
-    # Create DataFrame with all dates
-    combined_dataset2 = pd.DataFrame(index=all_dates)
-
-    # Add data from each source - use source name directly as column name
-    for source in selected_sources:
-        if source in datasets_norm and not datasets_norm[source].empty:
-            source_name = dbase_options.get(source, source)
-            source_data = datasets_norm[source].reindex(all_dates)
-            # Use just the source name as the column name (not source_name_col)
-            combined_dataset2[source_name] = source_data.iloc[:, 0]
+    Returns:
+        Artifact payload (see analytics.py), or None to compute it live
+    """
+    if not keyword or not source_ids:
+        return None
+    try:
+        return db_manager.get_analytics(keyword, source_ids, artifact)
+    except Exception as e:
+        print(f"Warning: Could not read precomputed {artifact} for {keyword}: {e}")
+        return None
 
-    return combined_dataset2
+def select_analytics_sources(payload, source_ids):
+    """Positions of the given source IDs in an artifact stored in canonical source order."""
+    return [list(payload['sources']).index(source_id) for source_id in source_ids]
 
 # Initialize the Dash app
 app = dash.Dash(
@@ -259,6 +280,32 @@ def health_check():
         error_status = {'status': 'unhealthy', 'error': str(e)}
         return json.dumps(error_status), 500, {'Content-Type': 'application/json'}
 
+# Database query metrics (enable with DASHBOARD_DATABASE_METRICS=memory or prometheus)
+@server.route('/metrics')
+def query_metrics():
+    """Query latency metrics of this worker, in Prometheus text format or as JSON"""
+    import json
+
+    render = getattr(db_manager.metrics, 'render', None)
+    if render is not None:
+        return render(), 200, {'Content-Type': 'text/plain; version=0.0.4; charset=utf-8'}
+
+    stats = db_manager.get_query_stats()
+    if stats is None:
+        return json.dumps({'error': 'query metrics are disabled'}), 404, {'Content-Type': 'application/json'}
+    stats['pool'] = db_manager.get_pool_stats()
+    return json.dumps(stats), 200, {'Content-Type': 'application/json'}
+
+# Dataset cache accounting, to size the per-worker memory budget
+@server.route('/cache-stats')
+def cache_stats():
+    """Dataset and figure cache statistics of the worker serving the request, as JSON"""
+    import json
+
+    stats = dataset_service.stats()
+    stats['figure_cache'] = figure_cache.stats()
+    return json.dumps(stats), 200, {'Content-Type': 'application/json'}
+
 # Add basic security headers for production
 @server.after_request
 def add_security_headers(response):
@@ -401,6 +448,42 @@ app.index_string = '''
 
             // Simple manual control for credits - auto-collapse handled by Dash callback
             // when both keyword and sources are selected
+
+            // Lazy sections: set a section's visibility store once it is scrolled into view.
+            // data-render changes on every render of the main content, so reused nodes are observed again.
+            function markSectionVisible(section) {
+                window.dash_clientside.set_props({type: 'section-visible', section: section.dataset.section}, {data: true});
+            }
+
+            const sectionObserver = 'IntersectionObserver' in window ? new IntersectionObserver(function(entries, observer) {
+                entries.forEach(function(entry) {
+                    if (entry.isIntersecting) {
+                        observer.unobserve(entry.target);
+                        markSectionVisible(entry.target);
+                    }
+                });
+            }, { rootMargin: '200px 0px' }) : null;
+
+            function observeLazySections() {
+                document.querySelectorAll('.lazy-section').forEach(function(section) {
+                    if (section.dataset.observedRender === section.dataset.render) {
+                        return;
+                    }
+                    section.dataset.observedRender = section.dataset.render;
+                    if (sectionObserver) {
+                        sectionObserver.unobserve(section);
+                        sectionObserver.observe(section);
+                    } else {
+                        markSectionVisible(section);
+                    }
+                });
+            }
+
+            document.addEventListener('DOMContentLoaded', function() {
+                new MutationObserver(observeLazySections).observe(document.body, {
+                    childList: true, subtree: true, attributes: true, attributeFilter: ['data-render']
+                });
+            });
         </script>
     </head>
     <body>
@@ -1149,7 +1232,7 @@ def toggle_notes_modal(icon_clicks, close_click, is_open, selected_tool, icon_id
         print(f"Debug: source='{clicked_source}', mapped_source='{mapped_source}', selected_tool='{selected_tool}'")
 
         # Get notes from the new database
-        tool_notes = db_manager.get_tool_notes_and_doi(selected_tool, mapped_source)
+        tool_notes = db_manager.get_tool_notes_and_doi(selected_tool, mapped_source, language)
         print(f"Debug: tool_notes={tool_notes}")
         print(f"Debug: Query parameters - tool='{selected_tool}', source='{mapped_source}'")
         
@@ -1157,9 +1240,6 @@ def toggle_notes_modal(icon_clicks, close_click, is_open, selected_tool, icon_id
             notes = tool_notes[0].get('notes', get_text('no_notes', language))
             links = tool_notes[0].get('links', '')
             doi = tool_notes[0].get('doi', '')
-            # Translate database content if not in Spanish
-            if language != 'es':
-                notes = translate_database_content(notes, language)
             print(f"Debug: Found notes='{notes[:50]}...', links='{links}', doi='{doi}'")
         else:
             notes = get_text('no_notes', language)
@@ -1206,52 +1286,15 @@ def update_main_content(selected_sources, selected_keyword, language):
     if not selected_keyword or not selected_sources:
         return html.Div(get_text('please_select_tool_and_sources', language)), credits_open
 
-    datasets_norm = None  # Initialize to avoid scoping issues
     try:
-        # Check cache first
-        cached_data = get_cached_processed_data(selected_keyword, selected_sources)
-
-        if cached_data:
-            combined_dataset, combined_dataset_fecha_formatted, selected_source_names = cached_data
-        else:
-            # Map display names to source IDs
-            selected_source_ids = map_display_names_to_source_ids(selected_sources)
-
-            print(f"DEBUG: Getting data for keyword='{selected_keyword}', sources={selected_sources}")
-            print(f"DEBUG: Converted to source IDs: {selected_source_ids}")
+        # Built once per selection and data version, shared with the analysis callbacks
+        combined_dataset = dataset_service.get_combined(selected_keyword, selected_source_ids)
+        if combined_dataset.empty:
+            print(f"DEBUG: No data retrieved for keyword='{selected_keyword}'")
+            translated_tool = get_tool_name(selected_keyword, language)
+            return html.Div(get_text('no_data_available', language, keyword=translated_tool)), credits_open
 
-            datasets_norm, sl_sc = db_manager.get_data_for_keyword(selected_keyword, selected_source_ids)
-            print(f"DEBUG: Retrieved datasets_norm keys: {list(datasets_norm.keys()) if datasets_norm else 'None'}")
-            print(f"DEBUG: Retrieved sl_sc: {sl_sc}")
-            
-            if not datasets_norm:
-                print(f"DEBUG: No data retrieved for keyword='{selected_keyword}'")
-                translated_tool = get_tool_name(selected_keyword, language)
-                return html.Div(get_text('no_data_available', language, keyword=translated_tool)), credits_open
-                
-            combined_dataset = create_combined_dataset2(datasets_norm=datasets_norm, selected_sources=sl_sc, dbase_options=dbase_options)
-            print(f"DEBUG: Combined dataset shape: {combined_dataset.shape if not combined_dataset.empty else 'Empty'}")
-
-            # Process data
-            combined_dataset = combined_dataset.reset_index()
-            date_column = combined_dataset.columns[0]
-            combined_dataset[date_column] = pd.to_datetime(combined_dataset[date_column])
-            combined_dataset = combined_dataset.rename(columns={date_column: 'Fecha'})
-            # Keep Fecha as datetime for calculations, format only for display in table
-            combined_dataset_fecha_formatted = combined_dataset.copy()
-            combined_dataset_fecha_formatted['Fecha'] = combined_dataset_fecha_formatted['Fecha'].dt.strftime('%Y-%m-%d')
-
-            # No longer need Bain/Crossref alignment since we preserve individual date ranges
-
-            # Filter out rows where ALL selected sources are NaN (preserve partial data)
-            data_columns = [dbase_options[src_id] for src_id in selected_source_ids]
-            combined_dataset = combined_dataset.dropna(subset=data_columns, how='all')
-
-            selected_source_names = [translate_source_name(dbase_options[src_id], language) for src_id in selected_source_ids]
-
-            # Cache the processed data
-            cache_processed_data(selected_keyword, selected_sources,
-                               (combined_dataset, combined_dataset_fecha_formatted, selected_source_names))
+        selected_source_names = [translate_source_name(dbase_options[src_id], language) for src_id in selected_source_ids]
 
         # Create content sections
         content = []
@@ -1264,9 +1307,9 @@ def update_main_content(selected_sources, selected_keyword, language):
 
         # 1. Temporal Analysis 2D
         try:
-            print(f"DEBUG: Creating initial temporal 2D figure for main content")
-            temporal_2d_fig = create_temporal_2d_figure(combined_dataset, selected_source_names, language)
-            print(f"DEBUG: Initial temporal 2D figure created with {len(temporal_2d_fig.data) if hasattr(temporal_2d_fig, 'data') else 0} traces")
+            temporal_2d_fig = get_localized_figure(
+                selected_keyword, selected_source_ids, 'temporal_2d', language,
+                lambda lang: create_temporal_2d_figure(combined_dataset, get_source_names(selected_source_ids, lang), lang))
         except Exception as e:
             print(f"DEBUG: Error creating initial temporal 2D figure: {e}")
             import traceback
@@ -1317,19 +1360,12 @@ def update_main_content(selected_sources, selected_keyword, language):
             html.Div(id='temporal-2d-slider-container', style={'display': 'none'})  # Hidden container for slider updates
         ], id='section-temporal-2d', className='section-anchor'))
 
-        # 2. Mean Analysis
-        try:
-            mean_fig = create_mean_analysis_figure(combined_dataset, selected_source_names, language)
-            print(f"DEBUG: Created mean analysis figure with {len(mean_fig.data) if hasattr(mean_fig, 'data') else 0} traces")
-            print(f"DEBUG: Mean figure data: {mean_fig.data[:2] if hasattr(mean_fig, 'data') and len(mean_fig.data) > 0 else 'No data'}")
-        except Exception as e:
-            print(f"ERROR: Failed to create mean analysis figure: {e}")
-            import traceback
-            traceback.print_exc()
-            mean_fig = go.Figure()
-            mean_fig.add_annotation(text=f"Error creating mean analysis graph: {str(e)}", showarrow=False)
+        # The other sections are rendered by their own callbacks once they are scrolled into view
+        render_token = f"{time.time():.6f}"
 
+        # 2. Mean Analysis
         content.append(html.Div([
+            section_visibility_store('mean'),
             html.Div([
                 html.H6(get_text('mean_analysis', language), style={'fontSize': '16px', 'marginBottom': '15px', 'color': 'white'})
             ], style={
@@ -1340,17 +1376,23 @@ def update_main_content(selected_sources, selected_keyword, language):
                 'boxShadow': '0 2px 4px rgba(0,0,0,0.1)',
                 'border': '1px solid #34495e'
             }),
-            dcc.Graph(
-                id='mean-analysis-graph',
-                figure=mean_fig,
-                style={'height': '600px', 'marginBottom': '30px', 'minHeight': '600px'},
-                config={'displaylogo': False, 'responsive': True}
+            dcc.Loading(
+                type="circle",
+                children=[
+                    dcc.Graph(
+                        id='mean-analysis-graph',
+                        style={'height': '600px', 'marginBottom': '30px', 'minHeight': '600px'},
+                        config={'displaylogo': False, 'responsive': True}
+                    )
+                ]
             )
-        ], id='section-mean-analysis', className='section-anchor', style={'marginBottom': '40px'}))
+        ], id='section-mean-analysis', className='section-anchor lazy-section', style={'marginBottom': '40px'},
+           **{'data-section': 'mean', 'data-render': render_token}))
 
         # 3. Temporal Analysis 3D (if 2+ sources)
         if len(selected_sources) >= 2:
             content.append(html.Div([
+                section_visibility_store('temporal-3d'),
                 html.Div([
                     html.H6(get_text('temporal_analysis_3d', language), style={'fontSize': '16px', 'marginBottom': '15px', 'color': 'white'})
                 ], style={
@@ -1401,10 +1443,12 @@ def update_main_content(selected_sources, selected_keyword, language):
                         ])
                     ], style={'display': 'inline-block', 'verticalAlign': 'top', 'width': '220px'})
                 ], style={'whiteSpace': 'nowrap', 'height': '600px'})
-            ], id='section-temporal-3d', className='section-anchor'))
+            ], id='section-temporal-3d', className='section-anchor lazy-section',
+               **{'data-section': 'temporal-3d', 'data-render': render_token}))
 
         # 4. Seasonal Analysis (Lazy loaded)
         content.append(html.Div([
+            section_visibility_store('seasonal'),
             html.Div([
                 html.H6(get_text('seasonal_analysis', language), style={'fontSize': '16px', 'marginBottom': '15px', 'color': 'white'})
             ], style={
@@ -1424,6 +1468,7 @@ def update_main_content(selected_sources, selected_keyword, language):
                     clearable=True,
                     style={'width': '100%', 'marginBottom': '10px'}
                 ),
+                section_progress_bar('seasonal'),
                 dcc.Loading(
                     id="loading-seasonal",
                     type="circle",
@@ -1436,10 +1481,12 @@ def update_main_content(selected_sources, selected_keyword, language):
                     ]
                 )
             ])
-        ], id='section-seasonal', className='section-anchor'))
+        ], id='section-seasonal', className='section-anchor lazy-section',
+           **{'data-section': 'seasonal', 'data-render': render_token}))
 
         # 5. Fourier Analysis (Lazy loaded)
         content.append(html.Div([
+            section_visibility_store('fourier'),
             html.Div([
                 html.H6(get_text('fourier_analysis', language), style={'fontSize': '16px', 'marginBottom': '15px', 'color': 'white'})
             ], style={
@@ -1459,6 +1506,7 @@ def update_main_content(selected_sources, selected_keyword, language):
                     clearable=True,
                     style={'width': '100%', 'marginBottom': '10px'}
                 ),
+                section_progress_bar('fourier'),
                 dcc.Loading(
                     id="loading-fourier",
                     type="circle",
@@ -1471,11 +1519,13 @@ def update_main_content(selected_sources, selected_keyword, language):
                     ]
                 )
             ])
-        ], id='section-fourier', className='section-anchor'))
+        ], id='section-fourier', className='section-anchor lazy-section',
+           **{'data-section': 'fourier', 'data-render': render_token}))
 
         # 6. Correlation Heatmap
         if len(selected_sources) >= 2:
             content.append(html.Div([
+                section_visibility_store('correlation'),
                 html.Div([
                     html.H6(get_text('correlation_heatmap', language), style={'fontSize': '16px', 'marginBottom': '15px', 'color': 'white'})
                 ], style={
@@ -1486,17 +1536,23 @@ def update_main_content(selected_sources, selected_keyword, language):
                     'boxShadow': '0 2px 4px rgba(0,0,0,0.1)',
                     'border': '1px solid #34495e'
                 }),
-                dcc.Graph(
-                    id='correlation-heatmap',
-                    figure=create_correlation_heatmap(combined_dataset, selected_source_names, language),
-                    style={'height': '400px'},
-                    config={'displaylogo': False, 'responsive': True}
+                dcc.Loading(
+                    type="circle",
+                    children=[
+                        dcc.Graph(
+                            id='correlation-heatmap',
+                            style={'height': '400px'},
+                            config={'displaylogo': False, 'responsive': True}
+                        )
+                    ]
                 )
-            ], id='section-correlation', className='section-anchor'))
+            ], id='section-correlation', className='section-anchor lazy-section',
+               **{'data-section': 'correlation', 'data-render': render_token}))
 
         # 7. Regression Analysis (clickable from heatmap)
         if len(selected_sources) >= 2:
             content.append(html.Div([
+                section_visibility_store('regression'),
                 html.Div([
                     html.H6(get_text('regression_analysis', language), style={'fontSize': '16px', 'marginBottom': '15px', 'color': 'white'})
                 ], style={
@@ -1509,6 +1565,7 @@ def update_main_content(selected_sources, selected_keyword, language):
                 }),
                 html.Div([
                     html.P(get_text('click_heatmap', language), style={'fontSize': '12px'}),
+                    section_progress_bar('regression'),
                     html.Div([
                         dcc.Graph(
                             id='regression-graph',
@@ -1535,11 +1592,13 @@ def update_main_content(selected_sources, selected_keyword, language):
                         )
                     ], style={'display': 'flex', 'alignItems': 'flex-start'})
                 ])
-            ], id='section-regression', className='section-anchor'))
+            ], id='section-regression', className='section-anchor lazy-section',
+               **{'data-section': 'regression', 'data-render': render_token}))
 
         # 8. PCA Analysis
         if len(selected_sources) >= 2:
             content.append(html.Div([
+                section_visibility_store('pca'),
                 html.Div([
                     html.H6(get_text('pca_analysis', language), style={'fontSize': '16px', 'marginBottom': '15px', 'color': 'white'})
                 ], style={
@@ -1550,16 +1609,22 @@ def update_main_content(selected_sources, selected_keyword, language):
                     'boxShadow': '0 2px 4px rgba(0,0,0,0.1)',
                     'border': '1px solid #34495e'
                 }),
-                dcc.Graph(
-                    id='pca-analysis-graph',
-                    figure=create_pca_figure(combined_dataset, selected_source_names, language),
-                    style={'height': '500px'},
-                    config={'displaylogo': False, 'responsive': True}
+                dcc.Loading(
+                    type="circle",
+                    children=[
+                        dcc.Graph(
+                            id='pca-analysis-graph',
+                            style={'height': '500px'},
+                            config={'displaylogo': False, 'responsive': True}
+                        )
+                    ]
                 )
-            ], id='section-pca', className='section-anchor'))
+            ], id='section-pca', className='section-anchor lazy-section',
+               **{'data-section': 'pca', 'data-render': render_token}))
 
         # Data table
         content.append(html.Div([
+            section_visibility_store('data-table'),
             html.Div([
                 html.H6(get_text('data_table', language), style={'fontSize': '16px', 'marginBottom': '15px', 'color': 'white'})
             ], style={
@@ -1578,20 +1643,12 @@ def update_main_content(selected_sources, selected_keyword, language):
                 style={'fontSize': '12px'}
             ),
             dbc.Collapse(
-                html.Div([
-                    dash_table.DataTable(
-                        data=combined_dataset_fecha_formatted.to_dict('records'),
-                        columns=[{"name": str(col), "id": str(col)} for col in combined_dataset_fecha_formatted.columns],
-                        style_table={'overflowX': 'auto', 'overflowY': 'auto', 'height': '400px'},
-                        style_cell={'textAlign': 'left', 'padding': '5px', 'minWidth': '100px', 'width': '120px', 'maxWidth': '150px'},
-                        style_header={'backgroundColor': 'rgb(230, 230, 230)', 'fontWeight': 'bold'},
-                        page_size=12
-                    )
-                ]),
+                dcc.Loading(html.Div(id='data-table-container'), type="circle"),
                 id="collapse-table",
                 is_open=True
             )
-        ], id='section-data-table', className='section-anchor'))
+        ], id='section-data-table', className='section-anchor lazy-section',
+           **{'data-section': 'data-table', 'data-render': render_token}))
 
         # Performance Monitoring Section
         # Calculate current query statistics
@@ -1599,20 +1656,13 @@ def update_main_content(selected_sources, selected_keyword, language):
         current_query_sources = len(selected_sources)
         current_query_date_range = "N/A"
 
-        if datasets_norm:
-            for source_data in datasets_norm.values():
-                if source_data is not None and not source_data.empty:
-                    current_query_records += len(source_data)
+        if not combined_dataset.empty:
+            current_query_records = int(combined_dataset.drop(columns='Fecha').notna().to_numpy().sum())
 
             # Calculate date range for current query
-            all_dates = set()
-            for source_data in datasets_norm.values():
-                if source_data is not None and not source_data.empty:
-                    all_dates.update(source_data.index)
-            if all_dates:
-                min_date = min(all_dates).strftime('%Y')
-                max_date = max(all_dates).strftime('%Y')
-                current_query_date_range = f"{min_date} - {max_date}"
+            min_date = combined_dataset['Fecha'].min().strftime('%Y')
+            max_date = combined_dataset['Fecha'].max().strftime('%Y')
+            current_query_date_range = f"{min_date} - {max_date}"
 
         db_stats = get_cache_stats()
         content.append(html.Div([
@@ -1715,6 +1765,93 @@ def update_main_content(selected_sources, selected_keyword, language):
     except Exception as e:
         return html.Div(f"Error: {str(e)}"), credits_open
 
+def render_section_figure(view, create_figure, visible, selected_keyword, selected_sources, language):
+    """Build the figure of a lazily rendered section from the shared dataset once it is visible"""
+    if not visible:
+        return no_update
+
+    selected_source_ids = map_display_names_to_source_ids(selected_sources or [])
+    if not selected_keyword or not selected_source_ids:
+        return no_update
+
+    try:
+        combined_dataset = dataset_service.get_combined(selected_keyword, selected_source_ids)
+        if combined_dataset.empty:
+            return go.Figure()
+        fig = get_localized_figure(
+            selected_keyword, selected_source_ids, view, language,
+            lambda lang: create_figure(combined_dataset, get_source_names(selected_source_ids, lang), lang))
+        return fig
+    except Exception as e:
+        print(f"ERROR: Failed to create {view} figure: {e}")
+        import traceback
+        traceback.print_exc()
+        fig = go.Figure()
+        fig.add_annotation(text=f"Error creating {view} graph: {str(e)}", showarrow=False)
+        return fig
+
+# The selection is read as State: changing it re-renders the main content, which resets the sections
+@app.callback(
+    Output('mean-analysis-graph', 'figure'),
+    section_visible('mean'),
+    State('keyword-dropdown', 'value'),
+    State('data-sources-store-v2', 'data'),
+    State('language-store', 'data')
+)
+def render_mean_section(visible, selected_keyword, selected_sources, language):
+    return render_section_figure('mean', create_mean_analysis_figure, visible,
+                                 selected_keyword, selected_sources, language)
+
+@app.callback(
+    Output('correlation-heatmap', 'figure'),
+    section_visible('correlation'),
+    State('keyword-dropdown', 'value'),
+    State('data-sources-store-v2', 'data'),
+    State('language-store', 'data')
+)
+def render_correlation_section(visible, selected_keyword, selected_sources, language):
+    return render_section_figure(
+        'correlation', lambda data, sources, lang: create_correlation_heatmap(data, sources, lang, selected_keyword),
+        visible, selected_keyword, selected_sources, language)
+
+@app.callback(
+    Output('pca-analysis-graph', 'figure'),
+    section_visible('pca'),
+    State('keyword-dropdown', 'value'),
+    State('data-sources-store-v2', 'data'),
+    State('language-store', 'data')
+)
+def render_pca_section(visible, selected_keyword, selected_sources, language):
+    return render_section_figure(
+        'pca', lambda data, sources, lang: create_pca_figure(data, sources, lang, selected_keyword),
+        visible, selected_keyword, selected_sources, language)
+
+@app.callback(
+    Output('data-table-container', 'children'),
+    section_visible('data-table'),
+    Input('collapse-table', 'is_open'),
+    State('keyword-dropdown', 'value'),
+    State('data-sources-store-v2', 'data')
+)
+def render_data_table_section(visible, is_open, selected_keyword, selected_sources):
+    # The table is only sent once it is both scrolled into view and expanded
+    if not visible or not is_open:
+        return no_update
+
+    selected_source_ids = map_display_names_to_source_ids(selected_sources or [])
+    if not selected_keyword or not selected_source_ids:
+        return no_update
+
+    combined_dataset_fecha_formatted = dataset_service.get_display_table(selected_keyword, selected_source_ids)
+    return dash_table.DataTable(
+        data=combined_dataset_fecha_formatted.to_dict('records'),
+        columns=[{"name": str(col), "id": str(col)} for col in combined_dataset_fecha_formatted.columns],
+        style_table={'overflowX': 'auto', 'overflowY': 'auto', 'height': '400px'},
+        style_cell={'textAlign': 'left', 'padding': '5px', 'minWidth': '100px', 'width': '120px', 'maxWidth': '150px'},
+        style_header={'backgroundColor': 'rgb(230, 230, 230)', 'fontWeight': 'bold'},
+        page_size=12
+    )
+
 # Helper functions for creating figures
 def create_temporal_2d_figure(data, sources, language='es', start_date=None, end_date=None):
     print(f"DEBUG: create_temporal_2d_figure called")
@@ -1951,7 +2088,7 @@ def create_mean_analysis_figure(data, sources, language='es'):
 
     return fig
 
-def create_pca_figure(data, sources, language='es'):
+def create_pca_figure(data, sources, language='es', keyword=None):
     # DATAFRAME_INDEXING_FIX: Create proper translation mapping
     selected_source_ids = map_display_names_to_source_ids(sources)
     translation_mapping = create_translation_mapping(selected_source_ids, language)
@@ -1967,20 +2104,15 @@ def create_pca_figure(data, sources, language='es'):
         print(f"DEBUG: No valid columns found for PCA analysis")
         return go.Figure()
     
-    pca_data = data[original_columns].dropna()
-    if len(pca_data) < 2:
+    # Standardized PCA precomputed by the database build (canonical source order); fitted here on a miss
+    column_ids = [SOURCE_ID_BY_COLUMN[column] for column in original_columns]
+    pca_result = get_precomputed_analytics(keyword, column_ids, 'pca')
+    if pca_result is None:
+        pca_result = compute_pca(data[original_columns].set_axis(column_ids, axis=1))
+    if pca_result is None:
         return go.Figure()
-    
-    # Create mapping from original column names back to display names for labeling
-    original_to_display = {v: k for k, v in translation_mapping.items()}
-
-    # Standardize data
-    scaler = StandardScaler()
-    scaled_data = scaler.fit_transform(pca_data)
 
-    # Perform PCA
-    pca = PCA()
-    pca_result = pca.fit_transform(scaled_data)
+    components = pca_components_for(pca_result, column_ids)
 
     # Create subplot
     fig = make_subplots(
@@ -1997,8 +2129,8 @@ def create_pca_figure(data, sources, language='es'):
         # Add arrow line from origin to point
         fig.add_trace(
             go.Scatter(
-                x=[0, pca.components_[0, i]],  # From origin to loading
-                y=[0, pca.components_[1, i]],  # From origin to loading
+                x=[0, components[0, i]],  # From origin to loading
+                y=[0, components[1, i]],  # From origin to loading
                 mode='lines',
                 line=dict(color=color_map.get(display_name, '#000000'), width=2),
                 showlegend=False
@@ -2009,8 +2141,8 @@ def create_pca_figure(data, sources, language='es'):
         # Add point with label
         fig.add_trace(
             go.Scatter(
-                x=[pca.components_[0, i]],
-                y=[pca.components_[1, i]],
+                x=[components[0, i]],
+                y=[components[1, i]],
                 mode='markers+text',
                 text=[display_name],
                 textposition="top center",
@@ -2021,7 +2153,7 @@ def create_pca_figure(data, sources, language='es'):
         )
 
     # Explained variance with both cumulative and inverse lines
-    explained_var = pca.explained_variance_ratio_ * 100
+    explained_var = pca_result['explained_variance_ratio'] * 100
     pc_labels = [f'PC{i+1}' for i in range(len(explained_var))]
     cumulative_var = explained_var.cumsum()  # Cumulative sum
 
@@ -2120,7 +2252,7 @@ def create_pca_figure(data, sources, language='es'):
 
     return fig
 
-def create_correlation_heatmap(data, sources, language='es'):
+def create_correlation_heatmap(data, sources, language='es', keyword=None):
     print(f"DEBUG: create_correlation_heatmap called with sources: {sources}")
     
     # DATAFRAME_INDEXING_FIX: Create proper translation mapping
@@ -2138,7 +2270,14 @@ def create_correlation_heatmap(data, sources, language='es'):
         print(f"DEBUG: No valid columns found for correlation heatmap")
         return go.Figure()
     
-    corr_data = data[original_columns].corr()
+    # Correlations precomputed by the database build (canonical source order); computed here on a miss
+    column_ids = [SOURCE_ID_BY_COLUMN[column] for column in original_columns]
+    correlation = get_precomputed_analytics(keyword, column_ids, 'correlation')
+    if correlation is None:
+        correlation = compute_correlation(data[original_columns].set_axis(column_ids, axis=1))
+    positions = select_analytics_sources(correlation, column_ids)
+    corr_data = pd.DataFrame(correlation['matrix'][np.ix_(positions, positions)],
+                             index=original_columns, columns=original_columns)
     print(f"DEBUG: Correlation data shape: {corr_data.shape}")
     
     # Create mapping from original column names back to display names for labeling
@@ -2198,24 +2337,17 @@ def create_correlation_heatmap(data, sources, language='es'):
 
     return fig
 
-# Callback for Temporal Analysis 2D with date range filtering
+# Callback for Temporal Analysis 2D: the full series, rebuilt only when the selection or language changes
 @app.callback(
     Output('temporal-2d-graph', 'figure'),
-    [Input('temporal-2d-all', 'n_clicks'),
-     Input('temporal-2d-20y', 'n_clicks'),
-     Input('temporal-2d-15y', 'n_clicks'),
-     Input('temporal-2d-10y', 'n_clicks'),
-     Input('temporal-2d-5y', 'n_clicks'),
-     Input('temporal-2d-date-range', 'value'),
-     Input('keyword-dropdown', 'value'),
+    [Input('keyword-dropdown', 'value'),
      Input('data-sources-store-v2', 'data'),
      Input('language-store', 'data')]
 )
-def update_temporal_2d_analysis(all_clicks, y20_clicks, y15_clicks, y10_clicks, y5_clicks, slider_values, selected_keyword, selected_sources, language):
+def update_temporal_2d_analysis(selected_keyword, selected_sources, language):
     print(f"DEBUG: update_temporal_2d_analysis called")
     print(f"DEBUG: selected_keyword={selected_keyword}")
     print(f"DEBUG: selected_sources={selected_sources}")
-    print(f"DEBUG: slider_values={slider_values}")
     
     if selected_sources is None:
         selected_sources = []
@@ -2229,79 +2361,95 @@ def update_temporal_2d_analysis(all_clicks, y20_clicks, y15_clicks, y10_clicks,
         return go.Figure()
 
     try:
-        datasets_norm, sl_sc = db_manager.get_data_for_keyword(selected_keyword, selected_source_ids)
-        print(f"DEBUG: Retrieved datasets_norm keys: {list(datasets_norm.keys()) if datasets_norm else 'None'}")
-        
-        if not datasets_norm:
+        combined_dataset = dataset_service.get_combined(selected_keyword, selected_source_ids)
+        if combined_dataset.empty:
             print(f"DEBUG: No data retrieved from database")
             return go.Figure()
-            
-        combined_dataset = create_combined_dataset2(datasets_norm=datasets_norm, selected_sources=sl_sc, dbase_options=dbase_options)
-        print(f"DEBUG: Combined dataset shape: {combined_dataset.shape if not combined_dataset.empty else 'Empty'}")
 
-        combined_dataset = combined_dataset.reset_index()
-        date_column = combined_dataset.columns[0]
-        combined_dataset[date_column] = pd.to_datetime(combined_dataset[date_column])
-        combined_dataset = combined_dataset.rename(columns={date_column: 'Fecha'})
-
-        # Sort by date to ensure chronological order for slider indices
-        combined_dataset = combined_dataset.sort_values('Fecha').reset_index(drop=True)
-
-        # No longer need Bain/Crossref alignment since we preserve individual date ranges
+        # Same figure as the one in the main content, so it is served from the figure cache
+        figure = get_localized_figure(
+            selected_keyword, selected_source_ids, 'temporal_2d', language,
+            lambda lang: create_temporal_2d_figure(combined_dataset, get_source_names(selected_source_ids, lang), lang))
+        return figure
+    except Exception as e:
+        print(f"Error in temporal 2D analysis: {e}")
+        import traceback
+        traceback.print_exc()
+        return go.Figure()
 
-        # Filter out rows where ALL selected sources are NaN (preserve partial data)
-        data_columns = [dbase_options[src_id] for src_id in selected_source_ids]
-        combined_dataset = combined_dataset.dropna(subset=data_columns, how='all')
+def create_temporal_2d_range_patch(full_dataset, range_start=None, range_end=None, last_years=None):
+    """Patch moving the temporal 2D axes to a date range, or back to autorange for the full range"""
+    sliced = slice_months(full_dataset, start_date=range_start, end_date=range_end, last_years=last_years)
+    if sliced.empty:
+        return no_update
+
+    # Same tick format as create_temporal_2d_figure uses for a series spanning the range
+    start_date, end_date = sliced['Fecha'].min(), sliced['Fecha'].max()
+    patch = Patch()
+    patch['layout']['xaxis']['tickformat'] = "%Y" if (end_date - start_date).days > 365 * 3 else "%Y-%m"
+    if start_date <= full_dataset['Fecha'].min() and end_date >= full_dataset['Fecha'].max():
+        patch['layout']['xaxis']['autorange'] = True
+        patch['layout']['yaxis']['autorange'] = True
+        return patch
+
+    # Plotly does not rescale the y axis to a new x range, so both ranges come from the slice
+    values = sliced.drop(columns='Fecha').to_numpy(dtype=float)
+    y_min, y_max = np.nanmin(values), np.nanmax(values)
+    padding = (y_max - y_min) * 0.05 or 1.0
+
+    patch['layout']['xaxis']['range'] = [start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d')]
+    patch['layout']['xaxis']['autorange'] = False
+    patch['layout']['yaxis']['range'] = [float(y_min - padding), float(y_max + padding)]
+    patch['layout']['yaxis']['autorange'] = False
+    return patch
+
+# Callback for the temporal 2D date range: only the axis ranges are sent to the browser
+@app.callback(
+    Output('temporal-2d-graph', 'figure', allow_duplicate=True),
+    [Input('temporal-2d-all', 'n_clicks'),
+     Input('temporal-2d-20y', 'n_clicks'),
+     Input('temporal-2d-15y', 'n_clicks'),
+     Input('temporal-2d-10y', 'n_clicks'),
+     Input('temporal-2d-5y', 'n_clicks'),
+     Input('temporal-2d-date-range', 'value')],
+    [State('keyword-dropdown', 'value'),
+     State('data-sources-store-v2', 'data')],
+    prevent_initial_call=True
+)
+def update_temporal_2d_range(all_clicks, y20_clicks, y15_clicks, y10_clicks, y5_clicks, slider_values, selected_keyword, selected_sources):
+    selected_source_ids = map_display_names_to_source_ids(selected_sources or [])
+    if not selected_keyword or not selected_source_ids:
+        return no_update
 
-        selected_source_names = [translate_source_name(dbase_options[src_id], language) for src_id in selected_source_ids]
-        print(f"DEBUG: Selected source names: {selected_source_names}")
+    try:
+        # The slider positions are month offsets from the first month of the selected sources
+        full_dataset = dataset_service.get_combined(selected_keyword, selected_source_ids)
+        if full_dataset.empty:
+            return no_update
+        first_date = full_dataset['Fecha'].min()
 
         # Default to full date range
-        start_date = combined_dataset['Fecha'].min().date()
-        end_date = combined_dataset['Fecha'].max().date()
-        print(f"DEBUG: Default date range: {start_date} to {end_date}")
-
-        # Check if any button was clicked or slider moved
-        try:
-            ctx = dash.callback_context
-            if ctx.triggered and len(ctx.triggered) > 0:
-                trigger_id = ctx.triggered[0]['prop_id'].split('.')[0]
-                print(f"DEBUG: Triggered by: {trigger_id}")
-
-                if trigger_id in ['temporal-2d-all', 'temporal-2d-20y', 'temporal-2d-15y', 'temporal-2d-10y', 'temporal-2d-5y']:
-                    # Button was clicked - calculate new date range
-                    if trigger_id == 'temporal-2d-all':
-                        start_date = combined_dataset['Fecha'].min().date()
-                        end_date = combined_dataset['Fecha'].max().date()
-                    else:
-                        # Calculate years back from end
-                        years_back = int(trigger_id.split('-')[-1].replace('y', ''))
-                        end_date = combined_dataset['Fecha'].max().date()
-                        start_date = (pd.to_datetime(end_date) - pd.DateOffset(years=years_back)).date()
-                    print(f"DEBUG: Updated date range from button: {start_date} to {end_date}")
-
-                elif trigger_id == 'temporal-2d-date-range':
-                    # Slider was moved - convert indices to dates
-                    if slider_values is not None and len(slider_values) == 2:
-                        start_idx, end_idx = slider_values
-                        if start_idx < len(combined_dataset) and end_idx < len(combined_dataset):
-                            start_date = combined_dataset['Fecha'].iloc[start_idx].date()
-                            end_date = combined_dataset['Fecha'].iloc[end_idx].date()
-                            print(f"DEBUG: Updated date range from slider: {start_date} to {end_date}")
-        except Exception as e:
-            # Handle case when callback context is not available (e.g., during testing)
-            print(f"DEBUG: No callback context available, using default date range: {e}")
-            # Keep default date range (full range)
-
-        print(f"DEBUG: Creating temporal 2D figure...")
-        figure = create_temporal_2d_figure(combined_dataset, selected_source_names, language, start_date, end_date)
-        print(f"DEBUG: Figure created with {len(figure.data) if hasattr(figure, 'data') else 0} traces")
-        return figure
+        range_start, range_end, last_years = None, None, None
+
+        ctx = dash.callback_context
+        if ctx.triggered and len(ctx.triggered) > 0:
+            trigger_id = ctx.triggered[0]['prop_id'].split('.')[0]
+
+            if trigger_id in ['temporal-2d-20y', 'temporal-2d-15y', 'temporal-2d-10y', 'temporal-2d-5y']:
+                # Button was clicked - keep the last N years before the latest date
+                last_years = int(trigger_id.split('-')[-1].replace('y', ''))
+            elif trigger_id == 'temporal-2d-date-range' and slider_values is not None and len(slider_values) == 2:
+                # Slider was moved - convert month offsets to dates
+                start_idx, end_idx = slider_values
+                range_start = first_date + pd.DateOffset(months=int(start_idx))
+                range_end = first_date + pd.DateOffset(months=int(end_idx))
+
+        return create_temporal_2d_range_patch(full_dataset, range_start, range_end, last_years)
     except Exception as e:
-        print(f"Error in temporal 2D analysis: {e}")
+        print(f"Error updating temporal 2D range: {e}")
         import traceback
         traceback.print_exc()
-        return go.Figure()
+        return no_update
 
 # Callback to update the slider properties when data changes (only min, max, marks)
 @app.callback(
@@ -2328,40 +2476,35 @@ def update_temporal_slider_properties(selected_keyword, selected_sources):
         return 0, 100, {}, [0, 100]
 
     try:
-        datasets_norm, sl_sc = db_manager.get_data_for_keyword(selected_keyword, selected_source_ids)
-        print(f"DEBUG: Retrieved datasets_norm keys: {list(datasets_norm.keys()) if datasets_norm else 'None'}")
-        
-        if not datasets_norm:
-            print(f"DEBUG: No data retrieved from database")
-            return 0, 100, {}, [0, 100]
-            
-        combined_dataset = create_combined_dataset2(datasets_norm=datasets_norm, selected_sources=sl_sc, dbase_options=dbase_options)
-        print(f"DEBUG: Combined dataset shape: {combined_dataset.shape if not combined_dataset.empty else 'Empty'}")
-
-        combined_dataset = combined_dataset.reset_index()
-        date_column = combined_dataset.columns[0]
-        combined_dataset[date_column] = pd.to_datetime(combined_dataset[date_column])
-        combined_dataset = combined_dataset.rename(columns={date_column: 'Fecha'})
-
-        # No longer need Bain/Crossref alignment since we preserve individual date ranges
-
-        # Filter out rows where ALL selected sources are NaN (preserve partial data)
-        data_columns = [dbase_options[src_id] for src_id in selected_source_ids]
-        combined_dataset = combined_dataset.dropna(subset=data_columns, how='all')
+        # Read the bounds from the dataset if this worker holds it, otherwise from the
+        # per-source date bounds, so no data rows are read just for the slider
+        combined_dataset = dataset_service.get_cached_combined(selected_keyword, selected_source_ids)
+        if combined_dataset is not None:
+            if combined_dataset.empty:
+                return 0, 100, {}, [0, 100]
+            first_date = combined_dataset['Fecha'].min()
+            last_date = combined_dataset['Fecha'].max()
+        else:
+            bounds = db_manager.get_date_bounds(selected_keyword, selected_source_ids)
+            if not bounds:
+                print(f"DEBUG: No data retrieved from database")
+                return 0, 100, {}, [0, 100]
+            first_date = min(first for first, _, _ in bounds.values())
+            last_date = max(last for _, last, _ in bounds.values())
 
-        print(f"DEBUG: Processed dataset shape: {combined_dataset.shape}")
-        print(f"DEBUG: Date range: {combined_dataset['Fecha'].min()} to {combined_dataset['Fecha'].max()}")
+        # Slider positions are month offsets from the first month of the selected sources
+        n_months = (last_date.year - first_date.year) * 12 + last_date.month - first_date.month
 
         # Create marks for the slider
-        n_marks = min(5, len(combined_dataset))  # Limit to 5 marks
-        mark_indices = [int(i * (len(combined_dataset) - 1) / (n_marks - 1)) for i in range(n_marks)]
+        n_marks = min(5, n_months + 1)  # Limit to 5 marks
+        mark_indices = [int(i * n_months / (n_marks - 1)) for i in range(n_marks)] if n_marks > 1 else [0]
         marks = {
-            idx: combined_dataset['Fecha'].iloc[idx].strftime('%Y-%m')
+            idx: (first_date + pd.DateOffset(months=idx)).strftime('%Y-%m')
             for idx in mark_indices
         }
         print(f"DEBUG: Created {len(marks)} slider marks")
 
-        return 0, len(combined_dataset) - 1, marks, [0, len(combined_dataset) - 1]
+        return 0, n_months, marks, [0, n_months]
     except Exception as e:
         print(f"DEBUG: Error in update_temporal_slider_properties: {e}")
         import traceback
@@ -2377,16 +2520,16 @@ def aggregate_data_for_3d(data, frequency, source_name):
     # Annual aggregation with different methods per source
     if 'Google Trends' in source_name:
         # GT: Average
-        return data.resample('Y').mean()
+        return data.resample('YE').mean()
     elif 'Crossref' in source_name:
         # CR: Sum
-        return data.resample('Y').sum()
+        return data.resample('YE').sum()
     elif 'Google Books' in source_name:
         # GB: Sum
-        return data.resample('Y').sum()
+        return data.resample('YE').sum()
     else:
         # Bain (BU/BS): Average
-        return data.resample('Y').mean()
+        return data.resample('YE').mean()
 
 @app.callback(
     Output('temporal-3d-graph', 'figure'),
@@ -2394,11 +2537,16 @@ def aggregate_data_for_3d(data, frequency, source_name):
      Input('z-axis-3d', 'value'),
      Input('temporal-3d-monthly', 'n_clicks'),
      Input('temporal-3d-annual', 'n_clicks'),
-     Input('keyword-dropdown', 'value'),
-     Input('data-sources-store-v2', 'data'),
-     Input('language-store', 'data')]
+     section_visible('temporal-3d')],
+    [State('keyword-dropdown', 'value'),
+     State('data-sources-store-v2', 'data'),
+     State('language-store', 'data')]
 )
-def update_3d_plot(y_axis, z_axis, monthly_clicks, annual_clicks, selected_keyword, selected_sources, language):
+def update_3d_plot(y_axis, z_axis, monthly_clicks, annual_clicks, visible, selected_keyword, selected_sources, language):
+    # Rendered once the section is scrolled into view
+    if not visible:
+        return no_update
+
     if selected_sources is None:
         selected_sources = []
 
@@ -2419,56 +2567,66 @@ def update_3d_plot(y_axis, z_axis, monthly_clicks, annual_clicks, selected_keywo
             frequency = 'monthly'
 
     try:
-        datasets_norm, sl_sc = db_manager.get_data_for_keyword(selected_keyword, selected_source_ids)
-        combined_dataset = create_combined_dataset2(datasets_norm=datasets_norm, selected_sources=sl_sc, dbase_options=dbase_options)
-
-        combined_dataset = combined_dataset.reset_index()
-        date_column = combined_dataset.columns[0]
-        combined_dataset[date_column] = pd.to_datetime(combined_dataset[date_column])
-        combined_dataset = combined_dataset.rename(columns={date_column: 'Fecha'})
-        combined_dataset = combined_dataset.set_index('Fecha')
-
         # DATAFRAME_INDEXING_FIX: Create proper translation mapping
         translation_mapping = create_translation_mapping(selected_source_ids, language)
-        
-        # DATAFRAME_INDEXING_FIX: Use safe column access for y_axis
-        y_data_column = safe_dataframe_column_access(combined_dataset, y_axis, translation_mapping)
-        z_data_column = safe_dataframe_column_access(combined_dataset, z_axis, translation_mapping)
-        
-        if y_data_column is None or z_data_column is None:
+
+        axis_ids = [SOURCE_ID_BY_COLUMN.get(get_original_column_name(axis, translation_mapping)) for axis in (y_axis, z_axis)]
+        if None in axis_ids:
             print(f"ERROR: Could not find columns for 3D plot: y_axis={y_axis}, z_axis={z_axis}")
             return {}
-        
-        # Apply aggregation based on frequency and source type
-        y_data = aggregate_data_for_3d(y_data_column, frequency, y_axis)
-        z_data = aggregate_data_for_3d(z_data_column, frequency, z_axis)
-
-        # Align the data (they might have different date ranges after aggregation)
-        common_index = y_data.index.intersection(z_data.index)
-        y_data = y_data.loc[common_index]
-        z_data = z_data.loc[common_index]
-
-        fig = go.Figure(data=[
-            go.Scatter3d(
-                x=common_index,
-                y=y_data.values,
-                z=z_data.values,
-                mode='lines',
-                line=dict(color=color_map.get(y_axis, '#000000'), width=3),
-                name=f'{y_axis} vs {z_axis} ({frequency})'
+
+        def build_3d_figure(lang):
+            y_axis, z_axis = get_source_names(axis_ids, lang)
+
+            # Annual aggregates precomputed by the database build for this selection
+            annual = get_precomputed_analytics(selected_keyword, selected_source_ids, 'annual') if frequency == 'annual' else None
+
+            if annual is not None and all(source_id in annual['sources'] for source_id in axis_ids):
+                y_position, z_position = select_analytics_sources(annual, axis_ids)
+                annual_index = pd.DatetimeIndex(annual['index'])
+                y_data = pd.Series(annual['values'][:, y_position], index=annual_index)
+                z_data = pd.Series(annual['values'][:, z_position], index=annual_index)
+            else:
+                combined_dataset = dataset_service.get_combined(selected_keyword, selected_source_ids).set_index('Fecha')
+
+                y_column, z_column = (dbase_options[source_id] for source_id in axis_ids)
+                if y_column not in combined_dataset.columns or z_column not in combined_dataset.columns:
+                    print(f"ERROR: Could not find columns for 3D plot: y_axis={y_axis}, z_axis={z_axis}")
+                    return {}
+
+                # Apply aggregation based on frequency and source type
+                y_data = aggregate_data_for_3d(combined_dataset[y_column], frequency, y_axis)
+                z_data = aggregate_data_for_3d(combined_dataset[z_column], frequency, z_axis)
+
+            # Align the data (they might have different date ranges after aggregation)
+            common_index = y_data.index.intersection(z_data.index)
+            y_data = y_data.loc[common_index]
+            z_data = z_data.loc[common_index]
+
+            fig = go.Figure(data=[
+                go.Scatter3d(
+                    x=common_index,
+                    y=y_data.values,
+                    z=z_data.values,
+                    mode='lines',
+                    line=dict(color=color_map.get(y_axis, '#000000'), width=3),
+                    name=f'{y_axis} vs {z_axis} ({frequency})'
+                )
+            ])
+
+            fig.update_layout(
+                title=get_text('temporal_3d_title', lang, y_axis=y_axis, z_axis=z_axis, frequency=frequency.capitalize()),
+                scene=dict(
+                    xaxis_title=get_text('date', lang),
+                    yaxis_title=y_axis,
+                    zaxis_title=z_axis
+                ),
+                height=600
             )
-        ])
+            return fig
 
-        fig.update_layout(
-            title=get_text('temporal_3d_title', language, y_axis=y_axis, z_axis=z_axis, frequency=frequency.capitalize()),
-            scene=dict(
-                xaxis_title=get_text('date', language),
-                yaxis_title=y_axis,
-                zaxis_title=z_axis
-            ),
-            height=600
-        )
-        return fig
+        return get_localized_figure(selected_keyword, selected_source_ids, ('3d', *axis_ids, frequency),
+                                    language, build_3d_figure)
     except Exception as e:
         print(f"Error in regression analysis: {e}")
         # Return empty figure instead of empty dict
@@ -2481,14 +2639,23 @@ def update_3d_plot(y_axis, z_axis, monthly_clicks, annual_clicks, selected_keywo
         )
         return fig
 
-@app.callback(
+@heavy_callback(
+    app, background_manager,
     Output('seasonal-analysis-graph', 'figure'),
     [Input('seasonal-source-select', 'value'),
-     Input('keyword-dropdown', 'value'),
-     Input('data-sources-store-v2', 'data'),
-     Input('language-store', 'data')]
+     section_visible('seasonal')],
+    [State('keyword-dropdown', 'value'),
+     State('data-sources-store-v2', 'data'),
+     State('language-store', 'data')],
+    section='seasonal',
+    cancel=SELECTION_INPUTS,
+    prevent_initial_call=True
 )
-def update_seasonal_analysis(selected_source, selected_keyword, selected_sources, language):
+def update_seasonal_analysis(set_progress, selected_source, visible, selected_keyword, selected_sources, language):
+    # Rendered once the section is scrolled into view
+    if not visible:
+        return no_update
+
     if selected_sources is None:
         selected_sources = []
 
@@ -2498,60 +2665,73 @@ def update_seasonal_analysis(selected_source, selected_keyword, selected_sources
         return {}
 
     try:
-        datasets_norm, sl_sc = db_manager.get_data_for_keyword(selected_keyword, selected_source_ids)
-        combined_dataset = create_combined_dataset2(datasets_norm=datasets_norm, selected_sources=sl_sc, dbase_options=dbase_options)
-
-        combined_dataset = combined_dataset.reset_index()
-        date_column = combined_dataset.columns[0]
-        combined_dataset[date_column] = pd.to_datetime(combined_dataset[date_column])
-        combined_dataset = combined_dataset.rename(columns={date_column: 'Fecha'})
-
         # DATAFRAME_INDEXING_FIX: Create proper translation mapping
         translation_mapping = create_translation_mapping(selected_source_ids, language)
-        
-        # DATAFRAME_INDEXING_FIX: Use safe column access
-        ts_data_column = safe_dataframe_column_access(combined_dataset, selected_source, translation_mapping)
-        if ts_data_column is None:
-            return {}
-        
-        ts_data = ts_data_column.dropna()
-        if len(ts_data) < 24:
+        source_id = SOURCE_ID_BY_COLUMN.get(get_original_column_name(selected_source, translation_mapping))
+        if source_id is None:
             return {}
 
-        decomposition = seasonal_decompose(ts_data, model='additive', period=12)
+        def build_seasonal_figure(lang):
+            combined_dataset = dataset_service.get_combined(selected_keyword, selected_source_ids)
+            report_step(set_progress, 1, 3)
+            if dbase_options[source_id] not in combined_dataset.columns:
+                return {}
+
+            ts_data = combined_dataset[dbase_options[source_id]].dropna()
+            if len(ts_data) < 24:
+                return {}
+
+            # Decomposition precomputed by the database build; computed here on a miss
+            decomposition = get_precomputed_analytics(selected_keyword, [source_id], 'seasonal')
+            if decomposition is None:
+                decomposition = compute_seasonal(ts_data.to_numpy())
+            report_step(set_progress, 2, 3)
+
+            fig = make_subplots(
+                rows=4, cols=1,
+                subplot_titles=[get_text('original_series', lang), get_text('trend', lang), get_text('seasonal', lang), get_text('residuals', lang)],
+                vertical_spacing=0.1
+            )
 
-        fig = make_subplots(
-            rows=4, cols=1,
-            subplot_titles=[get_text('original_series', language), get_text('trend', language), get_text('seasonal', language), get_text('residuals', language)],
-            vertical_spacing=0.1
-        )
+            fig.add_trace(go.Scatter(x=combined_dataset['Fecha'], y=ts_data, name='Original'), row=1, col=1)
+            fig.add_trace(go.Scatter(x=combined_dataset['Fecha'], y=decomposition['trend'], name='Tendencia'), row=2, col=1)
+            fig.add_trace(go.Scatter(x=combined_dataset['Fecha'], y=decomposition['seasonal'], name='Estacional'), row=3, col=1)
+            fig.add_trace(go.Scatter(x=combined_dataset['Fecha'], y=decomposition['resid'], name='Residuos'), row=4, col=1)
 
-        fig.add_trace(go.Scatter(x=combined_dataset['Fecha'], y=ts_data, name='Original'), row=1, col=1)
-        fig.add_trace(go.Scatter(x=combined_dataset['Fecha'], y=decomposition.trend, name='Tendencia'), row=2, col=1)
-        fig.add_trace(go.Scatter(x=combined_dataset['Fecha'], y=decomposition.seasonal, name='Estacional'), row=3, col=1)
-        fig.add_trace(go.Scatter(x=combined_dataset['Fecha'], y=decomposition.resid, name='Residuos'), row=4, col=1)
+            source_name = get_source_names([source_id], lang)[0]
+            fig.update_layout(height=600, title=get_text('seasonal_title', lang, source=source_name), showlegend=False)
+            report_step(set_progress, 3, 3)
+            return fig
 
-        fig.update_layout(height=600, title=get_text('seasonal_title', language, source=selected_source), showlegend=False)
-        return fig
+        return get_localized_figure(selected_keyword, selected_source_ids, ('seasonal', source_id),
+                                    language, build_seasonal_figure)
     except Exception as e:
         return {}
 
 
-@app.callback(
+@heavy_callback(
+    app, background_manager,
     [Output('regression-graph', 'figure'),
      Output('regression-equations', 'children')],
     [Input('correlation-heatmap', 'clickData'),
-     Input('keyword-dropdown', 'value'),
-     Input('data-sources-store-v2', 'data'),
-     Input('language-store', 'data')],
-    prevent_initial_call=False
+     section_visible('regression')],
+    [State('keyword-dropdown', 'value'),
+     State('data-sources-store-v2', 'data'),
+     State('language-store', 'data')],
+    section='regression',
+    cancel=SELECTION_INPUTS,
+    prevent_initial_call=True
 )
-def update_regression_analysis(click_data, selected_keyword, selected_sources, language):
+def update_regression_analysis(set_progress, click_data, visible, selected_keyword, selected_sources, language):
     print(f"DEBUG: update_regression_analysis called")
     print(f"DEBUG: click_data={click_data}")
     print(f"DEBUG: selected_keyword={selected_keyword}")
     print(f"DEBUG: selected_sources={selected_sources}")
     
+    # Rendered once the section is scrolled into view
+    if not visible:
+        return no_update, no_update
+
     if selected_sources is None:
         selected_sources = []
 
@@ -2612,19 +2792,8 @@ def update_regression_analysis(click_data, selected_keyword, selected_sources, l
 
     # Get the data for regression analysis
     try:
-        datasets_norm, sl_sc = db_manager.get_data_for_keyword(selected_keyword, selected_source_ids)
-        combined_dataset = create_combined_dataset2(datasets_norm=datasets_norm, selected_sources=sl_sc, dbase_options=dbase_options)
-        
-        combined_dataset = combined_dataset.reset_index()
-        date_column = combined_dataset.columns[0]
-        combined_dataset[date_column] = pd.to_datetime(combined_dataset[date_column])
-        combined_dataset = combined_dataset.rename(columns={date_column: 'Fecha'})
-        
-        # Filter out rows where ALL selected sources are NaN (preserve partial data)
-        # Use the actual column names from the combined dataset
-        actual_columns = [col for col in combined_dataset.columns if col != 'Fecha']
-        if actual_columns:
-            combined_dataset = combined_dataset.dropna(subset=actual_columns, how='all')
+        # Rows where all selected sources are NaN are already dropped (partial data is preserved)
+        combined_dataset = dataset_service.get_combined(selected_keyword, selected_source_ids)
         
         selected_source_names = [translate_source_name(dbase_options[src_id], language) for src_id in selected_source_ids]
         
@@ -2688,149 +2857,159 @@ def update_regression_analysis(click_data, selected_keyword, selected_sources, l
             )
             return fig, ""
         
-        # Create a dataframe with the two series for regression
-        regression_df = pd.DataFrame({
-            x_var: x_data_column,
-            y_var: y_data_column
-        })
+        x_id, y_id = SOURCE_ID_BY_COLUMN[x_var_original], SOURCE_ID_BY_COLUMN[y_var_original]
+
+        def build_regression(lang):
+            x_var, y_var = get_source_names([x_id, y_id], lang)
+
+            # Create a dataframe with the two series for regression
+            regression_df = pd.DataFrame({
+                x_var: combined_dataset[x_var_original],
+                y_var: combined_dataset[y_var_original]
+            })
         
-        # Drop NaN values
-        valid_data = regression_df.dropna()
-        if len(valid_data) < 2:
+            # Drop NaN values
+            valid_data = regression_df.dropna()
+            if len(valid_data) < 2:
+                fig = go.Figure()
+                fig.update_layout(
+                    title="Insufficient data for regression analysis",
+                    xaxis_title="",
+                    yaxis_title="",
+                    height=400
+                )
+                return {'figure': fig, 'equations': ""}
+
+            X = valid_data[x_var].values.reshape(-1, 1)
+            y = valid_data[y_var].values
+
+            # Colors for different polynomial degrees
+            poly_colors = ['red', 'blue', 'green', 'orange']
+            degree_names = [get_text('linear', lang), get_text('quadratic', lang),
+                          get_text('cubic', lang), get_text('quartic', lang)]
+
             fig = go.Figure()
-            fig.update_layout(
-                title="Insufficient data for regression analysis",
-                xaxis_title="",
-                yaxis_title="",
-                height=400
-            )
-            return fig, ""
 
-        X = valid_data[x_var].values.reshape(-1, 1)
-        y = valid_data[y_var].values
+            # Add scatter plot of original data
+            fig.add_trace(go.Scatter(
+                x=valid_data[x_var],
+                y=valid_data[y_var],
+                mode='markers',
+                name=get_text('data_points', lang),
+                marker=dict(color='gray', size=6, opacity=0.7)
+            ))
 
-        # Colors for different polynomial degrees
-        poly_colors = ['red', 'blue', 'green', 'orange']
-        degree_names = [get_text('linear', language), get_text('quadratic', language),
-                      get_text('cubic', language), get_text('quartic', language)]
+            # Sort X for smooth polynomial curves
+            X_sorted = np.sort(X.flatten())
+            X_sorted_reshaped = X_sorted.reshape(-1, 1)
 
-        fig = go.Figure()
+            # Annotations for formulas and R-squared
+            annotations = []
 
-        # Add scatter plot of original data
-        fig.add_trace(go.Scatter(
-            x=valid_data[x_var],
-            y=valid_data[y_var],
-            mode='markers',
-            name=get_text('data_points', language),
-            marker=dict(color='gray', size=6, opacity=0.7)
-        ))
-
-        # Sort X for smooth polynomial curves
-        X_sorted = np.sort(X.flatten())
-        X_sorted_reshaped = X_sorted.reshape(-1, 1)
-
-        # Annotations for formulas and R-squared
-        annotations = []
-
-        for degree in range(1, 5):  # Degrees 1, 2, 3, 4
-            try:
-                # Ensure data is numeric and properly shaped
-                X_clean = X.astype(float)
-                y_clean = y.astype(float)
-
-                # Fit polynomial regression
-                poly_features = PolynomialFeatures(degree=degree)
-                X_poly = poly_features.fit_transform(X_clean)
-
-                model = LinearRegression()
-                model.fit(X_poly, y_clean)
-
-                # Predict on sorted X values for smooth curve
-                X_poly_sorted = poly_features.transform(X_sorted_reshaped)
-                y_pred_sorted = model.predict(X_poly_sorted)
-
-                # Calculate R-squared
-                y_pred = model.predict(X_poly)
-                r_squared = r2_score(y_clean, y_pred)
-
-                # Create polynomial formula string with proper mathematical formatting
-                coefs = model.coef_
-                intercept = model.intercept_
-
-                if degree == 1:
-                    # Linear: y = mx + b
-                    formula = f"y = {coefs[1]:.3f}x {'+' if intercept >= 0 else ''}{intercept:.3f}"
-                else:
-                    # Polynomial: y = dx³ + cx² + bx + a (highest power to lowest)
-                    terms = []
-
-                    # Polynomial terms (highest power first)
-                    for i in range(len(coefs) - 1, 0, -1):  # Start from highest degree down to x term
-                        if abs(coefs[i]) > 0.001:  # Only show significant coefficients
-                            coef_str = f"{coefs[i]:+.3f}"
-                            if i == 1:
-                                terms.append(f"{coef_str}x")
-                            else:
-                                terms.append(f"{coef_str}x<sup>{i}</sup>")
+            for degree in range(1, 5):  # Degrees 1, 2, 3, 4
+                try:
+                    # Ensure data is numeric and properly shaped
+                    X_clean = X.astype(float)
+                    y_clean = y.astype(float)
 
-                    # Intercept term (comes last)
-                    if abs(intercept) > 0.001:
-                        terms.append(f"{intercept:+.3f}")
+                    # Fit polynomial regression
+                    poly_features = PolynomialFeatures(degree=degree)
+                    X_poly = poly_features.fit_transform(X_clean)
 
-                    # Join terms with proper spacing
-                    formula = f"y = {' '.join(terms)}"
+                    model = LinearRegression()
+                    model.fit(X_poly, y_clean)
 
-                # Add regression line
-                fig.add_trace(go.Scatter(
-                    x=X_sorted,
-                    y=y_pred_sorted,
-                    mode='lines',
-                    name=f'{degree_names[degree-1]} (R² = {r_squared:.3f})',
-                    line=dict(color=poly_colors[degree-1], width=2)
-                ))
+                    # Predict on sorted X values for smooth curve
+                    X_poly_sorted = poly_features.transform(X_sorted_reshaped)
+                    y_pred_sorted = model.predict(X_poly_sorted)
 
-                # Add annotation for this degree
-                annotations.append(
-                    f"<b>{degree_names[degree-1]}:</b><br>"
-                    f"{formula}<br>"
-                    f"R² = {r_squared:.3f}"
-                )
-            except Exception as poly_e:
-                print(f"Error fitting degree {degree} polynomial: {poly_e}")
-                # Add error annotation for this degree
-                annotations.append(
-                    f"<b>{degree_names[degree-1]}:</b><br>"
-                    f"Error fitting polynomial<br>"
-                    f"R² = N/A"
-                )
+                    # Calculate R-squared
+                    y_pred = model.predict(X_poly)
+                    r_squared = r2_score(y_clean, y_pred)
 
-        # Update layout with increased height for legend and equations
-        fig.update_layout(
-            title={
-                'text': get_text('regression_title', language, y_var=y_var, x_var=x_var),
-                'y': 0.95,
-                'x': 0.5,
-                'xanchor': 'center',
-                'yanchor': 'top'
-            },
-            xaxis_title=x_var,
-            yaxis_title=y_var,
-            height=600,  # Increased height to accommodate legend and equations
-            showlegend=True,
-            legend=dict(
-                orientation="h",
-                yanchor="bottom",
-                y=-0.2,  # Moved 2 lines below the graph
-                xanchor="center",
-                x=0.5
+                    # Create polynomial formula string with proper mathematical formatting
+                    coefs = model.coef_
+                    intercept = model.intercept_
+
+                    if degree == 1:
+                        # Linear: y = mx + b
+                        formula = f"y = {coefs[1]:.3f}x {'+' if intercept >= 0 else ''}{intercept:.3f}"
+                    else:
+                        # Polynomial: y = dx³ + cx² + bx + a (highest power to lowest)
+                        terms = []
+
+                        # Polynomial terms (highest power first)
+                        for i in range(len(coefs) - 1, 0, -1):  # Start from highest degree down to x term
+                            if abs(coefs[i]) > 0.001:  # Only show significant coefficients
+                                coef_str = f"{coefs[i]:+.3f}"
+                                if i == 1:
+                                    terms.append(f"{coef_str}x")
+                                else:
+                                    terms.append(f"{coef_str}x<sup>{i}</sup>")
+
+                        # Intercept term (comes last)
+                        if abs(intercept) > 0.001:
+                            terms.append(f"{intercept:+.3f}")
+
+                        # Join terms with proper spacing
+                        formula = f"y = {' '.join(terms)}"
+
+                    # Add regression line
+                    fig.add_trace(go.Scatter(
+                        x=X_sorted,
+                        y=y_pred_sorted,
+                        mode='lines',
+                        name=f'{degree_names[degree-1]} (R² = {r_squared:.3f})',
+                        line=dict(color=poly_colors[degree-1], width=2)
+                    ))
+
+                    # Add annotation for this degree
+                    annotations.append(
+                        f"<b>{degree_names[degree-1]}:</b><br>"
+                        f"{formula}<br>"
+                        f"R² = {r_squared:.3f}"
+                    )
+                except Exception as poly_e:
+                    print(f"Error fitting degree {degree} polynomial: {poly_e}")
+                    # Add error annotation for this degree
+                    annotations.append(
+                        f"<b>{degree_names[degree-1]}:</b><br>"
+                        f"Error fitting polynomial<br>"
+                        f"R² = N/A"
+                    )
+                report_step(set_progress, degree, 4)
+
+            # Update layout with increased height for legend and equations
+            fig.update_layout(
+                title={
+                    'text': get_text('regression_title', lang, y_var=y_var, x_var=x_var),
+                    'y': 0.95,
+                    'x': 0.5,
+                    'xanchor': 'center',
+                    'yanchor': 'top'
+                },
+                xaxis_title=x_var,
+                yaxis_title=y_var,
+                height=600,  # Increased height to accommodate legend and equations
+                showlegend=True,
+                legend=dict(
+                    orientation="h",
+                    yanchor="bottom",
+                    y=-0.2,  # Moved 2 lines below the graph
+                    xanchor="center",
+                    x=0.5
+                )
             )
-        )
 
-        # Store annotation text for later use
-        annotation_text = "<br><br>".join(annotations)
+            # The equations are cached and localized with the figure
+            return {'figure': fig, 'equations': "<br><br>".join(annotations)}
+
+        result = get_localized_figure(selected_keyword, selected_source_ids, ('regression', x_id, y_id),
+                                      language, build_regression)
+        fig, annotation_text = result['figure'], result['equations']
         print(f"Annotation text preview: {annotation_text[:200]}...")
 
-        print(f"Returning regression figure with {len(fig.data)} traces")
+        print(f"Returning regression figure with {len(fig.get('data', []))} traces")
         print(f"Equations content length: {len(annotation_text)}")
 
         # Create proper Dash components for HTML rendering
@@ -2979,14 +3158,23 @@ def update_navigation_visibility(selected_keyword, selected_sources, language):
 
 
 # Fourier Analysis callback
-@app.callback(
+@heavy_callback(
+    app, background_manager,
     Output('fourier-analysis-graph', 'figure'),
     [Input('fourier-source-select', 'value'),
-     Input('keyword-dropdown', 'value'),
-     Input('data-sources-store-v2', 'data'),
-     Input('language-store', 'data')]
+     section_visible('fourier')],
+    [State('keyword-dropdown', 'value'),
+     State('data-sources-store-v2', 'data'),
+     State('language-store', 'data')],
+    section='fourier',
+    cancel=SELECTION_INPUTS,
+    prevent_initial_call=True
 )
-def update_fourier_analysis(selected_source, selected_keyword, selected_sources, language):
+def update_fourier_analysis(set_progress, selected_source, visible, selected_keyword, selected_sources, language):
+    # Rendered once the section is scrolled into view
+    if not visible:
+        return no_update
+
     if selected_sources is None:
         selected_sources = []
 
@@ -3023,9 +3211,6 @@ def update_fourier_analysis(selected_source, selected_keyword, selected_sources,
         return go.Figure()
 
     try:
-        # Get data for the selected source
-        datasets_norm, _ = db_manager.get_data_for_keyword(selected_keyword, selected_source_ids)
-
         # DATAFRAME_INDEXING_FIX: Get the source key from display name
         # Create translation mapping to find the correct source ID
         translation_mapping = create_translation_mapping(selected_source_ids, language)
@@ -3038,166 +3223,147 @@ def update_fourier_analysis(selected_source, selected_keyword, selected_sources,
                 source_key = key
                 break
         
-        if source_key is None or source_key not in datasets_norm:
+        if source_key is None:
             print(f"Fourier: Could not find data for source '{selected_source}' (original: '{original_name}')")
             return go.Figure()
-            
-        # Get the data series
-        data = datasets_norm[source_key]
-        if data.empty:
-            print(f"Fourier: Data for source key {source_key} is empty")
-            return go.Figure()
 
-        # Extract values and remove NaN
-        values = data.iloc[:, 0].dropna().values
-        if len(values) < 10:  # Need minimum data points
-            return go.Figure()
+        def build_fourier_figure(lang):
+            # Periodogram precomputed by the database build; computed from the series on a miss
+            spectrum = get_precomputed_analytics(selected_keyword, [source_key], 'fourier')
+            if spectrum is None:
+                combined_dataset = dataset_service.get_combined(selected_keyword, selected_source_ids)
+                if dbase_options[source_key] not in combined_dataset.columns:
+                    print(f"Fourier: Data for source key {source_key} is empty")
+                    return go.Figure()
+
+                # Fewer than 10 points (or none) leave nothing to plot
+                spectrum = compute_fourier(combined_dataset[dbase_options[source_key]].dropna().values)
+                if spectrum is None:
+                    return go.Figure()
+            report_step(set_progress, 1, 2)
+
+            periods = spectrum['periods']
+            magnitude = spectrum['magnitude']
+            scaled_threshold = spectrum['threshold']  # Top 5% are significant
+
+            # Create figure
+            fig = go.Figure()
 
-        # PHASE 1 OPTIMIZATION: Add data size limits to prevent performance issues
-        MAX_FFT_SIZE = 10000
-        original_length = len(values)
-        if len(values) > MAX_FFT_SIZE:
-            # Downsample while preserving frequency content
-            downsample_factor = max(1, len(values) // MAX_FFT_SIZE)
-            values = values[::downsample_factor]
-            print(f"Fourier: Downsampled from {original_length} to {len(values)} points")
-
-        # PHASE 1 OPTIMIZATION: Single FFT calculation (removed duplicate)
-        from scipy.fft import fft, fftfreq
-        import numpy as np
-
-        # Apply FFT (only once now)
-        fft_values = fft(values)
-        freqs = fftfreq(len(values))
-
-        # Get magnitude (only positive frequencies)
-        n = len(values)
-        magnitude = np.abs(fft_values[:n//2])
-        frequencies = freqs[:n//2]
-
-        # Convert frequencies to periods (cycles per unit time)
-        # For monthly data, frequency represents cycles per month
-        periods = 1 / frequencies[1:]  # Skip DC component (freq=0)
-        magnitude = magnitude[1:]      # Skip DC component
-
-        # PHASE 1 OPTIMIZATION: Simplified significance threshold using percentiles
-        # Much faster than chi-squared distribution calculations
-        scaled_threshold = np.percentile(magnitude, 95)  # Top 5% are significant
-
-        # Create figure
-        fig = go.Figure()
+            # Determine significant components
+            significant_mask = magnitude >= scaled_threshold
+
+            # PHASE 1 OPTIMIZATION: Efficient stem plotting with controlled batching
+            # Separate significant and non-significant for better legend control
+            sig_periods = periods[significant_mask]
+            sig_magnitude = magnitude[significant_mask]
+            non_sig_periods = periods[~significant_mask]
+            non_sig_magnitude = magnitude[~significant_mask]
+
+            # Add stems for significant components (red) - batch add for performance
+            if len(sig_periods) > 0:
+                # Use bar chart for stems (much more efficient than individual lines)
+                fig.add_trace(go.Bar(
+                    x=sig_periods,
+                    y=sig_magnitude,
+                    name=get_text('significant_components', lang),
+                    marker_color='red',
+                    marker_line_width=2,
+                    marker_line_color='red',
+                    opacity=0.8,
+                    showlegend=True,
+                    width=[0.5] * len(sig_periods)  # Narrow bars for stem-like appearance
+                ))
 
-        # Determine significant components
-        significant_mask = magnitude >= scaled_threshold
-
-        # PHASE 1 OPTIMIZATION: Efficient stem plotting with controlled batching
-        # Separate significant and non-significant for better legend control
-        sig_periods = periods[significant_mask]
-        sig_magnitude = magnitude[significant_mask]
-        non_sig_periods = periods[~significant_mask]
-        non_sig_magnitude = magnitude[~significant_mask]
-
-        # Add stems for significant components (red) - batch add for performance
-        if len(sig_periods) > 0:
-            # Use bar chart for stems (much more efficient than individual lines)
-            fig.add_trace(go.Bar(
-                x=sig_periods,
-                y=sig_magnitude,
-                name=get_text('significant_components', language),
-                marker_color='red',
-                marker_line_width=2,
-                marker_line_color='red',
-                opacity=0.8,
-                showlegend=True,
-                width=[0.5] * len(sig_periods)  # Narrow bars for stem-like appearance
-            ))
+            # Add stems for non-significant components (grey)
+            if len(non_sig_periods) > 0:
+                fig.add_trace(go.Bar(
+                    x=non_sig_periods,
+                    y=non_sig_magnitude,
+                    name=get_text('non_significant_components', lang),
+                    marker_color='grey',
+                    marker_line_width=1,
+                    marker_line_color='grey',
+                    opacity=0.6,
+                    showlegend=True,
+                    width=[0.3] * len(non_sig_periods)  # Even narrower for less prominent
+                ))
 
-        # Add stems for non-significant components (grey)
-        if len(non_sig_periods) > 0:
-            fig.add_trace(go.Bar(
-                x=non_sig_periods,
-                y=non_sig_magnitude,
-                name=get_text('non_significant_components', language),
-                marker_color='grey',
-                marker_line_width=1,
-                marker_line_color='grey',
-                opacity=0.6,
-                showlegend=True,
-                width=[0.3] * len(non_sig_periods)  # Even narrower for less prominent
-            ))
+            # Add labels for significant components using text mode
+            if np.any(significant_mask):
+                fig.add_trace(go.Scatter(
+                    x=periods[significant_mask],
+                    y=magnitude[significant_mask] + max(magnitude) * 0.08,  # Position above markers
+                    mode='text',
+                    text=[f"{p:.1f}m" for p in periods[significant_mask]],
+                    textfont=dict(color='red', size=10, weight='bold'),
+                    showlegend=False
+                ))
 
-        # Add labels for significant components using text mode
-        if np.any(significant_mask):
+            # Add significance threshold line
             fig.add_trace(go.Scatter(
-                x=periods[significant_mask],
-                y=magnitude[significant_mask] + max(magnitude) * 0.08,  # Position above markers
-                mode='text',
-                text=[f"{p:.1f}m" for p in periods[significant_mask]],
-                textfont=dict(color='red', size=10, weight='bold'),
-                showlegend=False
+                x=[periods.min(), periods.max()],
+                y=[scaled_threshold, scaled_threshold],
+                mode='lines',
+                name=get_text('significance_threshold', lang),
+                line=dict(color='purple', width=2, dash='dot'),
+                showlegend=True
             ))
 
-        # Add significance threshold line
-        fig.add_trace(go.Scatter(
-            x=[periods.min(), periods.max()],
-            y=[scaled_threshold, scaled_threshold],
-            mode='lines',
-            name=get_text('significance_threshold', language),
-            line=dict(color='purple', width=2, dash='dot'),
-            showlegend=True
-        ))
-
-        # Add vertical reference lines for Trimestral, Semestral, Anual
-        v_lines = [3, 6, 12]
-        v_line_names = [get_text('quarterly', language), get_text('semiannual', language), get_text('annual', language)]
-        for val, name in zip(v_lines, v_line_names):
-            fig.add_vline(
-                x=val, line_width=1, line_dash="dash", line_color="blue",
-            )
-            fig.add_annotation(
-                x=val,
-                y=max(magnitude) * 0.85,
-                text=name,
-                showarrow=False,
-                xshift=10,
-                font=dict(color='blue', size=9)
-            )
+            # Add vertical reference lines for Trimestral, Semestral, Anual
+            v_lines = [3, 6, 12]
+            v_line_names = [get_text('quarterly', lang), get_text('semiannual', lang), get_text('annual', lang)]
+            for val, name in zip(v_lines, v_line_names):
+                fig.add_vline(
+                    x=val, line_width=1, line_dash="dash", line_color="blue",
+                )
+                fig.add_annotation(
+                    x=val,
+                    y=max(magnitude) * 0.85,
+                    text=name,
+                    showarrow=False,
+                    xshift=10,
+                    font=dict(color='blue', size=9)
+                )
 
-        # Legend is now handled by the bar traces above
-        # No need for additional dummy traces
+            # Legend is now handled by the bar traces above
+            # No need for additional dummy traces
 
 
-        # Update layout
-        fig.update_layout(
-            title={
-                'text': get_text('fourier_title', language, source=selected_source),
-                'y': 0.95,
-                'x': 0.5,
-                'xanchor': 'center',
-                'yanchor': 'top'
-            },
-            xaxis_title=get_text('period_months', language),
-            yaxis_title=get_text('magnitude', language),
-            height=500,
-            showlegend=True,
-            legend=dict(
-                orientation="h",
-                yanchor="bottom",
-                y=-0.3,  # Moved up 20 lines from -0.5
-                xanchor="center",
-                x=0.5
-            ),
-            xaxis=dict(
-                type='log',
-                range=[np.log10(max(1, periods.min())), np.log10(periods.max())],
-                tickformat=".0f"
-            ),
-            yaxis=dict(
-                autorange=True
+            # Update layout
+            fig.update_layout(
+                title={
+                    'text': get_text('fourier_title', lang, source=get_source_names([source_key], lang)[0]),
+                    'y': 0.95,
+                    'x': 0.5,
+                    'xanchor': 'center',
+                    'yanchor': 'top'
+                },
+                xaxis_title=get_text('period_months', lang),
+                yaxis_title=get_text('magnitude', lang),
+                height=500,
+                showlegend=True,
+                legend=dict(
+                    orientation="h",
+                    yanchor="bottom",
+                    y=-0.3,  # Moved up 20 lines from -0.5
+                    xanchor="center",
+                    x=0.5
+                ),
+                xaxis=dict(
+                    type='log',
+                    range=[np.log10(max(1, periods.min())), np.log10(periods.max())],
+                    tickformat=".0f"
+                ),
+                yaxis=dict(
+                    autorange=True
+                )
             )
-        )
-        
-        return fig
+
+            report_step(set_progress, 2, 2)
+            return fig
+
+        return get_localized_figure(selected_keyword, selected_source_ids, ('fourier', source_key),
+                                    language, build_fourier_figure)
 
     except Exception as e:
         return go.Figure()
@@ -0,0 +1,145 @@
+"""
+Background execution of the dashboard's heavy callbacks.
+
+Gunicorn serves the dashboard with sync workers, so a slow callback (seasonal
+decomposition, polynomial regression fits, periodograms) holds a whole worker
+while it computes and other users queue behind it. With background callbacks
+enabled, those callbacks are registered as Dash background callbacks on a
+DiskcacheManager: the request only starts a job in a separate process, and the
+browser polls for its progress and result, so the worker is free right away.
+A job is cancelled when the selection changes or when its callback fires again,
+and results are memoized in the job cache per data_version, so every worker
+reuses them.
+
+Background callbacks need dash[diskcache] (diskcache, multiprocess and psutil).
+When they are disabled or it is not installed, the callbacks run inline as
+before and their progress reports are ignored.
+"""
+
+import functools
+from pathlib import Path
+from typing import Any, Callable, List, Optional
+
+import dash_bootstrap_components as dbc
+from dash import Input, Output
+
+
+def create_background_manager(cache_dir: Path, data_version: Optional[Callable[[], str]] = None,
+                              expire: Optional[int] = None):
+    """
+    Create the manager running background callbacks.
+
+    Args:
+        cache_dir: Directory of the job cache, shared by all workers
+        data_version: Function returning the data_version the results depend on
+        expire: Seconds memoized results are kept (None keeps them until evicted)
+
+    Returns:
+        DiskcacheManager, or None if dash[diskcache] is not installed
+    """
+    try:
+        import diskcache
+        from dash import DiskcacheManager
+
+        cache_dir = Path(cache_dir)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        return DiskcacheManager(diskcache.Cache(str(cache_dir)),
+                                cache_by=[data_version] if data_version is not None else None,
+                                expire=expire)
+    except ImportError as e:
+        print(f"Warning: Background callbacks need dash[diskcache], running them inline: {e}")
+        return None
+
+
+def ignore_progress(progress: Any):
+    """set_progress of callbacks running inline."""
+
+
+def report_step(set_progress: Callable[[Any], None], step: int, steps: int):
+    """
+    Report the progress of a job to its section's progress bar.
+
+    Args:
+        set_progress: set_progress passed to the callback
+        step: Steps completed
+        steps: Total number of steps
+    """
+    set_progress((round(100 * step / steps), f"{step}/{steps}"))
+
+
+def section_progress_bar(section: str) -> dbc.Progress:
+    """
+    Progress bar of a section, shown while its background job runs.
+
+    Args:
+        section: Section ID
+
+    Returns:
+        Hidden progress bar
+    """
+    return dbc.Progress(id={'type': 'section-progress', 'section': section}, value=0, label="",
+                        striped=True, animated=True, style={'display': 'none'})
+
+
+def section_progress(section: str) -> List[Output]:
+    """
+    Progress outputs of a section: the value and label of its progress bar.
+
+    Args:
+        section: Section ID
+
+    Returns:
+        Outputs set by set_progress((value, label))
+    """
+    progress_id = {'type': 'section-progress', 'section': section}
+    return [Output(progress_id, 'value'), Output(progress_id, 'label')]
+
+
+def section_running(section: str) -> List[tuple]:
+    """
+    Outputs shown while a section's job runs: its progress bar.
+
+    Args:
+        section: Section ID
+
+    Returns:
+        (Output, value while running, value when done) tuples
+    """
+    progress_id = {'type': 'section-progress', 'section': section}
+    return [(Output(progress_id, 'style'), {'display': 'flex', 'height': '14px', 'marginBottom': '8px'},
+             {'display': 'none'})]
+
+
+def heavy_callback(app, manager, *args, section: str, cancel: Optional[List[Input]] = None, **kwargs):
+    """
+    Register a heavy callback, as a background callback when a manager is available.
+
+    The decorated function takes set_progress as its first argument, followed by
+    the callback's inputs and states. In the background it reports to the
+    section's progress bar; inline it gets ignore_progress. The decorator returns
+    the inline version, so the module-level name keeps the callback's signature.
+
+    Args:
+        app: Dash app
+        manager: Manager from create_background_manager, or None to run inline
+        *args: Outputs, inputs and states, as for app.callback
+        section: Section ID of the progress bar
+        cancel: Inputs whose changes cancel a running job
+        **kwargs: Other app.callback arguments
+
+    Returns:
+        Decorator registering the function and returning its inline version
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def run_inline(*values):
+            return func(ignore_progress, *values)
+
+        if manager is None:
+            app.callback(*args, **kwargs)(run_inline)
+        else:
+            app.callback(*args, background=True, manager=manager, progress=section_progress(section),
+                         running=section_running(section), cancel=cancel, **kwargs)(func)
+        return run_inline
+
+    return decorator
@@ -0,0 +1,344 @@
+"""
+Processed dataset cache shared by the dashboard's gunicorn workers.
+
+The dataset service (dataset_service.py) turns the rows of a (keyword, sources)
+selection into the combined dataset and its display copy. Each worker keeps the most recently used
+results in memory, in front of a directory of pickled results that every worker
+reads and writes, so the first load of a selection in any worker warms them all.
+
+The memory tier is bounded by bytes: entries are sized with
+DataFrame.memory_usage(deep=True) (the string columns of the display copy count
+at their real size) and the least recently used ones are evicted once the total
+exceeds max_bytes. Every entry remembers how long it took to build, so stats()
+reports the build time its hits saved along with hits, misses and evictions.
+
+Entries are keyed by keyword, sorted source IDs and the database's data_version,
+and stored under a subdirectory per data_version: publishing a new database
+makes the old entries unreachable, and the first time a worker stores a result
+for a version it deletes the subdirectories of older versions. Point the shared
+tier at a tmpfs (e.g. DASHBOARD_DATASET_CACHE_DIR=/dev/shm/dashboard-datasets) to
+keep it in memory.
+
+Shared entries are unpickled, so the directory is created private to the
+dashboard's user, and a directory that other users can write to is not used.
+"""
+
+import hashlib
+import os
+import pickle
+import shutil
+import stat
+import sys
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+import pandas as pd
+
+from config import get_config
+
+# Memory budget of a worker's cache when the configuration sets none
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def dataset_cache_key(keyword: str, source_ids: Iterable[int], data_version: str) -> Tuple[str, Tuple[int, ...], str]:
+    """
+    Build the cache key of a selection.
+
+    Args:
+        keyword: Selected tool
+        source_ids: Selected source IDs, in any order
+        data_version: data_version of the database the dataset was read from
+
+    Returns:
+        (keyword, sorted source IDs, data_version) tuple
+    """
+    return (keyword, tuple(sorted(int(source_id) for source_id in source_ids)), str(data_version))
+
+
+def value_nbytes(value: Any) -> int:
+    """
+    Estimate the memory held by a cached value.
+
+    DataFrames and Series are measured with memory_usage(deep=True), including
+    their index; tuples, lists and dicts are measured item by item.
+
+    Args:
+        value: Cached value
+
+    Returns:
+        Size in bytes
+    """
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(index=True, deep=True))
+    if isinstance(value, (tuple, list)):
+        return sys.getsizeof(value) + sum(value_nbytes(item) for item in value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(value_nbytes(item) for item in value.values())
+    return sys.getsizeof(value)
+
+
+class DatasetCache:
+    """
+    Per-worker LRU of processed datasets in front of a directory shared by all workers.
+
+    Values are stored and returned as is; callers must not modify them.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES, directory: Optional[Path] = None,
+                 max_entries: Optional[int] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            max_bytes: Memory budget of this worker's entries, in bytes
+            directory: Directory of the shared tier (None keeps the cache per worker)
+            max_entries: Optional limit on the number of entries kept in memory
+        """
+        self.max_bytes = max(0, int(max_bytes))
+        self.max_entries = max(1, int(max_entries)) if max_entries is not None else None
+        self.directory = Path(directory) if directory is not None else None
+        self._entries = OrderedDict()  # key -> (value, nbytes, build_seconds)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._pruned_version = None
+        self._warned_unsafe = False
+        self._reset_stats()
+
+    def _reset_stats(self):
+        """Reset hit and miss counters."""
+        self._stats = {"hits": 0, "misses": 0, "shared_hits": 0, "shared_writes": 0,
+                       "evictions": 0, "evicted_bytes": 0, "oversized": 0,
+                       "build_seconds": 0.0, "seconds_saved": 0.0}
+
+    def _shared_file(self, key: Tuple[str, Tuple[int, ...], str]) -> Optional[Path]:
+        """Path of the shared entry for a key, or None without a shared tier."""
+        if self.directory is None:
+            return None
+        keyword, source_ids, data_version = key
+        digest = hashlib.blake2b(f"{keyword}|{source_ids}".encode(), digest_size=12).hexdigest()
+        return self.directory / data_version / f"{digest}.pkl"
+
+    def _directory_is_private(self) -> bool:
+        """
+        Check that the shared directory exists and only this user can write to it.
+
+        Returns:
+            True if the shared tier can be read and written
+        """
+        try:
+            info = self.directory.stat()
+        except OSError:
+            return False
+        foreign_owner = hasattr(os, "getuid") and info.st_uid != os.getuid()
+        if info.st_mode & (stat.S_IWGRP | stat.S_IWOTH) or foreign_owner:
+            if not self._warned_unsafe:
+                self._warned_unsafe = True
+                print(f"Warning: Not using dataset cache directory {self.directory}: other users can write to it")
+            return False
+        return True
+
+    def _store(self, key: Tuple[str, Tuple[int, ...], str], value: Any, build_seconds: float):
+        """Insert into the memory tier and evict the least recently used entries. Caller holds the lock."""
+        nbytes = value_nbytes(value)
+        if key in self._entries:
+            self._bytes -= self._entries.pop(key)[1]
+        if nbytes > self.max_bytes:
+            # Keeping it would evict everything else; it is still served from the shared tier
+            self._stats["oversized"] += 1
+            return
+        self._entries[key] = (value, nbytes, build_seconds)
+        self._bytes += nbytes
+        while self._bytes > self.max_bytes or (self.max_entries is not None and len(self._entries) > self.max_entries):
+            _, (_, evicted_bytes, _) = self._entries.popitem(last=False)
+            self._bytes -= evicted_bytes
+            self._stats["evictions"] += 1
+            self._stats["evicted_bytes"] += evicted_bytes
+
+    def get(self, keyword: str, source_ids: Iterable[int], data_version: str) -> Optional[Any]:
+        """
+        Get a cached dataset from this worker's memory or the shared tier.
+
+        Args:
+            keyword: Selected tool
+            source_ids: Selected source IDs, in any order
+            data_version: data_version of the database being served
+
+        Returns:
+            Cached value, or None on a miss
+        """
+        key = dataset_cache_key(keyword, source_ids, data_version)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                value, _, build_seconds = self._entries[key]
+                self._stats["hits"] += 1
+                self._stats["seconds_saved"] += build_seconds
+                return value
+
+        shared_file = self._shared_file(key)
+        entry = None
+        if shared_file is not None and self._directory_is_private():
+            start = time.perf_counter()
+            try:
+                with open(shared_file, 'rb') as f:
+                    entry = pickle.load(f)
+                if not (isinstance(entry, dict) and "value" in entry):
+                    raise ValueError("unexpected entry format")
+            except FileNotFoundError:
+                entry = None
+            except Exception as e:
+                print(f"Warning: Ignoring unreadable dataset cache entry {shared_file.name}: {e}")
+                entry = None
+            load_seconds = time.perf_counter() - start
+
+        with self._lock:
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            build_seconds = float(entry.get("build_seconds", 0.0))
+            self._stats["hits"] += 1
+            self._stats["shared_hits"] += 1
+            self._stats["seconds_saved"] += max(0.0, build_seconds - load_seconds)
+            self._store(key, entry["value"], build_seconds)
+        return entry["value"]
+
+    def peek(self, keyword: str, source_ids: Iterable[int], data_version: str) -> Optional[Any]:
+        """
+        Get a dataset held in this worker's memory, without counting a lookup.
+
+        Args:
+            keyword: Selected tool
+            source_ids: Selected source IDs, in any order
+            data_version: data_version of the database being served
+
+        Returns:
+            Cached value, or None if this worker does not hold it
+        """
+        key = dataset_cache_key(keyword, source_ids, data_version)
+        with self._lock:
+            entry = self._entries.get(key)
+        return entry[0] if entry is not None else None
+
+    def put(self, keyword: str, source_ids: Iterable[int], data_version: str, value: Any,
+            build_seconds: float = 0.0):
+        """
+        Store a dataset in this worker's memory and in the shared tier.
+
+        Args:
+            keyword: Selected tool
+            source_ids: Selected source IDs, in any order
+            data_version: data_version of the database the dataset was read from
+            value: Picklable value to cache
+            build_seconds: Time it took to build the value, credited to later hits
+        """
+        key = dataset_cache_key(keyword, source_ids, data_version)
+        with self._lock:
+            self._stats["build_seconds"] += build_seconds
+            self._store(key, value, build_seconds)
+
+        shared_file = self._shared_file(key)
+        if shared_file is None:
+            return
+        try:
+            self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        except OSError as e:
+            print(f"Warning: Could not create dataset cache directory {self.directory}: {e}")
+            return
+        if not self._directory_is_private():
+            return
+        if self._pruned_version != key[2]:
+            self._prune_versions(key[2])
+        try:
+            shared_file.parent.mkdir(mode=0o700, exist_ok=True)
+            temp_file = shared_file.with_name(f"{shared_file.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(temp_file, 'wb') as f:
+                pickle.dump({"build_seconds": build_seconds, "value": value}, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_file, shared_file)
+            with self._lock:
+                self._stats["shared_writes"] += 1
+        except OSError as e:
+            print(f"Warning: Could not write dataset cache entry: {e}")
+
+    def _prune_versions(self, data_version: str):
+        """Delete the shared entries of data_versions older than the one being written."""
+        self._pruned_version = data_version
+        # data_version starts with its publication timestamp (see database.new_data_version), so
+        # names sort by age; a worker still serving an old version never removes a newer one
+        for version_dir in self.directory.iterdir():
+            if version_dir.is_dir() and version_dir.name < data_version:
+                shutil.rmtree(version_dir, ignore_errors=True)
+
+    def clear(self, shared: bool = False):
+        """
+        Drop all entries from this worker's memory and reset the counters.
+
+        Args:
+            shared: Also delete the shared tier
+        """
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._reset_stats()
+        if shared and self.directory is not None and self.directory.exists():
+            shutil.rmtree(self.directory, ignore_errors=True)
+        self._pruned_version = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by this worker's entries, in bytes."""
+        return self._bytes
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics of this worker.
+
+        Returns:
+            Dictionary with entry count, bytes held and budget, hit/miss/eviction
+            counters, hit rate and the build seconds spent and saved
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = len(self._entries)
+            stats["bytes"] = self._bytes
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+        stats["build_seconds"] = round(stats["build_seconds"], 3)
+        stats["seconds_saved"] = round(stats["seconds_saved"], 3)
+        stats["max_bytes"] = self.max_bytes
+        stats["max_entries"] = self.max_entries
+        stats["shared"] = str(self.directory) if self.directory is not None else None
+        stats["pid"] = os.getpid()
+        return stats
+
+
+# Global dataset cache instance
+_dataset_cache_instance = None
+
+def get_dataset_cache() -> DatasetCache:
+    """
+    Get the dataset cache, with the configured memory budget and shared directory.
+
+    Returns:
+        The global DatasetCache instance
+    """
+    global _dataset_cache_instance
+    if _dataset_cache_instance is None:
+        config = get_config()
+        _dataset_cache_instance = DatasetCache(max_bytes=config.dataset_cache_max_bytes,
+                                               directory=config.dataset_cache_path)
+    return _dataset_cache_instance
+
+def reset_dataset_cache():
+    """
+    Reset the global dataset cache instance.
+    """
+    global _dataset_cache_instance
+    _dataset_cache_instance = None
@@ -0,0 +1,258 @@
+"""
+Combined dataset service shared by the dashboard callbacks.
+
+A (keyword, sources) selection triggers the main content and the temporal,
+3D, seasonal, regression and Fourier callbacks at once, and each of them needs
+the same combined dataset: one row per date of any selected source, a 'Fecha'
+datetime column and one column per source with data, named after dbase_options.
+get_combined() builds it once per selection and data_version through the
+DatasetCache, and concurrent callbacks asking for a selection that is being
+built wait for that build instead of starting their own (single flight, per
+worker; other workers pick the result up from the shared tier).
+
+Returned frames are shared between callbacks and must not be modified in place.
+"""
+
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+import pandas as pd
+
+from dataset_cache import dataset_cache_key, get_dataset_cache
+
+
+def build_combined_dataset(db_manager, keyword: str, source_ids: Iterable[int],
+                           column_names: Dict[int, str]) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Read a selection from the database and build its combined dataset.
+
+    Args:
+        db_manager: DatabaseManager to read from
+        keyword: Selected tool
+        source_ids: Selected source IDs
+        column_names: Column name of each source ID
+
+    Returns:
+        Tuple of (combined dataset with a datetime 'Fecha' column, display copy
+        with 'Fecha' formatted as YYYY-MM-DD); both are empty without data
+    """
+    wide_dataset, valid_sources = db_manager.get_combined_data_for_keyword(
+        keyword, list(source_ids), column_names=column_names)
+    if wide_dataset.empty:
+        return pd.DataFrame(), pd.DataFrame()
+
+    combined_dataset = wide_dataset.reset_index()
+    date_column = combined_dataset.columns[0]
+    combined_dataset[date_column] = pd.to_datetime(combined_dataset[date_column])
+    combined_dataset = combined_dataset.rename(columns={date_column: 'Fecha'})
+
+    # Keep Fecha as datetime for calculations, format only for display in table
+    combined_dataset_fecha_formatted = combined_dataset.copy()
+    combined_dataset_fecha_formatted['Fecha'] = combined_dataset_fecha_formatted['Fecha'].dt.strftime('%Y-%m-%d')
+
+    # Filter out rows where ALL sources are NaN (preserve partial data)
+    data_columns = [column_names.get(source_id, source_id) for source_id in valid_sources]
+    combined_dataset = combined_dataset.dropna(subset=data_columns, how='all')
+    return combined_dataset, combined_dataset_fecha_formatted
+
+
+def slice_months(combined_dataset: pd.DataFrame, start_date=None, end_date=None,
+                 last_years: Optional[int] = None) -> pd.DataFrame:
+    """
+    Restrict a combined dataset to a date range.
+
+    A start date in the middle of a month excludes that month (see
+    date_to_month_bound), an end date includes it, and last_years counts back
+    from end_date or the latest date of the dataset. Sources without values in
+    the range are dropped.
+
+    Args:
+        combined_dataset: Frame returned by DatasetService.get_combined
+        start_date: Optional first date to include
+        end_date: Optional last date to include
+        last_years: Optional number of years to keep
+
+    Returns:
+        Rows in the range, in date order with a fresh index
+    """
+    from database import date_to_month_bound
+
+    if combined_dataset.empty:
+        return combined_dataset
+
+    dates = combined_dataset['Fecha']
+    months = dates.dt.year * 12 + dates.dt.month - 1
+    first_month = date_to_month_bound(start_date) if start_date is not None else months.min()
+    last_month = date_to_month_bound(end_date, upper=True) if end_date is not None else months.max()
+    if last_years is not None:
+        first_month = max(first_month, last_month - 12 * int(last_years))
+
+    sliced = combined_dataset[(months >= first_month) & (months <= last_month)]
+    data_columns = [column for column in sliced.columns if column != 'Fecha' and sliced[column].notna().any()]
+    if not data_columns:
+        return combined_dataset.iloc[0:0]
+    sliced = sliced[['Fecha'] + data_columns].dropna(subset=data_columns, how='all')
+    return sliced.sort_values('Fecha').reset_index(drop=True)
+
+
+class _Flight:
+    """A build in progress that other callers wait on."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class DatasetService:
+    """
+    Memoized, single-flight access to the combined datasets of the dashboard selections.
+    """
+
+    def __init__(self, db_manager, column_names: Dict[int, str], cache=None):
+        """
+        Initialize the service.
+
+        Args:
+            db_manager: DatabaseManager to read from
+            column_names: Column name of each source ID (dbase_options)
+            cache: DatasetCache holding the built datasets (defaults to the global one)
+        """
+        self.db_manager = db_manager
+        self.column_names = dict(column_names)
+        self.cache = cache if cache is not None else get_dataset_cache()
+        self._lock = threading.Lock()
+        self._in_flight = {}
+        self._stats = {"builds": 0, "coalesced": 0}
+
+    def _get_entry(self, keyword: str, source_ids: Iterable[int]) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """Get the cached (combined, display) pair of a selection, building it once if needed."""
+        source_ids = list(source_ids)
+        data_version = self.db_manager.get_data_version()
+        key = dataset_cache_key(keyword, source_ids, data_version)
+
+        with self._lock:
+            flight = self._in_flight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._in_flight[key] = _Flight()
+            else:
+                self._stats["coalesced"] += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            value = self.cache.get(keyword, source_ids, data_version)
+            if value is None:
+                start = time.perf_counter()
+                value = build_combined_dataset(self.db_manager, keyword, source_ids, self.column_names)
+                self.cache.put(keyword, source_ids, data_version, value,
+                               build_seconds=time.perf_counter() - start)
+                with self._lock:
+                    self._stats["builds"] += 1
+            flight.value = value
+            return value
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+            flight.done.set()
+
+    def get_combined(self, keyword: str, source_ids: Iterable[int]) -> pd.DataFrame:
+        """
+        Get the combined dataset of a selection.
+
+        Args:
+            keyword: Selected tool
+            source_ids: Selected source IDs, in any order
+
+        Returns:
+            Frame with a datetime 'Fecha' column and one column per source with
+            data, in selection order; empty if the keyword has no data
+        """
+        source_ids = list(source_ids)
+        return self._in_selection_order(self._get_entry(keyword, source_ids)[0], source_ids)
+
+    def get_cached_combined(self, keyword: str, source_ids: Iterable[int]) -> Optional[pd.DataFrame]:
+        """
+        Get the combined dataset of a selection only if this worker already holds it.
+
+        Args:
+            keyword: Selected tool
+            source_ids: Selected source IDs, in any order
+
+        Returns:
+            Same frame as get_combined, or None if it would have to be loaded or built
+        """
+        source_ids = list(source_ids)
+        entry = self.cache.peek(keyword, source_ids, self.db_manager.get_data_version())
+        return self._in_selection_order(entry[0], source_ids) if entry is not None else None
+
+    def get_display_table(self, keyword: str, source_ids: Iterable[int]) -> pd.DataFrame:
+        """
+        Get the combined dataset of a selection with 'Fecha' formatted for display.
+
+        Args:
+            keyword: Selected tool
+            source_ids: Selected source IDs, in any order
+
+        Returns:
+            Frame with 'Fecha' as YYYY-MM-DD strings; empty if the keyword has no data
+        """
+        source_ids = list(source_ids)
+        return self._in_selection_order(self._get_entry(keyword, source_ids)[1], source_ids)
+
+    def _in_selection_order(self, frame: pd.DataFrame, source_ids: Iterable[int]) -> pd.DataFrame:
+        """Order the source columns as in the selection (cache entries are shared by every order)."""
+        columns = ['Fecha'] + [self.column_names.get(source_id, source_id) for source_id in source_ids
+                               if self.column_names.get(source_id, source_id) in frame.columns]
+        if frame.empty or list(frame.columns) == columns:
+            return frame
+        return frame[columns]
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get the dataset cache statistics with the service's build counters.
+
+        Returns:
+            DatasetCache.stats() plus "builds" and "coalesced" (callers that waited
+            on another caller's build)
+        """
+        stats = self.cache.stats()
+        with self._lock:
+            stats.update(self._stats)
+            stats["in_flight"] = len(self._in_flight)
+        return stats
+
+
+# Global dataset service instance
+_dataset_service_instance = None
+
+def get_dataset_service() -> DatasetService:
+    """
+    Get the dataset service of the global database manager and dataset cache.
+
+    Returns:
+        The global DatasetService instance
+    """
+    global _dataset_service_instance
+    if _dataset_service_instance is None:
+        from database import get_database_manager
+        from fix_source_mapping import DBASE_OPTIONS
+
+        _dataset_service_instance = DatasetService(get_database_manager(), DBASE_OPTIONS)
+    return _dataset_service_instance
+
+def reset_dataset_service():
+    """
+    Reset the global dataset service instance.
+    """
+    global _dataset_service_instance
+    _dataset_service_instance = None
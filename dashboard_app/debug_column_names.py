@@ -77,8 +77,7 @@ def debug_column_names():
             print(f"  {key}")
         
         # Create combined dataset
-        from app import create_combined_dataset2
-        combined_dataset = create_combined_dataset2(datasets_norm=datasets_norm, selected_sources=sl_sc, dbase_options=dbase_options)
+        combined_dataset, _ = db_manager.get_combined_data_for_keyword(selected_keyword, sl_sc, dbase_options)
         
         print("\nActual DataFrame columns:")
         for col in combined_dataset.columns:
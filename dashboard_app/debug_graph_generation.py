@@ -27,7 +27,6 @@ from fix_source_mapping import map_display_names_to_source_ids, DBASE_OPTIONS
 from app import (
     create_temporal_2d_figure,
     create_mean_analysis_figure,
-    create_combined_dataset2,
     create_correlation_heatmap,
     create_pca_figure
 )
@@ -88,11 +87,11 @@ def test_data_processing(datasets_norm, valid_sources):
 
         # Create combined dataset
         print("Creating combined dataset...")
-        combined_dataset = create_combined_dataset2(
-            datasets_norm=datasets_norm,
-            selected_sources=valid_sources,
-            dbase_options=DBASE_OPTIONS
-        )
+        combined_dataset = pd.concat(
+            {DBASE_OPTIONS.get(source, source): datasets_norm[source].iloc[:, 0]
+             for source in valid_sources if source in datasets_norm},
+            axis=1
+        ).sort_index()
 
         print(f"Raw combined dataset shape: {combined_dataset.shape}")
         print(f"Raw combined dataset columns: {list(combined_dataset.columns)}")
@@ -0,0 +1,195 @@
+"""
+Language-neutral figure cache of the dashboard.
+
+Switching the dashboard language re-runs every figure callback, but only the
+titles, axis labels, legend and hover texts change. Figures are built once per
+(keyword, sources, view, data_version) with translations.PLACEHOLDER_LANGUAGE, so
+get_text leaves placeholders and source names keep their database form, and the
+figure JSON is kept in a per-worker LRU bounded by bytes. Every request decodes
+the JSON and runs localize_text over its strings for the requested language,
+which takes milliseconds instead of repeating the computations.
+
+Builders must take the language as their only argument and derive every
+displayed text from it (get_text, translate_source_name); texts that do not go
+through them are kept as built. A builder may also return a dictionary of
+figures and texts (e.g. a figure with its equations), localized as a whole.
+"""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Tuple
+
+from plotly.io.json import to_json_plotly
+
+from config import get_config
+from translations import PLACEHOLDER_LANGUAGE, localize_text
+
+# Memory budget of a worker's figure cache when the configuration sets none
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+
+def figure_cache_key(keyword: str, source_ids: Iterable[int], view: Any, data_version: str) -> Tuple:
+    """
+    Build the cache key of a figure.
+
+    Args:
+        keyword: Selected tool
+        source_ids: Selected source IDs, in selection order (it sets the trace order)
+        view: Figure identifier, with any parameters that change it (e.g. ('seasonal', 3))
+        data_version: data_version of the database the figure was computed from
+
+    Returns:
+        Hashable key
+    """
+    return (keyword, tuple(int(source_id) for source_id in source_ids), view, str(data_version))
+
+
+def localize_figure(figure: Any, language: str) -> Any:
+    """
+    Localize every string of a decoded language-neutral figure.
+
+    Args:
+        figure: Figure dictionary (or any part of it)
+        language: Language code ('es' or 'en')
+
+    Returns:
+        Figure with placeholders resolved and source names translated
+    """
+    if isinstance(figure, str):
+        return localize_text(figure, language)
+    if isinstance(figure, dict):
+        return {name: localize_figure(value, language) for name, value in figure.items()}
+    if isinstance(figure, list):
+        return [localize_figure(value, language) for value in figure]
+    return figure
+
+
+class FigureCache:
+    """
+    Per-worker LRU of language-neutral figure JSON, bounded by bytes.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialize the cache.
+
+        Args:
+            max_bytes: Memory budget of the stored figure JSON, in bytes
+        """
+        self.max_bytes = max(0, int(max_bytes))
+        self._entries = OrderedDict()  # key -> (figure JSON, build_seconds)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._reset_stats()
+
+    def _reset_stats(self):
+        """Reset hit and miss counters."""
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "oversized": 0,
+                       "build_seconds": 0.0, "seconds_saved": 0.0, "localize_seconds": 0.0}
+
+    def _store(self, key: Tuple, figure_json: str, build_seconds: float):
+        """Insert an entry and evict the least recently used ones. Caller holds the lock."""
+        nbytes = len(figure_json)
+        if key in self._entries:
+            self._bytes -= len(self._entries.pop(key)[0])
+        if nbytes > self.max_bytes:
+            self._stats["oversized"] += 1
+            return
+        self._entries[key] = (figure_json, build_seconds)
+        self._bytes += nbytes
+        while self._bytes > self.max_bytes:
+            _, (evicted_json, _) = self._entries.popitem(last=False)
+            self._bytes -= len(evicted_json)
+            self._stats["evictions"] += 1
+
+    def get_figure(self, key: Tuple, build: Callable[[str], Any], language: str) -> Dict[str, Any]:
+        """
+        Get a figure in the requested language, building it once on a miss.
+
+        Args:
+            key: Key from figure_cache_key
+            build: Function building the figure (or a dictionary of figures and
+                texts) for a language code
+            language: Language code ('es' or 'en')
+
+        Returns:
+            Localized figure dictionary, ready for a dcc.Graph figure property
+            (or the localized dictionary the builder returned)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                self._stats["seconds_saved"] += entry[1]
+
+        if entry is None:
+            start = time.perf_counter()
+            figure_json = to_json_plotly(build(PLACEHOLDER_LANGUAGE))
+            build_seconds = time.perf_counter() - start
+            with self._lock:
+                self._stats["misses"] += 1
+                self._stats["build_seconds"] += build_seconds
+                self._store(key, figure_json, build_seconds)
+        else:
+            figure_json = entry[0]
+
+        start = time.perf_counter()
+        figure = localize_figure(json.loads(figure_json), language)
+        with self._lock:
+            self._stats["localize_seconds"] += time.perf_counter() - start
+        return figure
+
+    def clear(self):
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._reset_stats()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics of this worker.
+
+        Returns:
+            Dictionary with entry count, bytes held and budget, hit/miss/eviction
+            counters, hit rate, and the seconds spent building, saved and localizing
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = len(self._entries)
+            stats["bytes"] = self._bytes
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+        for name in ("build_seconds", "seconds_saved", "localize_seconds"):
+            stats[name] = round(stats[name], 3)
+        stats["max_bytes"] = self.max_bytes
+        return stats
+
+
+# Global figure cache instance
+_figure_cache_instance = None
+
+def get_figure_cache() -> FigureCache:
+    """
+    Get the figure cache, with the configured memory budget.
+
+    Returns:
+        The global FigureCache instance
+    """
+    global _figure_cache_instance
+    if _figure_cache_instance is None:
+        _figure_cache_instance = FigureCache(max_bytes=get_config().figure_cache_max_bytes)
+    return _figure_cache_instance
+
+def reset_figure_cache():
+    """
+    Reset the global figure cache instance.
+    """
+    global _figure_cache_instance
+    _figure_cache_instance = None
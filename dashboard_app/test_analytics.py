@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Tests for the analytics precomputed by the database build.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from sklearn.decomposition import PCA
+from sklearn.preprocessing import StandardScaler
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analytics import build_analytics, pca_components_for, source_set_mask
+from database import DatabaseManager
+
+
+class TestPrecomputedAnalytics(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_manager = DatabaseManager(db_path=Path(self.tmp_dir.name) / "analytics.db")
+        self.db_manager.create_schema()
+
+        rng = np.random.default_rng(7)
+        months = pd.date_range("2000-01-01", periods=60, freq="MS")
+        self.series = {
+            1: pd.Series(50 + 10 * np.sin(np.arange(60) * np.pi / 6) + rng.normal(0, 2, 60), index=months),
+            4: pd.Series(rng.uniform(0, 30, 48), index=months[12:]),
+            3: pd.Series(rng.uniform(20, 80, 40), index=months[:40]),
+        }
+        for source_id, table in ((1, "google_trends"), (4, "crossref"), (3, "bain_usability")):
+            self.db_manager.insert_data_batch(table, [
+                (date.strftime("%Y-%m-%d"), "Benchmarking", float(value))
+                for date, value in self.series[source_id].items()
+            ])
+
+    def tearDown(self):
+        self.db_manager.close()
+        self.tmp_dir.cleanup()
+
+    def test_artifacts_match_live_computation(self):
+        result = build_analytics(self.db_manager)
+        self.assertEqual((result["computed"], result["up_to_date"]), (1, 0))
+        self.assertEqual(build_analytics(self.db_manager)["computed"], 0)
+
+        # Selection order and sources without data (Google Books) do not change the key
+        selection = [4, 2, 1]
+        data = pd.concat([self.series[4], self.series[1]], axis=1, keys=[4, 1], sort=True).dropna(how="all")
+
+        correlation = self.db_manager.get_analytics("Benchmarking", selection, "correlation")
+        self.assertEqual(correlation["sources"], [1, 4])
+        np.testing.assert_allclose(correlation["matrix"][::-1, ::-1], data.corr().to_numpy(), atol=1e-12)
+
+        pca = PCA().fit(StandardScaler().fit_transform(data.dropna()))
+        payload = self.db_manager.get_analytics("Benchmarking", selection, "pca")
+        np.testing.assert_allclose(pca_components_for(payload, [4, 1]), pca.components_, atol=1e-9)
+
+        annual = self.db_manager.get_analytics("Benchmarking", selection, "annual")
+        crossref = annual["values"][:, annual["sources"].index(4)]
+        np.testing.assert_array_equal(crossref, data[4].resample("YE").sum().to_numpy())
+        self.assertEqual(crossref[0], 0.0)  # 2000 is covered by Google Trends only
+
+        seasonal = self.db_manager.get_analytics("Benchmarking", [1], "seasonal")
+        self.assertEqual(len(seasonal["trend"]), 60)
+        self.assertTrue(np.isnan(seasonal["trend"][0]))
+        self.assertAlmostEqual(self.db_manager.get_analytics("Benchmarking", [1], "fourier")["periods"][4], 12.0)
+
+    def test_data_writes_drop_stale_artifacts(self):
+        build_analytics(self.db_manager)
+        self.db_manager.replace_series("crossref", "Benchmarking", [("2005-01-01", "Benchmarking", 1.0)])
+
+        self.assertIsNone(self.db_manager.get_analytics("Benchmarking", [1], "seasonal"))
+        self.assertEqual(self.db_manager.get_analytics_keywords(), set())
+        self.assertEqual(build_analytics(self.db_manager)["computed"], 1)
+        self.assertIsNone(self.db_manager.get_analytics("Benchmarking", [4], "seasonal"))  # 1 point left
+        self.assertEqual(source_set_mask([4, 1]), 0b1001)
+
+
+if __name__ == '__main__':
+    unittest.main()
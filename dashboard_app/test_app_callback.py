@@ -15,8 +15,7 @@ from fix_source_mapping import map_display_names_to_source_ids, DBASE_OPTIONS as
 # Import the figure creation functions
 from app import (
     create_temporal_2d_figure,
-    create_mean_analysis_figure,
-    create_combined_dataset2
+    create_mean_analysis_figure
 )
 
 def test_main_callback():
@@ -56,10 +55,8 @@ def test_main_callback():
 
         # Create combined dataset (same as callback)
         print("Creating combined dataset...")
-        combined_dataset = create_combined_dataset2(
-            datasets_norm=datasets_norm,
-            selected_sources=sl_sc,
-            dbase_options=dbase_options
+        combined_dataset, _ = db_manager.get_combined_data_for_keyword(
+            selected_keyword, selected_source_ids, dbase_options
         )
 
         # Process data (same as callback)
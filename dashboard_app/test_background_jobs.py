@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Tests for the registration of heavy callbacks as background jobs.
+"""
+
+import os
+import sys
+import unittest
+
+from dash import Input, Output
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from background_jobs import heavy_callback, ignore_progress, report_step
+
+
+class RecordingApp:
+    """Records the callbacks registered through app.callback."""
+
+    def __init__(self):
+        self.registered = []
+
+    def callback(self, *args, **kwargs):
+        def register(func):
+            self.registered.append((args, kwargs, func))
+            return func
+        return register
+
+
+def seasonal(set_progress, selected_source, visible):
+    report_step(set_progress, 1, 2)
+    return set_progress, selected_source, visible
+
+
+class TestHeavyCallback(unittest.TestCase):
+
+    def setUp(self):
+        self.app = RecordingApp()
+        self.outputs = (Output('seasonal-analysis-graph', 'figure'), Input('seasonal-source-select', 'value'))
+
+    def test_runs_inline_without_a_manager(self):
+        callback = heavy_callback(self.app, None, *self.outputs, section='seasonal',
+                                  prevent_initial_call=True)(seasonal)
+
+        args, kwargs, registered = self.app.registered[0]
+        self.assertEqual((args, kwargs), (self.outputs, {'prevent_initial_call': True}))
+        self.assertEqual(registered("Google Trends", True), (ignore_progress, "Google Trends", True))
+        self.assertEqual(callback("Google Trends", True), (ignore_progress, "Google Trends", True))
+
+    def test_registers_a_background_callback_with_a_manager(self):
+        manager = object()
+        cancel = [Input('keyword-dropdown', 'value')]
+        callback = heavy_callback(self.app, manager, *self.outputs, section='seasonal', cancel=cancel)(seasonal)
+
+        _, kwargs, registered = self.app.registered[0]
+        self.assertIs(registered, seasonal)
+        self.assertTrue(kwargs['background'])
+        self.assertIs(kwargs['manager'], manager)
+        self.assertEqual(kwargs['cancel'], cancel)
+        self.assertEqual([output.component_property for output in kwargs['progress']], ['value', 'label'])
+        self.assertEqual(kwargs['running'][0][0].component_id, {'type': 'section-progress', 'section': 'seasonal'})
+
+        # The module-level callback keeps the inline signature
+        progress = []
+        self.assertEqual(seasonal(progress.append, "Crossref.org", True)[1:], ("Crossref.org", True))
+        self.assertEqual(progress, [(50, "1/2")])
+        self.assertEqual(callback("Crossref.org", True)[1:], ("Crossref.org", True))
+
+
+if __name__ == '__main__':
+    unittest.main()
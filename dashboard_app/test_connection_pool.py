@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Tests for the pooled SQLite connections used by DatabaseManager.
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database import ConnectionPool, DatabaseManager
+
+
+class TestConnectionPool(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_manager = DatabaseManager(db_path=Path(self.tmp_dir.name) / "pool.db")
+
+    def tearDown(self):
+        self.db_manager.close()
+        self.tmp_dir.cleanup()
+
+    def test_connections_are_reused(self):
+        """Sequential requests should get the same warm connection back."""
+        with self.db_manager.get_connection() as first:
+            pass
+        with self.db_manager.get_connection() as second:
+            cache_size = second.execute("PRAGMA cache_size").fetchone()[0]
+
+        self.assertIs(first, second)
+        self.assertEqual(cache_size, -64000)
+        stats = self.db_manager.get_pool_stats()
+        self.assertEqual(stats["created"], 1)
+        self.assertEqual(stats["acquisitions"], 2)
+        self.assertEqual(stats["idle_connections"], 1)
+
+    def test_pool_is_bounded_and_records_waits(self):
+        """A full pool blocks callers until a connection is returned."""
+        pool = ConnectionPool(lambda: self.db_manager._create_connection(), max_connections=1, timeout=2.0)
+        held = pool.acquire()
+
+        def give_back():
+            time.sleep(0.2)
+            pool.release(held)
+
+        releaser = threading.Thread(target=give_back)
+        releaser.start()
+        conn = pool.acquire()
+        releaser.join()
+
+        self.assertIs(conn, held)
+        stats = pool.stats()
+        self.assertEqual(stats["waits"], 1)
+        self.assertGreaterEqual(stats["max_wait_time"], 0.15)
+        pool.release(conn)
+        pool.close_all()
+
+    def test_acquire_times_out(self):
+        pool = ConnectionPool(lambda: self.db_manager._create_connection(), max_connections=1, timeout=0.1)
+        conn = pool.acquire()
+        with self.assertRaises(TimeoutError):
+            pool.acquire()
+        self.assertEqual(pool.stats()["timeouts"], 1)
+        pool.release(conn)
+        pool.close_all()
+
+    def test_broken_connection_is_replaced(self):
+        """Idle connections failing the health check are discarded."""
+        pool = ConnectionPool(lambda: self.db_manager._create_connection(),
+                              max_connections=2, health_check_interval=0.0)
+        conn = pool.acquire()
+        pool.release(conn)
+        conn.close()
+
+        replacement = pool.acquire()
+        self.assertIsNot(replacement, conn)
+        self.assertEqual(replacement.execute("SELECT 1").fetchone()[0], 1)
+        stats = pool.stats()
+        self.assertEqual(stats["health_check_failures"], 1)
+        self.assertEqual(stats["open_connections"], 1)
+        pool.release(replacement)
+        pool.close_all()
+
+    def test_close_all_retires_connections_in_use(self):
+        with self.db_manager.get_connection() as conn:
+            self.db_manager.close()
+        with self.db_manager.get_connection() as fresh:
+            self.assertIsNot(fresh, conn)
+        self.assertEqual(self.db_manager.get_pool_stats()["open_connections"], 1)
+
+    def test_repeated_close_all_keeps_the_pool_bounded(self):
+        pool = ConnectionPool(lambda: self.db_manager._create_connection(), max_connections=2, timeout=0.1)
+        held = pool.acquire()
+        pool.close_all()
+        pool.close_all()
+        self.assertEqual(pool.stats()["open_connections"], 0)
+
+        pool.release(held)
+        conns = [pool.acquire(), pool.acquire()]
+        with self.assertRaises(TimeoutError):
+            pool.acquire()
+        for conn in conns:
+            pool.release(conn)
+        pool.close_all()
+
+
+if __name__ == '__main__':
+    unittest.main()
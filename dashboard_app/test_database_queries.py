@@ -0,0 +1,549 @@
+#!/usr/bin/env python3
+"""
+Tests for the DatabaseManager read paths used by the dashboard callbacks.
+"""
+
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database import (SCHEMA_VERSION, DatabaseManager, ReadOnlyDatabaseError, date_to_month, months_to_index,
+                      schema_version_key)
+from notes_index import NotesIndex
+from query_metrics import InProcessQueryMetrics, QueryMetricsSink, create_metrics_sink
+
+
+class TestDatabaseQueries(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_manager = DatabaseManager(db_path=Path(self.tmp_dir.name) / "queries.db")
+        self.db_manager.create_schema()
+        self.db_manager.insert_data_batch("google_trends", [
+            ("2000-01-01", "Benchmarking", 10.0),
+            ("2000-02-01", "Benchmarking", 20.0),
+            ("2000-03-01", "Benchmarking", 30.0),
+            ("2000-01-01", "Outsourcing", 99.0),
+        ])
+        self.db_manager.insert_data_batch("bain_usability", [
+            ("2000-02-01", "Benchmarking", 55.5),
+            ("2000-04-01", "Benchmarking", 66.5),
+        ])
+
+    def tearDown(self):
+        self.db_manager.close()
+        self.tmp_dir.cleanup()
+
+    def test_combined_fetch_matches_per_source_fetch(self):
+        """The wide frame is the outer join of the per-source frames, in source order."""
+        names = {1: "Google Trends", 3: "Bain - Usabilidad", 4: "Crossref.org"}
+        wide, valid_sources = self.db_manager.get_combined_data_for_keyword(
+            "Benchmarking", [3, 4, 1], column_names=names)
+
+        datasets_norm, expected_sources = self.db_manager.get_data_for_keyword("Benchmarking", [3, 4, 1])
+        expected = pd.concat(
+            [datasets_norm[src].iloc[:, 0].rename(names[src]) for src in expected_sources], axis=1, sort=True
+        ).sort_index()
+
+        self.assertEqual(valid_sources, expected_sources)
+        self.assertEqual(valid_sources, [3, 1])
+        self.assertEqual(list(wide.columns), ["Bain - Usabilidad", "Google Trends"])
+        pd.testing.assert_frame_equal(wide, expected, check_names=False, check_freq=False)
+        self.assertTrue(np.isnan(wide.loc["2000-01-01", "Bain - Usabilidad"]))
+
+    def test_combined_fetch_without_data(self):
+        wide, valid_sources = self.db_manager.get_combined_data_for_keyword("Unknown", [1, 2])
+        self.assertTrue(wide.empty)
+        self.assertEqual(valid_sources, [])
+
+    def test_month_ordinals_round_trip(self):
+        self.assertEqual(date_to_month("2004-01-01"), 2004 * 12)
+        self.assertEqual(date_to_month(pd.Timestamp("1993-12-01")), 1993 * 12 + 11)
+        with self.assertRaises(ValueError):
+            date_to_month("2004-01-15")
+        index = months_to_index([date_to_month("1950-01-01"), date_to_month("2023-12-01")])
+        self.assertEqual(list(index), [pd.Timestamp("1950-01-01"), pd.Timestamp("2023-12-01")])
+
+    def test_stats_and_keywords_use_dictionary(self):
+        self.assertEqual(self.db_manager.get_keywords_list(), ["Benchmarking", "Outsourcing"])
+        self.assertEqual(self.db_manager.get_keywords_list(source_id=3), ["Benchmarking"])
+        stats = self.db_manager.get_table_stats()["google_trends"]
+        self.assertEqual(stats["row_count"], 4)
+        self.assertEqual(stats["keyword_count"], 2)
+        self.assertEqual((stats["min_date"], stats["max_date"]), ("2000-01-01", "2000-03-01"))
+        self.assertEqual(self.db_manager.get_table_stats(), self.db_manager._scan_table_stats())
+
+    def test_series_stats_follow_inserts(self):
+        series = self.db_manager.get_series_stats("Benchmarking")
+        self.assertEqual(sorted(series), [1, 3])
+        self.assertEqual(series[1]["row_count"], 3)
+        self.assertEqual((series[1]["first_date"], series[1]["last_date"]), ("2000-01-01", "2000-03-01"))
+        self.assertEqual((series[1]["min"], series[1]["max"], series[1]["mean"]), (10.0, 30.0, 20.0))
+        original_hash = series[1]["content_hash"]
+
+        # Replacing a value updates the aggregates and the content hash
+        self.db_manager.insert_data_batch("google_trends", [("2000-02-01", "Benchmarking", 50.0)])
+        updated = self.db_manager.get_series_stats("Benchmarking", [1])[1]
+        self.assertEqual((updated["row_count"], updated["max"]), (3, 50.0))
+        self.assertNotEqual(updated["content_hash"], original_hash)
+        self.assertEqual(self.db_manager.get_series_stats("Outsourcing")[1]["row_count"], 1)
+
+        self.db_manager.clear_table("google_trends")
+        self.assertEqual(list(self.db_manager.get_series_stats("Benchmarking")), [3])
+        self.assertEqual(self.db_manager.get_table_stats()["google_trends"]["row_count"], 0)
+
+    def test_date_bounds_without_data_transfer(self):
+        bounds = self.db_manager.get_date_bounds("Benchmarking", [3, 4, 1])
+        self.assertEqual(list(bounds), [3, 1])
+        self.assertEqual(bounds[1], (pd.Timestamp("2000-01-01"), pd.Timestamp("2000-03-01"), 3))
+        self.assertEqual(bounds[3], (pd.Timestamp("2000-02-01"), pd.Timestamp("2000-04-01"), 2))
+        self.assertEqual(self.db_manager.get_date_bounds("Unknown", [1]), {})
+
+
+class TestSchemaMigration(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = Path(self.tmp_dir.name) / "legacy.db"
+
+        # Schema 1.0 layout: text dates and keywords in every row
+        with sqlite3.connect(str(self.db_path)) as conn:
+            conn.execute("CREATE TABLE metadata (key TEXT PRIMARY KEY, value TEXT)")
+            conn.execute("INSERT INTO metadata VALUES ('schema_version', '1.0')")
+            for table in ("google_trends", "crossref"):
+                conn.execute(f"CREATE TABLE {table} (date TEXT NOT NULL, keyword TEXT NOT NULL, "
+                             f"value REAL NOT NULL, PRIMARY KEY (date, keyword))")
+                conn.execute(f"CREATE INDEX idx_{table}_keyword ON {table}(keyword)")
+            conn.executemany("INSERT INTO google_trends VALUES (?, ?, ?)", [
+                ("2004-01-01", "Benchmarking", 1.5), ("2004-02-01", "Benchmarking", 2.5),
+                ("2004-01-01", "Outsourcing", 3.5),
+            ])
+            conn.execute("INSERT INTO crossref VALUES ('1950-06-01', 'Outsourcing', 0.25)")
+
+        self.db_manager = DatabaseManager(db_path=self.db_path)
+
+    def tearDown(self):
+        self.db_manager.close()
+        self.tmp_dir.cleanup()
+
+    def test_migration_preserves_data(self):
+        self.assertTrue(self.db_manager.needs_migration())
+        migrated = self.db_manager.migrate_schema()
+
+        self.assertEqual(migrated, {"google_trends": 3, "crossref": 1})
+        self.assertFalse(self.db_manager.needs_migration())
+        self.assertEqual(self.db_manager.get_schema_version(), SCHEMA_VERSION)
+
+        datasets, sources = self.db_manager.get_data_for_keyword("Outsourcing", [1, 4])
+        self.assertEqual(sources, [1, 4])
+        self.assertEqual(datasets[4].index[0], pd.Timestamp("1950-06-01"))
+        self.assertEqual(datasets[4]["value"].iloc[0], 0.25)
+        self.assertEqual(datasets[1]["value"].tolist(), [3.5])
+
+        with self.db_manager.get_connection() as conn:
+            indexes = conn.execute("SELECT name FROM sqlite_master WHERE type='index' AND name LIKE 'idx_%'").fetchall()
+            legacy = conn.execute("SELECT name FROM sqlite_master WHERE name LIKE '%_v1'").fetchall()
+        self.assertEqual(indexes, [])
+        self.assertEqual(legacy, [])
+        self.assertEqual(self.db_manager.get_series_stats("Benchmarking")[1]["row_count"], 2)
+
+    def test_schema_versions_compare_numerically(self):
+        self.assertLess(schema_version_key("2.9"), schema_version_key("2.10"))
+        self.db_manager.migrate_schema(vacuum=False)
+
+        # A file written by a newer build is never treated as an older layout
+        self.db_manager.update_metadata("schema_version", "2.10")
+        self.assertFalse(self.db_manager.needs_migration())
+        self.db_manager.update_metadata("schema_version", "1.10")
+        self.assertTrue(self.db_manager.needs_migration())
+
+
+class TestReadOnlyServing(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = Path(self.tmp_dir.name) / "served.db"
+        builder = DatabaseManager(db_path=self.db_path, read_only=False)
+        builder.create_schema()
+        builder.insert_data_batch("crossref", [("2001-01-01", "Benchmarking", 4.0)])
+        builder.seal()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_sealed_database_opens_read_only(self):
+        db_manager = DatabaseManager(db_path=self.db_path)
+        try:
+            self.assertTrue(db_manager.read_only)
+            datasets, sources = db_manager.get_data_for_keyword("Benchmarking", [4])
+            self.assertEqual(sources, [4])
+            self.assertEqual(datasets[4]["value"].tolist(), [4.0])
+
+            with self.assertRaises(ReadOnlyDatabaseError):
+                db_manager.insert_data_batch("crossref", [("2001-02-01", "Benchmarking", 5.0)])
+            with db_manager.get_connection() as conn:
+                with self.assertRaises(sqlite3.OperationalError):
+                    conn.execute("DELETE FROM crossref")
+        finally:
+            db_manager.close()
+
+        # Immutable connections never create WAL or shared-memory files
+        self.assertEqual([path.name for path in Path(self.tmp_dir.name).iterdir()], ["served.db"])
+
+    def test_unseal_restores_read_write(self):
+        builder = DatabaseManager(db_path=self.db_path, read_only=False)
+        builder.unseal()
+        builder.close()
+
+        db_manager = DatabaseManager(db_path=self.db_path)
+        self.assertFalse(db_manager.read_only)
+        db_manager.insert_data_batch("crossref", [("2001-02-01", "Benchmarking", 5.0)])
+        db_manager.close()
+
+
+class TestDataSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_manager = DatabaseManager(db_path=Path(self.tmp_dir.name) / "snap.db")
+        self.db_manager.create_schema()
+        self.db_manager.insert_data_batch("google_trends", [
+            ("2000-01-01", "Benchmarking", 10.0),
+            ("2000-03-01", "Benchmarking", 30.0),
+        ])
+        self.db_manager.insert_data_batch("crossref", [
+            ("1999-11-01", "Benchmarking", 1.0),
+            ("2000-02-01", "Outsourcing", 2.0),
+        ])
+        self.db_manager.update_metadata("last_updated", "2000-04-01T00:00:00")
+
+    def tearDown(self):
+        self.db_manager.close()
+        self.tmp_dir.cleanup()
+
+    def test_snapshot_matches_sql_path(self):
+        names = {1: "Google Trends", 4: "Crossref.org"}
+        expected, expected_sources = self.db_manager.get_combined_data_for_keyword("Benchmarking", [4, 1], names)
+
+        result = self.db_manager.write_snapshot()
+        self.assertEqual(result["shape"], (2, 5, 5))
+        self.assertIsNotNone(self.db_manager.get_snapshot())
+
+        wide, sources = self.db_manager.get_combined_data_for_keyword("Benchmarking", [4, 1], names)
+        self.assertEqual(sources, expected_sources)
+        pd.testing.assert_frame_equal(wide, expected, check_freq=False)
+
+    def test_views_are_zero_copy(self):
+        self.db_manager.write_snapshot()
+        views = self.db_manager.get_snapshot_views("Benchmarking", [1, 2])
+
+        self.assertEqual(list(views), [1])
+        values, mask = views[1]
+        self.assertIsInstance(values.base, np.ndarray)
+        self.assertFalse(values.flags.writeable)
+        self.assertEqual(values[mask].tolist(), [10.0, 30.0])
+
+    def test_stale_snapshot_is_ignored(self):
+        self.db_manager.write_snapshot()
+        self.db_manager.update_metadata("last_updated", "2001-01-01T00:00:00")
+
+        fresh_manager = DatabaseManager(db_path=self.db_manager.db_path)
+        try:
+            self.assertIsNone(fresh_manager.get_snapshot())
+            self.assertIsNone(fresh_manager.get_snapshot_views("Benchmarking", [1]))
+        finally:
+            fresh_manager.close()
+
+
+class TestBulkLoad(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_manager = DatabaseManager(db_path=Path(self.tmp_dir.name) / "bulk.db")
+        self.db_manager.create_schema(defer_indexes=True)
+
+    def tearDown(self):
+        self.db_manager.close()
+        self.tmp_dir.cleanup()
+
+    def test_bulk_load_uses_one_transaction(self):
+        with self.db_manager.bulk_load() as bulk_conn:
+            self.assertEqual(bulk_conn.execute("PRAGMA journal_mode").fetchone()[0], "memory")
+            self.db_manager.insert_data_batch("google_trends", [("2000-01-01", "Benchmarking", 1.0)])
+            self.db_manager.replace_series("crossref", "Benchmarking", [("2000-01-01", "Benchmarking", 2.0)])
+            self.db_manager.update_metadata("last_updated", "now")
+            with self.db_manager.get_connection() as conn:
+                self.assertIs(conn, bulk_conn)
+                self.assertTrue(conn.in_transaction)
+
+        self.assertEqual(self.db_manager.get_table_stats()["google_trends"]["row_count"], 1)
+        self.assertEqual(self.db_manager.get_series_stats("Benchmarking", [4])[4]["max"], 2.0)
+        with self.db_manager.get_connection() as conn:
+            self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], "delete")
+
+    def test_failed_bulk_load_rolls_back(self):
+        with self.assertRaises(ValueError):
+            with self.db_manager.bulk_load():
+                self.db_manager.insert_data_batch("google_trends", [("2000-01-01", "Benchmarking", 1.0)])
+                self.db_manager.insert_data_batch("google_trends", [("2000-01-15", "Benchmarking", 1.0)])
+
+        self.assertEqual(self.db_manager.get_keywords_list(), [])
+
+    def test_replace_database_file(self):
+        new_path = Path(self.tmp_dir.name) / "bulk.db.building"
+        builder = DatabaseManager(db_path=new_path, read_only=False)
+        builder.create_schema()
+        builder.insert_data_batch("crossref", [("2000-01-01", "Outsourcing", 3.0)])
+        builder.close()
+
+        self.db_manager.replace_database_file(new_path)
+
+        self.assertFalse(new_path.exists())
+        self.assertEqual(self.db_manager.get_keywords_list(), ["Outsourcing"])
+
+    def test_swap_refuses_a_wal_database_open_elsewhere(self):
+        new_path = Path(self.tmp_dir.name) / "bulk.db.building"
+        DatabaseManager(db_path=new_path, read_only=False).create_schema()
+
+        # Another process still serves the old file through WAL
+        other = sqlite3.connect(str(self.db_manager.db_path))
+        other.execute("PRAGMA journal_mode=WAL")
+        other.execute("SELECT COUNT(*) FROM metadata").fetchone()
+        try:
+            self.db_manager.connection_timeout = 0.1
+            with self.assertRaises(RuntimeError):
+                self.db_manager.replace_database_file(new_path)
+            self.assertTrue(new_path.exists())
+            self.assertTrue(Path(f"{self.db_manager.db_path}-wal").exists())
+        finally:
+            other.close()
+
+        self.db_manager.replace_database_file(new_path)
+        self.assertFalse(new_path.exists())
+
+    def test_write_lock_blocks_other_writers(self):
+        other = DatabaseManager(db_path=self.db_manager.db_path, read_only=False)
+        other.connection_timeout = 0.1
+        try:
+            with self.db_manager.write_lock():
+                with self.assertRaises(sqlite3.OperationalError):
+                    other.update_metadata("last_updated", "now")
+                self.assertEqual(other.get_keywords_list(), [])
+            other.update_metadata("last_updated", "now")
+        finally:
+            other.close()
+
+
+class TestOnlineBackupAndHotSwap(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = Path(self.tmp_dir.name) / "live.db"
+        writer = DatabaseManager(db_path=self.db_path, read_only=False)
+        writer.create_schema()
+        writer.insert_data_batch("google_trends", [("2000-01-01", "Benchmarking", 1.0)])
+        writer.bump_data_version()
+        writer.seal()
+        writer.close()
+
+        self.reader = DatabaseManager(db_path=self.db_path)
+        self.reader.reload_check_interval = 0  # checked explicitly below
+
+    def tearDown(self):
+        self.reader.close()
+        self.tmp_dir.cleanup()
+
+    def publish(self, value):
+        new_path = self.db_path.with_name("live.db.new")
+        self.reader.backup_database(new_path, pages=1)
+        builder = DatabaseManager(db_path=new_path, read_only=False)
+        builder.unseal()
+        builder.replace_series("google_trends", "Benchmarking", [("2000-01-01", "Benchmarking", value)])
+        version = builder.bump_data_version()
+        builder.write_snapshot(self.reader.snapshot_path)
+        builder.seal()
+        builder.close()
+        DatabaseManager(db_path=self.db_path, read_only=False).replace_database_file(new_path)
+        return version
+
+    def value(self, conn):
+        return conn.execute("SELECT value FROM google_trends").fetchone()[0]
+
+    def test_online_backup_copies_in_steps(self):
+        backup_path = Path(self.tmp_dir.name) / "backups" / "copy.db"
+        self.reader.backup_database(backup_path, pages=1)
+
+        self.assertFalse(backup_path.with_name("copy.db.tmp").exists())
+        copy = DatabaseManager(db_path=backup_path)
+        self.assertTrue(copy.read_only)
+        self.assertEqual(copy.get_keywords_list(), ["Benchmarking"])
+        copy.close()
+
+    def test_published_file_is_picked_up_without_dropping_requests(self):
+        self.assertFalse(self.reader.check_for_new_version())
+        with self.reader.get_connection() as in_flight:
+            version = self.publish(2.0)
+            self.assertTrue(self.reader.check_for_new_version())
+            self.assertEqual(self.reader.data_version, version)
+            # The request that already held a connection keeps reading the old file
+            self.assertEqual(self.value(in_flight), 1.0)
+            with self.reader.get_connection() as conn:
+                self.assertEqual(self.value(conn), 2.0)
+
+        self.assertTrue(self.reader.read_only)
+        self.assertFalse(self.reader.check_for_new_version())
+
+    def test_snapshot_reads_pick_up_a_published_file(self):
+        writer = DatabaseManager(db_path=self.db_path, read_only=False)
+        writer.write_snapshot()
+        writer.close()
+
+        def snapshot_values():
+            values, mask = self.reader.get_snapshot_views("Benchmarking", [1])[1]
+            return values[mask].tolist()
+
+        self.assertEqual(snapshot_values(), [1.0])
+        version = self.publish(2.0)
+
+        # Only snapshot reads: the due reload check runs in get_snapshot
+        self.reader.reload_check_interval = 60
+        self.reader._next_reload_check = 0
+        self.assertEqual(snapshot_values(), [2.0])
+        self.assertEqual(self.reader.data_version, version)
+
+    def test_online_vacuum_swaps_in_compacted_copy(self):
+        writer = DatabaseManager(db_path=self.db_path, read_only=False)
+        writer.unseal()
+        writer.vacuum_database(online=True)
+        writer.close()
+
+        self.assertTrue(self.reader.check_for_new_version())
+        self.assertEqual(self.reader.get_keywords_list(), ["Benchmarking"])
+
+
+class TestNotesIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_manager = DatabaseManager(db_path=Path(self.tmp_dir.name) / "notes.db")
+        conn = sqlite3.connect(self.db_manager.notes_db_path)
+        conn.execute("CREATE TABLE tool_notes (Herramienta TEXT, Source TEXT, DOI TEXT, "
+                     "Notes TEXT, Links TEXT, Keywords TEXT)")
+        conn.executemany("INSERT INTO tool_notes VALUES (?, ?, ?, ?, ?, ?)", [
+            ("Benchmarking", "Google_Trends", "10.1/gt", "Metodología: índice relativo", "https://t", "benchmarking"),
+            ("Benchmarking", "IC", "10.1/ic", "Informe complementario", "", ""),
+            ("Outsourcing", "Google_Trends", "10.2/gt", "Limitaciones: muestreo", "", "outsourcing + offshoring"),
+        ])
+        conn.commit()
+        conn.close()
+
+    def tearDown(self):
+        self.db_manager.close()
+        self.tmp_dir.cleanup()
+
+    def test_lookup_with_precomputed_translation(self):
+        index = self.db_manager.get_notes_index()
+        index.add_translation('en', lambda text: text.replace('Metodología:', 'Methodology:'))
+
+        notes = self.db_manager.get_tool_notes_and_doi("Benchmarking", "Google_Trends")
+        self.assertEqual(notes, [{'doi': "10.1/gt", 'source': "Google_Trends", 'notes': "Metodología: índice relativo",
+                                  'links': "https://t", 'keywords': "benchmarking"}])
+        english = self.db_manager.get_tool_notes_and_doi("Benchmarking", "Google_Trends", 'en')
+        self.assertEqual(english[0]['notes'], "Methodology: índice relativo")
+        self.assertEqual(len(self.db_manager.get_tool_notes_and_doi("Benchmarking")), 2)
+        self.assertEqual(self.db_manager.get_tool_notes_and_doi("Unknown"), [])
+        self.assertIs(self.db_manager.get_notes_index(), index)
+
+    def test_full_text_search_across_tools(self):
+        self.db_manager.get_notes_index().add_translation('en', lambda text: text.replace('Limitaciones', 'Limitations'))
+
+        results = self.db_manager.search_tool_notes("indice")  # accents are ignored
+        self.assertEqual([(r['tool'], r['source']) for r in results], [("Benchmarking", "Google_Trends")])
+        self.assertEqual(self.db_manager.search_tool_notes("offshoring")[0]['tool'], "Outsourcing")
+        self.assertEqual(self.db_manager.search_tool_notes("limitations", language='en')[0]['doi'], "10.2/gt")
+        self.assertEqual(self.db_manager.search_tool_notes("limitations"), [])
+        self.assertEqual(self.db_manager.search_tool_notes('"unbalanced AND ('), [])
+        self.assertEqual(self.db_manager.search_tool_notes("   "), [])
+
+    def test_load_from_path_with_uri_characters(self):
+        odd_dir = Path(self.tmp_dir.name) / "notes #1 ?50%"
+        odd_dir.mkdir()
+        shutil.copy(self.db_manager.notes_db_path, odd_dir / "notes_and_doi.db")
+        self.assertEqual(len(NotesIndex.load(odd_dir / "notes_and_doi.db")), 3)
+
+    def test_new_translation_closes_search_table(self):
+        index = self.db_manager.get_notes_index()
+        self.assertEqual(len(index.search("offshoring")), 1)
+        search_conn = index._search_conn
+
+        index.add_translation('en', lambda text: text.replace('Limitaciones', 'Limitations'))
+        with self.assertRaises(sqlite3.ProgrammingError):
+            search_conn.execute("SELECT 1")
+        self.assertEqual(len(index.search("limitations", language='en')), 1)
+
+
+class TestQueryMetrics(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_manager = DatabaseManager(db_path=Path(self.tmp_dir.name) / "metrics.db")
+        self.db_manager.create_schema()
+        self.db_manager.insert_data_batch("google_trends", [
+            ("2000-01-01", "Benchmarking", 10.0),
+            ("2000-02-01", "Benchmarking", 20.0),
+        ])
+
+    def tearDown(self):
+        self.db_manager.close()
+        self.tmp_dir.cleanup()
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(self.db_manager.metrics)
+        self.assertIsNone(self.db_manager.pool.wait_observer)
+        self.assertIsNone(self.db_manager.get_query_stats())
+        self.assertIsNone(create_metrics_sink("off"))
+        self.assertIsInstance(create_metrics_sink("memory"), InProcessQueryMetrics)
+
+    def test_reads_are_recorded_per_method_and_table(self):
+        self.db_manager.set_query_metrics(InProcessQueryMetrics())
+        self.db_manager.get_data_for_keyword("Benchmarking", [1, 4])
+        self.db_manager.get_combined_data_for_keyword("Benchmarking", [1])
+        self.db_manager.get_date_bounds("Benchmarking", [1])
+
+        stats = self.db_manager.get_query_stats()
+        trends = stats["queries"]["get_data_for_keyword/google_trends"]
+        self.assertEqual((trends["sql"]["count"], trends["rows"]), (1, 2))
+        self.assertEqual(trends["bytes"], 2 * 8 + 2 * 8)  # float values plus datetime64 index
+        self.assertEqual(stats["queries"]["get_data_for_keyword/crossref"]["rows"], 0)
+        self.assertEqual(stats["queries"]["get_combined_data_for_keyword/union"]["rows"], 2)
+        self.assertEqual(stats["queries"]["get_date_bounds/series_stats"]["frame"]["count"], 1)
+        self.assertGreaterEqual(stats["pool_wait"]["count"], 3)
+        self.assertEqual(sum(trends["sql"]["buckets"].values()), 1)
+
+    def test_partial_sink_does_not_break_reads(self):
+        class PoolWaitOnly(QueryMetricsSink):
+            def __init__(self):
+                self.waits = []
+
+            def observe_pool_wait(self, seconds):
+                self.waits.append(seconds)
+
+        sink = PoolWaitOnly()
+        self.db_manager.set_query_metrics(sink)
+        datasets, _ = self.db_manager.get_data_for_keyword("Benchmarking", [1])
+        self.assertEqual(len(datasets[1]), 2)
+        self.assertEqual(len(sink.waits), 1)
+        self.assertIsNone(self.db_manager.get_query_stats())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Tests for the processed dataset cache shared by the dashboard workers.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dataset_cache import DatasetCache, dataset_cache_key, value_nbytes
+
+
+class TestDatasetCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.directory = Path(self.tmp_dir.name) / "datasets"
+        self.value = (pd.DataFrame({"Google Trends": [1.0, 2.0]}), pd.DataFrame({"Fecha": ["2000-01-01", "2000-02-01"]}))
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_keys_ignore_source_order(self):
+        self.assertEqual(dataset_cache_key("Benchmarking", [4, 1], "v1"), ("Benchmarking", (1, 4), "v1"))
+
+    def test_memory_tier_evicts_least_recently_used(self):
+        cache = DatasetCache(max_entries=2)
+        cache.put("A", [1], "v1", self.value)
+        cache.put("B", [1], "v1", self.value)
+        self.assertIsNotNone(cache.get("A", [1], "v1"))
+        cache.put("C", [1], "v1", self.value)  # evicts "B", not the older but recently read "A"
+
+        self.assertIsNone(cache.get("B", [1], "v1"))
+        self.assertIsNotNone(cache.get("A", [1], "v1"))
+        stats = cache.stats()
+        self.assertEqual((stats["entries"], stats["hits"], stats["misses"], stats["evictions"]), (2, 2, 1, 1))
+
+    def test_memory_tier_is_bounded_by_bytes(self):
+        entry_bytes = value_nbytes(self.value)
+        frames_bytes = sum(frame.memory_usage(deep=True).sum() for frame in self.value)
+        self.assertGreaterEqual(entry_bytes, frames_bytes)
+
+        cache = DatasetCache(max_bytes=2 * entry_bytes)
+        for keyword in ("A", "B", "C"):
+            cache.put(keyword, [1], "v1", self.value, build_seconds=0.5)
+        self.assertIsNone(cache.get("A", [1], "v1"))
+        self.assertIsNotNone(cache.get("C", [1], "v1"))
+
+        stats = cache.stats()
+        self.assertEqual((stats["entries"], stats["bytes"], stats["evictions"]), (2, 2 * entry_bytes, 1))
+        self.assertEqual((stats["hit_rate"], stats["build_seconds"], stats["seconds_saved"]), (0.5, 1.5, 0.5))
+
+        # An entry larger than the whole budget is not kept in memory
+        cache.put("Large", [1], "v1", (pd.DataFrame({"x": range(10000)}),))
+        self.assertEqual((len(cache), cache.stats()["oversized"]), (2, 1))
+
+    def test_shared_tier_warms_other_workers(self):
+        DatasetCache(directory=self.directory).put("Benchmarking", [4, 1], "v1", self.value)
+
+        other_worker = DatasetCache(directory=self.directory)
+        combined, formatted = other_worker.get("Benchmarking", [1, 4], "v1")
+        pd.testing.assert_frame_equal(combined, self.value[0])
+        self.assertIsNone(other_worker.get("Benchmarking", [1, 4], "v2"))
+        self.assertEqual((other_worker.stats()["shared_hits"], other_worker.stats()["misses"]), (1, 1))
+
+        # Storing a result for a new data_version removes the old version's entries
+        other_worker.put("Benchmarking", [1], "v2", self.value)
+        self.assertEqual(sorted(path.name for path in self.directory.iterdir()), ["v2"])
+
+    def test_lagging_worker_keeps_newer_versions(self):
+        DatasetCache(directory=self.directory).put("Benchmarking", [1], "20261018T120000-aaaaaaaa", self.value)
+        DatasetCache(directory=self.directory).put("Benchmarking", [1], "20261018T130000-bbbbbbbb", self.value)
+
+        # A worker that has not reloaded yet still writes its old version, without deleting the new one
+        lagging_worker = DatasetCache(directory=self.directory)
+        lagging_worker.put("Benchmarking", [4], "20261018T120000-aaaaaaaa", self.value)
+        self.assertEqual(sorted(path.name for path in self.directory.iterdir()),
+                         ["20261018T120000-aaaaaaaa", "20261018T130000-bbbbbbbb"])
+        self.assertIsNotNone(DatasetCache(directory=self.directory).get("Benchmarking", [1], "20261018T130000-bbbbbbbb"))
+
+    @unittest.skipIf(os.name != "posix", "POSIX permissions")
+    def test_shared_directory_must_be_private(self):
+        DatasetCache(directory=self.directory).put("Benchmarking", [1], "v1", self.value)
+        self.assertEqual(self.directory.stat().st_mode & 0o077, 0)
+
+        os.chmod(self.directory, 0o777)
+        other_worker = DatasetCache(directory=self.directory)
+        self.assertIsNone(other_worker.get("Benchmarking", [1], "v1"))
+        other_worker.put("Benchmarking", [4], "v1", self.value)
+        self.assertEqual(len(list((self.directory / "v1").iterdir())), 1)
+        self.assertEqual(other_worker.stats()["shared_writes"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
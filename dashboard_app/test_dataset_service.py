@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Tests for the combined dataset service shared by the dashboard callbacks.
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database import DatabaseManager
+from dataset_cache import DatasetCache
+from dataset_service import DatasetService, slice_months
+
+COLUMN_NAMES = {1: "Google Trends", 4: "Crossref.org"}
+
+
+class SlowDatabase:
+    """Wraps a DatabaseManager, counting and slowing down the combined reads."""
+
+    def __init__(self, db_manager):
+        self.db_manager = db_manager
+        self.reads = 0
+
+    def get_data_version(self):
+        return "v1"
+
+    def get_combined_data_for_keyword(self, *args, **kwargs):
+        self.reads += 1
+        time.sleep(0.1)
+        return self.db_manager.get_combined_data_for_keyword(*args, **kwargs)
+
+
+class TestDatasetService(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_manager = DatabaseManager(db_path=Path(self.tmp_dir.name) / "service.db")
+        self.db_manager.create_schema()
+
+        months = pd.date_range("2000-01-01", periods=60, freq="MS")
+        series = {"google_trends": (months, np.arange(60.0)), "crossref": (months[24:48], np.arange(24.0))}
+        for table, (dates, values) in series.items():
+            self.db_manager.insert_data_batch(table, [
+                (date.strftime("%Y-%m-%d"), "Benchmarking", float(value)) for date, value in zip(dates, values)
+            ])
+        self.database = SlowDatabase(self.db_manager)
+        self.service = DatasetService(self.database, COLUMN_NAMES, cache=DatasetCache())
+
+    def tearDown(self):
+        self.db_manager.close()
+        self.tmp_dir.cleanup()
+
+    def test_concurrent_callbacks_share_one_build(self):
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(self.service.get_combined("Benchmarking", [4, 1])))
+                   for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(self.database.reads, 1)
+        self.assertEqual(len(results), 6)
+        self.assertEqual(list(results[0].columns), ["Fecha", "Crossref.org", "Google Trends"])
+
+        # Later calls, in any source order, are served from the cache
+        combined = self.service.get_combined("Benchmarking", [1, 4])
+        self.assertEqual(list(combined.columns), ["Fecha", "Google Trends", "Crossref.org"])
+        self.assertEqual(self.service.get_display_table("Benchmarking", [1, 4])["Fecha"].iloc[0], "2000-01-01")
+        stats = self.service.stats()
+        self.assertEqual((stats["builds"], stats["misses"], self.database.reads), (1, 1, 1))
+        self.assertEqual(stats["coalesced"] + stats["hits"], 7)
+
+    def test_cached_combined_never_builds(self):
+        self.assertIsNone(self.service.get_cached_combined("Benchmarking", [1, 4]))
+        combined = self.service.get_combined("Benchmarking", [4, 1])
+
+        cached = self.service.get_cached_combined("Benchmarking", [1, 4])
+        self.assertEqual(list(cached.columns), ["Fecha", "Google Trends", "Crossref.org"])
+        pd.testing.assert_frame_equal(cached[combined.columns], combined)
+        stats = self.service.stats()
+        self.assertEqual((stats["builds"], stats["hits"], stats["misses"]), (1, 0, 1))
+
+    def test_slice_months_bounds(self):
+        combined = self.service.get_combined("Benchmarking", [1, 4])
+
+        # A start in the middle of a month excludes it, an end date includes its month
+        sliced = slice_months(combined, start_date="2002-06-15", end_date=pd.Timestamp("2003-02-01"))
+        self.assertEqual(list(sliced["Fecha"]), list(pd.date_range("2002-07-01", "2003-02-01", freq="MS")))
+        self.assertEqual(sliced["Google Trends"].tolist(), list(np.arange(30.0, 38.0)))
+        self.assertEqual(sliced["Crossref.org"].tolist(), list(np.arange(6.0, 14.0)))
+
+        # Last N years counts back from the latest date of the dataset (2004-12)
+        sliced = slice_months(combined, last_years=1)
+        self.assertEqual(sliced["Fecha"].iloc[0], pd.Timestamp("2003-12-01"))
+        self.assertEqual(sliced["Google Trends"].tolist(), list(np.arange(47.0, 60.0)))
+        self.assertEqual(sliced["Crossref.org"].dropna().tolist(), [23.0])
+
+        # Sources without values in the range are dropped
+        sliced = slice_months(combined, start_date="2000-01-01", end_date="2001-12-31")
+        self.assertEqual(list(sliced.columns), ["Fecha", "Google Trends"])
+        self.assertEqual(sliced["Google Trends"].tolist(), list(np.arange(0.0, 24.0)))
+        self.assertTrue(slice_months(combined, start_date="2010-01-01").empty)
+
+
+if __name__ == '__main__':
+    unittest.main()
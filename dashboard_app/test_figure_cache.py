@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Tests for the language-neutral figure cache of the dashboard.
+"""
+
+import os
+import sys
+import unittest
+
+import plotly.graph_objects as go
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from figure_cache import FigureCache, figure_cache_key
+from translations import get_text, localize_text, translate_source_name, PLACEHOLDER_LANGUAGE
+
+
+def build_figure(language):
+    """Build a small figure whose texts depend on the language."""
+    source = translate_source_name("Bain - Satisfacción", language)
+    fig = go.Figure(go.Scatter(x=[1, 2, 3], y=[4.0, 5.0, 6.0], name=source))
+    fig.update_layout(title=get_text('fourier_title', language, source=source),
+                      xaxis_title=get_text('linear', language))
+    return fig
+
+
+class TestFigureCache(unittest.TestCase):
+
+    def test_placeholders_localize_to_fresh_texts(self):
+        for language in ('es', 'en'):
+            text = get_text('regression_title', PLACEHOLDER_LANGUAGE, y_var="Google Trends", x_var="Bain - Usabilidad")
+            self.assertEqual(localize_text(text, language),
+                             get_text('regression_title', language, y_var=translate_source_name("Google Trends", language),
+                                      x_var=translate_source_name("Bain - Usabilidad", language)))
+
+    def test_language_switch_is_served_from_cache(self):
+        builds = []
+        cache = FigureCache()
+        key = figure_cache_key("Benchmarking", [5, 1], ('fourier', 5), "v1")
+
+        def build(language):
+            builds.append(language)
+            return build_figure(language)
+
+        for language in ('es', 'en', 'es'):
+            figure = cache.get_figure(key, build, language)
+            expected = build_figure(language).to_plotly_json()
+            self.assertEqual(figure['layout']['title']['text'], expected['layout']['title']['text'])
+            self.assertEqual(figure['layout']['xaxis']['title']['text'], expected['layout']['xaxis']['title']['text'])
+            self.assertEqual(figure['data'][0]['name'], expected['data'][0]['name'])
+
+        self.assertEqual(builds, [PLACEHOLDER_LANGUAGE])
+        stats = cache.stats()
+        self.assertEqual((stats["entries"], stats["hits"], stats["misses"]), (1, 2, 1))
+
+    def test_cache_is_bounded_by_bytes(self):
+        cache = FigureCache()
+        cache.get_figure(figure_cache_key("A", [1], 'mean', "v1"), build_figure, 'es')
+        entry_bytes = cache.stats()["bytes"]
+
+        cache = FigureCache(max_bytes=2 * entry_bytes)
+        for keyword in ("A", "B", "C"):
+            cache.get_figure(figure_cache_key(keyword, [1], 'mean', "v1"), build_figure, 'es')
+        stats = cache.stats()
+        self.assertEqual((stats["entries"], stats["bytes"], stats["evictions"]), (2, 2 * entry_bytes, 1))
+
+        # Another data_version is a different figure
+        cache.get_figure(figure_cache_key("C", [1], 'mean', "v2"), build_figure, 'en')
+        self.assertEqual(cache.stats()["misses"], 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Tests for fingerprint-based incremental database rebuilds.
+"""
+
+import copy
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import get_config
+from data_processor import DataProcessor
+from database import DatabaseManager
+
+BAIN_FILE = "BU_Benchmarking_2485.csv"
+
+
+class TestIncrementalRebuild(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        root = Path(self.tmp_dir.name)
+        (root / "dbase").mkdir()
+        (root / "interpolation_profiles").mkdir()
+        shutil.copy(get_config().data_sources_path / BAIN_FILE, root / "dbase" / BAIN_FILE)
+        self.bain_path = root / "dbase" / BAIN_FILE
+
+        # Only the Bain usability file of Benchmarking exists; every other slice is empty
+        self.processor = DataProcessor()
+        self.processor.config = copy.copy(get_config())
+        self.processor.config.project_root = root
+
+        self.db_manager = DatabaseManager(db_path=root / "incremental.db")
+        self.db_manager.create_schema()
+
+    def tearDown(self):
+        self.db_manager.close()
+        self.tmp_dir.cleanup()
+
+    def bain_rows(self):
+        return self.db_manager.get_series_stats("Benchmarking", [3]).get(3, {}).get("row_count", 0)
+
+    def test_only_changed_slices_are_rebuilt(self):
+        stats = self.processor.process_all_data(db=self.db_manager)
+        self.assertEqual(stats["unchanged"], 0)
+        self.assertEqual(stats["errors"], 0)
+        full_rows = self.bain_rows()
+        self.assertGreater(full_rows, 0)
+
+        changed, _ = self.processor.find_changed_slices(self.db_manager)
+        self.assertEqual(changed, [])
+
+        # Touching the file without changing its content does not trigger a rebuild
+        os.utime(self.bain_path)
+        changed, _ = self.processor.find_changed_slices(self.db_manager)
+        self.assertEqual(changed, [])
+
+        # Dropping the last survey year removes the months after the new last point
+        lines = self.bain_path.read_text(encoding="utf-8").splitlines(keepends=True)
+        self.bain_path.write_text("".join(lines[:-1]), encoding="utf-8")
+        self.processor.clear_caches()
+
+        changed, _ = self.processor.find_changed_slices(self.db_manager)
+        self.assertEqual(changed, [("Benchmarking", 3, BAIN_FILE)])
+
+        stats = self.processor.process_all_data(db=self.db_manager)
+        self.assertEqual(stats["unchanged"], len(self.processor.get_all_slices()) - 1)
+        self.assertGreater(stats["deleted"], 0)
+        self.assertEqual(self.bain_rows(), full_rows - stats["deleted"])
+
+    def test_corrupted_file_keeps_rows_and_fingerprint(self):
+        self.processor.process_all_data(db=self.db_manager)
+        full_rows = self.bain_rows()
+        good_content = self.bain_path.read_bytes()
+
+        self.bain_path.write_bytes(b"\x00\x9c\xff corrupted \xfe\n\x01,\x02\n")
+        self.processor.clear_caches()
+
+        for jobs in (1, 2):
+            stats = self.processor.process_all_data(jobs=jobs, db=self.db_manager)
+            self.assertEqual((stats["errors"], stats["deleted"]), (1, 0))
+            self.assertEqual(self.bain_rows(), full_rows)
+
+            # The slice is still pending, so the next run retries it
+            changed, _ = self.processor.find_changed_slices(self.db_manager)
+            self.assertEqual(changed, [("Benchmarking", 3, BAIN_FILE)])
+
+        self.bain_path.write_bytes(good_content)
+        stats = self.processor.process_all_data(db=self.db_manager)
+        self.assertEqual(stats["errors"], 0)
+        self.assertEqual(self.bain_rows(), full_rows)
+
+    def test_parallel_build_matches_serial(self):
+        serial_stats = self.processor.process_all_data(force=True, db=self.db_manager)
+        serial = self.db_manager.get_data_for_keyword("Benchmarking", [3])[0][3]
+
+        self.db_manager.clear_table("bain_usability")
+        parallel_stats = self.processor.process_all_data(force=True, jobs=2, db=self.db_manager)
+        parallel = self.db_manager.get_data_for_keyword("Benchmarking", [3])[0][3]
+
+        for key in ("processed", "skipped", "errors"):
+            self.assertEqual(parallel_stats[key], serial_stats[key])
+        pd.testing.assert_frame_equal(parallel, serial)
+
+    def test_replace_series_deletes_missing_dates(self):
+        self.db_manager.insert_data_batch("crossref", [
+            ("2001-01-01", "Benchmarking", 1.0),
+            ("2001-02-01", "Benchmarking", 2.0),
+        ])
+        removed = self.db_manager.replace_series("crossref", "Benchmarking", [("2001-02-01", "Benchmarking", 5.0)])
+
+        self.assertEqual(removed, 1)
+        datasets, _ = self.db_manager.get_data_for_keyword("Benchmarking", [4])
+        self.assertEqual(datasets[4]["value"].tolist(), [5.0])
+
+    def test_batch_format_matches_row_conversion(self):
+        df = pd.DataFrame({"Benchmarking": np.array([1.5, 2.0, 3.25])},
+                          index=pd.date_range("1999-11-01", periods=3, freq="MS"))
+        expected = [(pd.to_datetime(date).strftime('%Y-%m-%d'), "Benchmarking", float(value))
+                    for date, value in df["Benchmarking"].items()]
+
+        self.assertEqual(self.processor.convert_to_batch_format(df, "Benchmarking"), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
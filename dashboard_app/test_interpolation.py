@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Tests for the batched Bain spline and Google Books expansion engines.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from scipy.interpolate import CubicSpline
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_processor import DataProcessor
+from interpolation import (InterpolationCache, batched_cubic_interpolation, cached_batched_cubic_interpolation,
+                           group_columns_by_grid, interpolation_cache_key)
+
+
+def reference_spline(series):
+    """Single-column spline at month starts, clipped, with the original points forced in."""
+    actual = series.dropna().sort_index()
+    x = (actual.index - pd.Timestamp('1970-01-01')).days.values.astype(float)
+    cs = CubicSpline(x, actual.values, bc_type='natural')
+    months = pd.date_range(actual.index.min(), actual.index.max(), freq='MS')
+    result = pd.Series(np.clip(cs((months - pd.Timestamp('1970-01-01')).days.values.astype(float)),
+                               actual.min(), actual.max()), index=months)
+    for idx, val in actual.items():
+        result.loc[idx] = val
+    return result
+
+
+def reference_daily_spline(series):
+    """Single-column daily spline averaged per month, as cubic_interpolation in analysis.py did it."""
+    actual = series.dropna().sort_index()
+    x = (actual.index - pd.Timestamp('1970-01-01')).days.values.astype(float)
+    cs = CubicSpline(x, actual.values, bc_type='natural')
+    days = pd.date_range(actual.index.min(), actual.index.max(), freq='D')
+    daily = pd.Series(np.clip(cs((days - pd.Timestamp('1970-01-01')).days.values.astype(float)),
+                              actual.min(), actual.max()), index=days)
+    for idx, val in actual.items():
+        daily.loc[idx] = val
+    monthly = daily.sort_index().resample('MS').mean()
+    for idx, val in actual.items():
+        monthly.loc[pd.Timestamp(idx).normalize()] = val
+    return monthly.sort_index()
+
+
+class TestBatchedCubicInterpolation(unittest.TestCase):
+
+    def setUp(self):
+        dates = pd.to_datetime(["1993-01-01", "1996-01-01", "1999-01-01", "2002-01-01",
+                                "2004-01-01", "2006-01-01", "2008-01-01"])
+        self.df = pd.DataFrame({
+            "A": [83, 94, 60, 70, 75, 72, 66],
+            "B": [10.5, 40.0, 25.0, 90.0, 85.0, 20.0, 30.0],
+            "C": [np.nan, 50.0, 55.0, 65.0, 40.0, 45.0, np.nan],
+            "D": [np.nan, np.nan, 1.0, np.nan, np.nan, 2.0, np.nan],
+        }, index=dates)
+
+    def test_columns_sharing_dates_are_grouped(self):
+        self.assertEqual(group_columns_by_grid(self.df), [["A", "B"], ["C"]])
+
+    def test_batched_fit_matches_single_column_fit(self):
+        results = batched_cubic_interpolation(self.df)
+        self.assertEqual(sorted(results), ["A", "B", "C"])
+        for column in ("A", "B", "C"):
+            expected = reference_spline(self.df[column])
+            self.assertTrue(results[column].index.equals(expected.index))
+            np.testing.assert_array_equal(results[column].to_numpy(), expected.to_numpy())
+
+    def test_daily_fit_keeps_original_points(self):
+        results = batched_cubic_interpolation(self.df, ["A"], daily=True)
+        self.assertEqual(results["A"].loc["1996-01-01"], 94.0)
+        self.assertEqual(results["A"].index[-1], pd.Timestamp("2008-01-01"))
+        self.assertLessEqual(results["A"].max(), 94.0)
+
+    def test_off_grid_originals(self):
+        mid_year = self.df[["A", "B"]].set_axis(self.df.index + pd.DateOffset(months=5, days=14))
+
+        # The daily method keeps each survey point as an extra row, like the analysis scripts
+        results = batched_cubic_interpolation(mid_year, daily=True)
+        for column in ("A", "B"):
+            expected = reference_daily_spline(mid_year[column])
+            self.assertTrue(results[column].index.equals(expected.index))
+            np.testing.assert_allclose(results[column].to_numpy(), expected.to_numpy())
+        self.assertEqual(results["A"].loc["1996-06-15"], 94.0)
+
+        # The month-start method only returns month starts
+        monthly = batched_cubic_interpolation(mid_year)["A"]
+        self.assertTrue((monthly.index.day == 1).all())
+        self.assertNotIn(pd.Timestamp("1996-06-15"), monthly.index)
+
+
+class TestGoogleBooksExpansion(unittest.TestCase):
+
+    def test_matches_per_year_expansion(self):
+        processor = DataProcessor()
+        gb = pd.DataFrame({"Benchmarking": [0, 12, 7, 30]},
+                          index=pd.to_datetime(["1990", "1991", "1993", "1994"], format="%Y"))
+        gb.index.name = "Year"
+        other = pd.DataFrame({"Outsourcing": [5.5, 6.5]}, index=pd.to_datetime(["1980", "1991"], format="%Y"))
+        processor.prepare_gb_interpolations({"Benchmarking": gb, "Outsourcing": other})
+
+        profile = processor.load_pattern_file(processor.keyword_to_csv["Benchmarking"])
+        expected = np.concatenate([(profile / 100) * value for value in gb["Benchmarking"]])
+        result = processor.interpolate_gb_data(gb, "Benchmarking")
+
+        np.testing.assert_array_equal(result["Benchmarking"].to_numpy(), expected)
+        self.assertEqual(result.index.name, "Year")
+        self.assertEqual(len(result), 48)
+        self.assertEqual(result.index[12], pd.Timestamp("1991-01-01"))
+        self.assertEqual(result.index[-1], pd.Timestamp("1994-12-01"))
+        self.assertEqual(len(processor.interpolate_gb_data(other, "Outsourcing")), 24)
+
+
+class TestInterpolationCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.series = pd.Series([1.0, 2.0], index=pd.to_datetime(["2000-01-01", "2001-01-01"]))
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_keys_cover_values_dates_and_method(self):
+        key = interpolation_cache_key("cubic", self.series)
+        self.assertEqual(key, interpolation_cache_key("cubic", self.series.copy()))
+        self.assertNotEqual(key, interpolation_cache_key("linear", self.series))
+        self.assertNotEqual(key, interpolation_cache_key("cubic", self.series + 1))
+        self.assertNotEqual(key, interpolation_cache_key("cubic", self.series.shift(1, freq="MS")))
+
+    def test_lru_eviction_and_counters(self):
+        cache = InterpolationCache(max_entries=2)
+        for name in ("a", "b"):
+            cache.put(name, self.series)
+        self.assertIsNotNone(cache.get("a"))
+        cache.put("c", self.series)  # evicts "b", the least recently used
+
+        self.assertIsNone(cache.get("b"))
+        stats = cache.stats()
+        self.assertEqual((stats["entries"], stats["hits"], stats["misses"], stats["evictions"]), (2, 1, 1, 1))
+
+        # A prefetched result counts as a miss for the read it was computed for
+        cache.put("d", self.series, prefetched=True)
+        cache.get("d")
+        cache.get("d")
+        self.assertEqual((cache.stats()["hits"], cache.stats()["misses"]), (2, 2))
+
+    def test_disk_tier_is_shared_between_instances(self):
+        directory = Path(self.tmp_dir.name) / "interpolation"
+        df = pd.DataFrame({"A": [83.0, 94.0, 60.0, 70.0, 75.0]},
+                          index=pd.to_datetime(["1993", "1996", "1999", "2002", "2004"], format="%Y"))
+        first = cached_batched_cubic_interpolation(df, cache=InterpolationCache(directory=directory))
+
+        cache = InterpolationCache(directory=directory)
+        second = cached_batched_cubic_interpolation(df, cache=cache)
+        pd.testing.assert_series_equal(first["A"], second["A"])
+        self.assertEqual((cache.stats()["hits"], cache.stats()["disk_hits"]), (1, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
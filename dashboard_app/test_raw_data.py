@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared raw CSV loader and its parsed-table cache.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from raw_data import RawDataLoader, load_dbase_csv
+
+
+class TestRawDataLoader(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        root = Path(self.tmp_dir.name)
+        self.csv_path = root / "BU_Tool.csv"
+        self.csv_path.write_text("Year,Tool\n1993-01 ,83\n1996-01,94\n", encoding="utf-8")
+        self.cache_dir = root / "raw"
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_cached_table_matches_parsed_table(self):
+        parsed = load_dbase_csv(self.csv_path, dates='monthly', loader=RawDataLoader())
+        load_dbase_csv(self.csv_path, dates='monthly', loader=RawDataLoader(self.cache_dir))
+
+        loader = RawDataLoader(self.cache_dir)
+        cached = load_dbase_csv(self.csv_path, dates='monthly', loader=loader)
+        pd.testing.assert_frame_equal(cached, parsed)
+        self.assertEqual(list(cached.index), [pd.Timestamp("1993-01-01"), pd.Timestamp("1996-01-01")])
+        self.assertEqual((loader.stats()["parsed"], loader.stats()["cache_hits"]), (0, 1))
+
+    def test_stale_entries_are_reparsed(self):
+        RawDataLoader(self.cache_dir).read_csv(self.csv_path, index_col=0)
+
+        # Touching the file keeps the entry, changing its content does not
+        os.utime(self.csv_path, ns=(0, 10 ** 9))
+        loader = RawDataLoader(self.cache_dir)
+        loader.read_csv(self.csv_path, index_col=0)
+        self.assertEqual(loader.stats()["cache_hits"], 1)
+
+        self.csv_path.write_text("Year,Tool\n1993-01,50\n", encoding="utf-8")
+        df = loader.read_csv(self.csv_path, index_col=0)
+        self.assertEqual(df["Tool"].tolist(), [50])
+        self.assertEqual(loader.stats()["parsed"], 1)
+
+        # Different read options are cached separately
+        self.assertEqual(list(loader.read_csv(self.csv_path).columns), ["Year", "Tool"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -18,14 +18,14 @@ def test_regression_callback_return_types():
     
     # Test case 1: Missing keyword
     print("\n1. Testing with missing keyword...")
-    result = update_regression_analysis(None, None, [], 'es')
+    result = update_regression_analysis(None, True, None, [], 'es')
     assert isinstance(result, tuple), f"Expected tuple, got {type(result)}"
     assert len(result) == 2, f"Expected tuple of length 2, got length {len(result)}"
     print("✓ Missing keyword test passed")
     
     # Test case 2: Missing sources
     print("\n2. Testing with missing sources...")
-    result = update_regression_analysis(None, 'Calidad_Total', [], 'es')
+    result = update_regression_analysis(None, True, 'Calidad_Total', [], 'es')
     assert isinstance(result, tuple), f"Expected tuple, got {type(result)}"
     assert len(result) == 2, f"Expected tuple of length 2, got length {len(result)}"
     print("✓ Missing sources test passed")
@@ -33,14 +33,14 @@ def test_regression_callback_return_types():
     # Test case 3: Invalid click_data structure
     print("\n3. Testing with invalid click_data structure...")
     invalid_click_data = {"invalid": "structure"}
-    result = update_regression_analysis(invalid_click_data, 'Calidad_Total', ['Google Trends', 'Crossref'], 'es')
+    result = update_regression_analysis(invalid_click_data, True, 'Calidad_Total', ['Google Trends', 'Crossref'], 'es')
     assert isinstance(result, tuple), f"Expected tuple, got {type(result)}"
     assert len(result) == 2, f"Expected tuple of length 2, got length {len(result)}"
     print("✓ Invalid click_data structure test passed")
     
     # Test case 4: Empty click_data
     print("\n4. Testing with empty click_data...")
-    result = update_regression_analysis({}, 'Calidad_Total', ['Google Trends', 'Crossref'], 'es')
+    result = update_regression_analysis({}, True, 'Calidad_Total', ['Google Trends', 'Crossref'], 'es')
     assert isinstance(result, tuple), f"Expected tuple, got {type(result)}"
     assert len(result) == 2, f"Expected tuple of length 2, got length {len(result)}"
     print("✓ Empty click_data test passed")
@@ -48,7 +48,7 @@ def test_regression_callback_return_types():
     # Test case 5: Valid click_data but missing points
     print("\n5. Testing with click_data missing points...")
     click_data_no_points = {"points": []}
-    result = update_regression_analysis(click_data_no_points, 'Calidad_Total', ['Google Trends', 'Crossref'], 'es')
+    result = update_regression_analysis(click_data_no_points, True, 'Calidad_Total', ['Google Trends', 'Crossref'], 'es')
     assert isinstance(result, tuple), f"Expected tuple, got {type(result)}"
     assert len(result) == 2, f"Expected tuple of length 2, got length {len(result)}"
     print("✓ Click data missing points test passed")
@@ -56,7 +56,7 @@ def test_regression_callback_return_types():
     # Test case 6: Valid click_data with incomplete point
     print("\n6. Testing with click_data with incomplete point...")
     click_data_incomplete = {"points": [{"x": "Google Trends"}]}  # Missing y
-    result = update_regression_analysis(click_data_incomplete, 'Calidad_Total', ['Google Trends', 'Crossref'], 'es')
+    result = update_regression_analysis(click_data_incomplete, True, 'Calidad_Total', ['Google Trends', 'Crossref'], 'es')
     assert isinstance(result, tuple), f"Expected tuple, got {type(result)}"
     assert len(result) == 2, f"Expected tuple of length 2, got length {len(result)}"
     print("✓ Incomplete point test passed")
@@ -64,7 +64,7 @@ def test_regression_callback_return_types():
     # Test case 7: Valid click_data with same variables (diagonal)
     print("\n7. Testing with same variables (diagonal click)...")
     click_data_same = {"points": [{"x": "Google Trends", "y": "Google Trends"}]}
-    result = update_regression_analysis(click_data_same, 'Calidad_Total', ['Google Trends', 'Crossref'], 'es')
+    result = update_regression_analysis(click_data_same, True, 'Calidad_Total', ['Google Trends', 'Crossref'], 'es')
     assert isinstance(result, tuple), f"Expected tuple, got {type(result)}"
     assert len(result) == 2, f"Expected tuple of length 2, got length {len(result)}"
     print("✓ Same variables test passed")
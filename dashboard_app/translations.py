@@ -1,6 +1,15 @@
 # Bilingual Translation System for Management Tools Analysis Dashboard
 # Supports Spanish (es) and English (en) languages
 
+import json
+import re
+
+# Pseudo-language for language-neutral output: get_text returns placeholders and source
+# names keep their database (Spanish) form; localize_text resolves both for a real language
+PLACEHOLDER_LANGUAGE = 'placeholder'
+
+_PLACEHOLDER_PATTERN = re.compile('\u27e6([^\u27e6\u27e7\u241f]+)(?:\u241f(\\{.*?\\}))?\u27e7')
+
 TRANSLATIONS = {
     'es': {
         # UI Labels and Buttons
@@ -512,6 +521,9 @@ def get_text(key, language='es', **kwargs):
     Returns:
         str: Translated text
     """
+    if language == PLACEHOLDER_LANGUAGE:
+        return text_placeholder(key, kwargs)
+
     if language not in TRANSLATIONS:
         language = 'es'  # Fallback to Spanish
 
@@ -525,6 +537,50 @@ def get_text(key, language='es', **kwargs):
 
     return translation
 
+def text_placeholder(key, kwargs=None):
+    """
+    Encode a get_text call as a placeholder that localize_text resolves later.
+
+    Args:
+        key (str): Translation key
+        kwargs (dict): Format string arguments
+
+    Returns:
+        str: Placeholder text
+    """
+    if not kwargs:
+        return f"\u27e6{key}\u27e7"
+    return f"\u27e6{key}\u241f{json.dumps(kwargs, ensure_ascii=False, sort_keys=True, default=str)}\u27e7"
+
+def localize_text(text, language='es'):
+    """
+    Localize text built with PLACEHOLDER_LANGUAGE.
+
+    Source names are translated first (including those passed as format
+    arguments), then every placeholder is replaced with get_text's result.
+
+    Args:
+        text (str): Text that may contain placeholders and database source names
+        language (str): Language code ('es' or 'en')
+
+    Returns:
+        str: Localized text
+    """
+    if language != 'es':
+        for source_name in _SOURCE_NAMES_LONGEST_FIRST:
+            if source_name in text:
+                text = text.replace(source_name, SOURCE_NAME_TRANSLATIONS[source_name])
+    if '\u27e6' not in text:
+        return text
+
+    def resolve(match):
+        kwargs = json.loads(match.group(2)) if match.group(2) else {}
+        kwargs = {name: localize_text(value, language) if isinstance(value, str) else value
+                  for name, value in kwargs.items()}
+        return get_text(match.group(1), language, **kwargs)
+
+    return _PLACEHOLDER_PATTERN.sub(resolve, text)
+
 def get_tool_name(tool_key, language='es'):
     """
     Get translated tool name.
@@ -553,6 +609,60 @@ def get_language_name(language_code):
     }
     return names.get(language_code, language_code)
 
+# Common translation patterns for database content, applied in order
+DATABASE_CONTENT_TRANSLATIONS = {
+    # Source notes patterns
+    'Descriptores lógicos:': 'Logical Descriptors:',
+    'Parámetros de búsqueda:': 'Search Parameters:',
+    'cobertura global': 'global coverage',
+    'marco temporal': 'temporal framework',
+    'categorización amplia': 'broad categorization',
+    'tipo de búsqueda': 'search type',
+    'Índice Relativo:': 'Relative Index:',
+    'Los datos se normalizan en un índice relativo': 'Data is normalized into a relative index',
+    'mediante la fórmula:': 'using the formula:',
+    'Índice relativo = (Volumen de búsqueda del término / Volumen total de búsquedas) x 100': 'Relative Index = (Search volume of the term / Total search volume) x 100',
+    'mitigando sesgos por heterogeneidad en volúmenes de búsqueda entre regiones y periodos.': 'mitigating biases due to heterogeneity in search volumes between regions and periods.',
+    'Metodología:': 'Methodology:',
+    'La métrica es comparativa, no absoluta,': 'The metric is comparative, not absolute,',
+    'basada en muestreo probabilístico,': 'based on probabilistic sampling,',
+    'lo que introduce variabilidad estadística.': 'which introduces statistical variability.',
+    'La interpretación se centra en tendencias de interés relativo,': 'The interpretation focuses on relative interest trends,',
+    'no en recuentos absolutos.': 'not on absolute counts.',
+    'Disponibilidad de datos (desde 2004)': 'Data availability (since 2004)',
+    'permite análisis diacrónico contextualizado en evolución digital': 'allows contextualized diachronic analysis in digital evolution',
+    'y patrones de búsqueda.': 'and search patterns.',
+    'Perfil de Usuarios:': 'User Profile:',
+    'Refleja interés público,': 'Reflects public interest,',
+    'popularidad de búsqueda': 'search popularity',
+    'y tendencias emergentes en tiempo real': 'and emerging trends in real time',
+    'en un perfil de usuarios heterogéneos:': 'in a heterogeneous user profile:',
+    'investigadores,': 'researchers,',
+    'periodistas,': 'journalists,',
+    'profesionales del marketing,': 'marketing professionals,',
+    'empresarios': 'entrepreneurs',
+    'y usuarios generales.': 'and general users.',
+    'Limitaciones:': 'Limitations:',
+    'No hay correlación directa entre interés en búsquedas': 'There is no direct correlation between search interest',
+    'e implementación efectiva en organizaciones.': 'and effective implementation in organizations.',
+    'La evolución terminológica puede afectar': 'Terminological evolution may affect',
+    'la coherencia longitudinal': 'longitudinal coherence',
+
+    # General patterns
+    'benchmarking': 'benchmarking',
+    '+': '+',
+    'web': 'web',
+    '01/2004-01/2025': '01/2004-01/2025',
+    '2004': '2004',
+    '2025': '2025',
+    '95%': '95%',
+    'N/A': 'N/A',
+
+    # Database source names (translated)
+    'bain_usabilidad_translated': 'Bain - Usability',
+    'bain_satisfacción_translated': 'Bain - Satisfaction'
+}
+
 def translate_database_content(text, language='es'):
     """
     Translate database content that contains Spanish text.
@@ -568,82 +678,32 @@ def translate_database_content(text, language='es'):
     if not text or language == 'es':
         return text
 
-    # Common translation patterns for database content
-    translations = {
-        # Source notes patterns
-        'Descriptores lógicos:': 'Logical Descriptors:',
-        'Parámetros de búsqueda:': 'Search Parameters:',
-        'cobertura global': 'global coverage',
-        'marco temporal': 'temporal framework',
-        'categorización amplia': 'broad categorization',
-        'tipo de búsqueda': 'search type',
-        'Índice Relativo:': 'Relative Index:',
-        'Los datos se normalizan en un índice relativo': 'Data is normalized into a relative index',
-        'mediante la fórmula:': 'using the formula:',
-        'Índice relativo = (Volumen de búsqueda del término / Volumen total de búsquedas) x 100': 'Relative Index = (Search volume of the term / Total search volume) x 100',
-        'mitigando sesgos por heterogeneidad en volúmenes de búsqueda entre regiones y periodos.': 'mitigating biases due to heterogeneity in search volumes between regions and periods.',
-        'Metodología:': 'Methodology:',
-        'La métrica es comparativa, no absoluta,': 'The metric is comparative, not absolute,',
-        'basada en muestreo probabilístico,': 'based on probabilistic sampling,',
-        'lo que introduce variabilidad estadística.': 'which introduces statistical variability.',
-        'La interpretación se centra en tendencias de interés relativo,': 'The interpretation focuses on relative interest trends,',
-        'no en recuentos absolutos.': 'not on absolute counts.',
-        'Disponibilidad de datos (desde 2004)': 'Data availability (since 2004)',
-        'permite análisis diacrónico contextualizado en evolución digital': 'allows contextualized diachronic analysis in digital evolution',
-        'y patrones de búsqueda.': 'and search patterns.',
-        'Perfil de Usuarios:': 'User Profile:',
-        'Refleja interés público,': 'Reflects public interest,',
-        'popularidad de búsqueda': 'search popularity',
-        'y tendencias emergentes en tiempo real': 'and emerging trends in real time',
-        'en un perfil de usuarios heterogéneos:': 'in a heterogeneous user profile:',
-        'investigadores,': 'researchers,',
-        'periodistas,': 'journalists,',
-        'profesionales del marketing,': 'marketing professionals,',
-        'empresarios': 'entrepreneurs',
-        'y usuarios generales.': 'and general users.',
-        'Limitaciones:': 'Limitations:',
-        'No hay correlación directa entre interés en búsquedas': 'There is no direct correlation between search interest',
-        'e implementación efectiva en organizaciones.': 'and effective implementation in organizations.',
-        'La evolución terminológica puede afectar': 'Terminological evolution may affect',
-        'la coherencia longitudinal': 'longitudinal coherence',
-
-        # General patterns
-        'benchmarking': 'benchmarking',
-        '+': '+',
-        'web': 'web',
-        '01/2004-01/2025': '01/2004-01/2025',
-        '2004': '2004',
-        '2025': '2025',
-        '95%': '95%',
-        'N/A': 'N/A',
-
-        # Database source names (translated)
-        'bain_usabilidad_translated': 'Bain - Usability',
-        'bain_satisfacción_translated': 'Bain - Satisfaction'
-    }
 
     translated_text = text
-    for spanish, english in translations.items():
+    for spanish, english in DATABASE_CONTENT_TRANSLATIONS.items():
         translated_text = translated_text.replace(spanish, english)
 
     return translated_text
 
+# Translation mapping for source names
+SOURCE_NAME_TRANSLATIONS = {
+    'Bain - Usabilidad': 'Bain - Usability',
+    'Bain Usabilidad': 'Bain Usability',
+    'Bain - Satisfacción': 'Bain - Satisfaction',
+    'Bain Satisfacción': 'Bain Satisfaction',
+    'BAIN_Ind_Usabilidad': 'Bain - Usability',
+    'BAIN_Ind_Satisfacción': 'Bain - Satisfaction'
+}
+
+# Longest first, so 'Bain - Usabilidad' is replaced before 'Bain Usabilidad' could match
+_SOURCE_NAMES_LONGEST_FIRST = sorted(SOURCE_NAME_TRANSLATIONS, key=len, reverse=True)
+
 def translate_source_name(source_name, language='es'):
     """Translate source names for display in charts and tables"""
-    if language == 'es':
+    if language in ('es', PLACEHOLDER_LANGUAGE):
         return source_name
 
-    # Translation mapping for source names
-    source_translations = {
-        'Bain - Usabilidad': 'Bain - Usability',
-        'Bain Usabilidad': 'Bain Usability',
-        'Bain - Satisfacción': 'Bain - Satisfaction',
-        'Bain Satisfacción': 'Bain Satisfaction',
-        'BAIN_Ind_Usabilidad': 'Bain - Usability',
-        'BAIN_Ind_Satisfacción': 'Bain - Satisfaction'
-    }
-
-    return source_translations.get(source_name, source_name)
+    return SOURCE_NAME_TRANSLATIONS.get(source_name, source_name)
 
 # DOCKER_FIX: Enhanced translation for Docker environment
 def enhanced_translate_source_name(source_name, language='es'):
@@ -3,16 +3,26 @@ Data processing module for the Management Tools Analysis Dashboard.
 Contains interpolation logic and data processing functions for database population.
 """
 
+import json
 import pandas as pd
 import numpy as np
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Any
 import os
+import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
 from config import get_config
+from database import MONTH_EPOCH, SOURCE_TABLES
+from interpolation import (MIN_SPLINE_POINTS, InterpolationCache, batched_cubic_interpolation,
+                           expand_annual_to_monthly, interpolation_cache_key)
+from raw_data import RawDataLoader, file_fingerprint, load_dbase_csv
 from tools import tool_file_dic
 
+# Interpolated series kept in memory (one per keyword/source slice, with room to spare)
+INTERPOLATION_CACHE_SIZE = 512
+
 
 class DataProcessor:
     """
@@ -22,18 +32,37 @@ class DataProcessor:
     and data normalization for consistent storage.
     """
 
-    def __init__(self):
-        """Initialize data processor with configuration."""
+    def __init__(self, disk_cache: bool = False):
+        """
+        Initialize data processor with configuration.
+
+        Args:
+            disk_cache: Keep parsed CSV files and interpolation results under the
+                configured cache path, so later runs and other processes can reuse them
+        """
         self.config = get_config()
 
         # Caches for performance
         self._raw_data_cache = {}
         self._pattern_cache = {}
-        self._interpolation_cache = {}
+        self._interpolation_cache = InterpolationCache(max_entries=INTERPOLATION_CACHE_SIZE)
+        self._raw_loader = RawDataLoader()
+        if disk_cache:
+            self.enable_disk_cache()
 
         # Keyword to CSV mapping
         self.keyword_to_csv = self._build_keyword_mapping()
 
+    def enable_disk_cache(self):
+        """Use the on-disk tiers under the configured cache path for parsed CSVs and interpolations."""
+        self._raw_loader = RawDataLoader(self.config.cache_path / "raw")
+        self._interpolation_cache = InterpolationCache(INTERPOLATION_CACHE_SIZE, self.config.cache_path / "interpolation")
+
+    @property
+    def disk_cache_enabled(self) -> bool:
+        """Whether the on-disk caches are in use."""
+        return self._raw_loader.cache_dir is not None
+
     def _build_keyword_mapping(self) -> Dict[str, str]:
         """Build mapping from keywords to CSV pattern files."""
         return {
@@ -62,86 +91,168 @@ class DataProcessor:
             'Talento y Compromiso': 'CR_TalentoyCompromiso_monthly_relative.csv'
         }
 
-    def process_all_data(self, force: bool = False, verbose: bool = False) -> Dict[str, int]:
+    def process_all_data(self, force: bool = False, verbose: bool = False, jobs: int = 1,
+                         db=None) -> Dict[str, int]:
         """
         Process all raw data and prepare for database insertion.
 
+        Each (keyword, source) slice is rebuilt from its input files. Unless forced,
+        only slices whose input files changed since the last run (according to the
+        fingerprints stored in metadata) are reprocessed, and dates that disappeared
+        from an input are deleted from the database.
+
+        With jobs > 1, keywords are loaded and interpolated in a process pool while
+        this process remains the only database writer. Results are written in the
+        same order as the serial path, so the database contents are identical.
+
         Args:
             force: Force reprocessing of all data
             verbose: Enable verbose output
+            jobs: Number of worker processes (1 processes everything in this process)
+            db: Database manager to write to (defaults to the global instance)
 
         Returns:
             Dictionary with processing statistics
         """
-        from database import get_database_manager
+        if db is None:
+            from database import get_database_manager
+            db = get_database_manager()
+        stats = {"processed": 0, "skipped": 0, "errors": 0, "unchanged": 0, "deleted": 0}
 
-        db = get_database_manager()
-        stats = {"processed": 0, "skipped": 0, "errors": 0}
-
-        # Get all keywords from tool_file_dic
-        all_keywords = []
-        for tool_list in tool_file_dic.values():
-            for keyword in tool_list[1]:
-                if keyword not in all_keywords:
-                    all_keywords.append(keyword)
+        all_slices = self.get_all_slices()
+        changed_slices, fingerprints = self.find_changed_slices(db)
+        slices = all_slices if force else changed_slices
+        stats["unchanged"] = len(all_slices) - len(slices)
 
         if verbose:
-            print(f"Processing {len(all_keywords)} keywords...")
-
-        for keyword in all_keywords:
-            try:
-                if verbose:
-                    print(f"Processing keyword: {keyword}")
-
-                # Process data for this keyword
-                processed_data = self.process_keyword_data(keyword, verbose=verbose)
-
-                if processed_data:
-                    # Insert into database
-                    for table_name, data_batch in processed_data.items():
-                        if data_batch:
-                            db.insert_data_batch(table_name, data_batch)
-                            stats["processed"] += len(data_batch)
-                        else:
-                            stats["skipped"] += 1
-                else:
-                    stats["skipped"] += 1
-
-            except Exception as e:
-                if verbose:
-                    print(f"Error processing keyword {keyword}: {e}")
-                stats["errors"] += 1
+            print(f"Processing {len(slices)} of {len(all_slices)} keyword/source slices"
+                  f"{f' with {jobs} workers' if jobs > 1 else ''}...")
+
+        load_start = time.perf_counter()
+        failed_inputs = set()
+        for keyword, results in self._iter_processed_keywords(slices, jobs):
+            if verbose:
+                print(f"Processing keyword: {keyword}")
+
+            for source_id, filename, data_batch, error in results:
+                table_name = SOURCE_TABLES[source_id]
+                try:
+                    if error is not None:
+                        raise RuntimeError(error)
+
+                    # Only a missing or empty input clears the slice; read errors were raised above
+                    data_batch = data_batch or []
+                    stats["deleted"] += db.replace_series(table_name, keyword, data_batch)
+
+                    if data_batch:
+                        stats["processed"] += len(data_batch)
+                        if verbose:
+                            print(f"  Processed {len(data_batch)} records for {table_name}")
+                    else:
+                        stats["skipped"] += 1
+
+                except Exception as e:
+                    if verbose:
+                        print(f"Error processing keyword {keyword} ({table_name}): {e}")
+                    stats["errors"] += 1
+                    failed_inputs.update(self.fingerprint_key(path)
+                                         for path in self.get_slice_inputs(keyword, source_id, filename))
+
+        stats["load_seconds"] = time.perf_counter() - load_start
+        stats["rows_per_second"] = stats["processed"] / stats["load_seconds"] if stats["load_seconds"] > 0 else 0.0
+
+        # Failed slices keep their old fingerprints so the next run retries them
+        db.update_metadata_values({
+            key: json.dumps(fingerprint)
+            for key, fingerprint in fingerprints.items()
+            if key not in failed_inputs
+        })
 
         # Update metadata
         db.update_metadata("last_updated", datetime.now().isoformat())
-        db.update_metadata("total_records", stats["processed"])
+        if force:
+            db.update_metadata("total_records", stats["processed"])
+        else:
+            table_stats = db.get_table_stats()
+            db.update_metadata("total_records", sum(t.get("row_count", 0) for t in table_stats.values()))
 
         if verbose:
             print(f"Processing complete: {stats}")
 
         return stats
 
-    def process_keyword_data(self, keyword: str, verbose: bool = False) -> Dict[str, List[Tuple[str, str, float]]]:
+    def _iter_processed_keywords(self, slices: List[Tuple[str, int, str]], jobs: int = 1):
         """
-        Process data for a specific keyword.
+        Process slices grouped by keyword, serially or in a process pool.
+
+        Args:
+            slices: List of (keyword, source ID, filename) tuples
+            jobs: Number of worker processes
+
+        Yields:
+            Tuples of (keyword, results of process_keyword_slices) in input order
+        """
+        groups = {}
+        for keyword, source_id, filename in slices:
+            groups.setdefault(keyword, []).append((source_id, filename))
+        groups = list(groups.items())
+
+        if jobs <= 1 or len(groups) <= 1:
+            # Interpolate the Bain and Google Books series of all keywords together
+            # before processing them one by one
+            raw = []
+            for keyword, source_id, filename in slices:
+                if source_id not in (2, 3, 5) or not (self.config.data_sources_path / filename).exists():
+                    continue
+                try:
+                    df = self.load_raw_data(source_id, filename)
+                except Exception:
+                    # Reported again as an error of its slice by process_keyword_slices
+                    continue
+                if df is not None and not df.empty:
+                    raw.append((keyword, source_id, df))
+            self.prepare_cubic_interpolations([df for _, source_id, df in raw if source_id in (3, 5)])
+            self.prepare_gb_interpolations({keyword: df for keyword, source_id, df in raw if source_id == 2})
+            for keyword, sources in groups:
+                yield keyword, self.process_keyword_slices(keyword, sources)
+            return
+
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                                 initargs=(self.config, self.disk_cache_enabled)) as executor:
+            # map() yields in submission order as results stream in, keeping writes deterministic
+            results = executor.map(_process_keyword_slices_in_worker, groups)
+            for (keyword, _), keyword_results in zip(groups, results):
+                yield keyword, keyword_results
+
+    def process_keyword_slices(self, keyword: str, sources: List[Tuple[int, str]]) -> List[Tuple[int, str, Optional[List[Tuple[str, str, float]]], Optional[str]]]:
+        """
+        Process several sources of one keyword, capturing errors per source.
 
         Args:
             keyword: The keyword to process
-            verbose: Enable verbose output
+            sources: List of (source ID, filename) tuples
 
         Returns:
-            Dictionary mapping table names to data batches
+            List of (source ID, filename, data batch or None, error message or None)
         """
-        # Map source IDs to table names
-        source_to_table = {
-            1: "google_trends",
-            2: "google_books",
-            3: "bain_usability",
-            4: "crossref",
-            5: "bain_satisfaction"
-        }
+        results = []
+        for source_id, filename in sources:
+            try:
+                results.append((source_id, filename, self.process_source_data(keyword, source_id, filename), None))
+            except Exception as e:
+                results.append((source_id, filename, None, str(e) or type(e).__name__))
+        return results
+
+    def get_source_files(self, keyword: str) -> Dict[int, str]:
+        """
+        Get the raw CSV filename of each source for a keyword.
 
-        # Get filenames for this keyword
+        Args:
+            keyword: The keyword to look up
+
+        Returns:
+            Dictionary mapping source ID to CSV filename
+        """
         filenames = {}
         for source in [1, 2, 3, 4, 5]:  # All sources
             index = {1: 0, 2: 2, 3: 3, 4: 4, 5: 5}[source]
@@ -149,32 +260,119 @@ class DataProcessor:
                 if keyword in value[1]:
                     filenames[source] = value[index]
                     break
+        return filenames
 
-        processed_data = {}
-
-        # Process each source
-        for source_id, filename in filenames.items():
-            try:
-                table_name = source_to_table[source_id]
+    def get_all_slices(self) -> List[Tuple[str, int, str]]:
+        """
+        List every (keyword, source ID, filename) slice stored in the database.
 
-                # Load and process raw data
-                df = self.load_raw_data(source_id, filename)
-                if df is None or df.empty:
+        Returns:
+            List of slice tuples in keyword order
+        """
+        slices = []
+        seen_keywords = set()
+        for tool_list in tool_file_dic.values():
+            for keyword in tool_list[1]:
+                if keyword in seen_keywords:
                     continue
+                seen_keywords.add(keyword)
+                for source_id, filename in self.get_source_files(keyword).items():
+                    slices.append((keyword, source_id, filename))
+        return slices
 
-                # Apply interpolation based on source type
-                if source_id in [3, 5]:  # Bain sources - cubic interpolation
-                    interpolated_df = self.apply_cubic_interpolation(df)
-                elif source_id == 2:  # Google Books - pattern-based interpolation
-                    interpolated_df = self.interpolate_gb_data(df, keyword)
-                else:  # Other sources - keep as-is (already monthly)
-                    interpolated_df = df
+    def get_slice_inputs(self, keyword: str, source_id: int, filename: str) -> List[Path]:
+        """
+        Get the files a slice is computed from.
+
+        Args:
+            keyword: The keyword of the slice
+            source_id: Source ID of the slice
+            filename: Raw CSV filename of the slice
+
+        Returns:
+            List of input file paths (the raw CSV, plus the monthly profile for Google Books)
+        """
+        inputs = [self.config.data_sources_path / filename]
+        if source_id == 2 and keyword in self.keyword_to_csv:
+            inputs.append(self.config.interpolation_profiles_path / self.keyword_to_csv[keyword])
+        return inputs
+
+    def fingerprint_key(self, path: Path) -> str:
+        """Get the metadata key under which a file's fingerprint is stored."""
+        try:
+            relative = Path(path).resolve().relative_to(self.config.project_root.resolve())
+        except ValueError:
+            relative = Path(path)
+        return f"fingerprint:{relative.as_posix()}"
+
+    @staticmethod
+    def file_fingerprint(path: Path, previous: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Fingerprint a file by size, modification time and content hash.
 
-                # Normalize to 0-100 scale
-                normalized_df = self.normalize_data(interpolated_df)
+        See raw_data.file_fingerprint; the file is only hashed when its size or
+        modification time differ from the previous fingerprint.
 
-                # Convert to database format
-                data_batch = self.convert_to_batch_format(normalized_df, keyword)
+        Args:
+            path: File to fingerprint
+            previous: Previously stored fingerprint, if any
+
+        Returns:
+            Fingerprint dictionary, or None if the file does not exist
+        """
+        return file_fingerprint(path, previous)
+
+    def find_changed_slices(self, db) -> Tuple[List[Tuple[str, int, str]], Dict[str, Optional[Dict[str, Any]]]]:
+        """
+        Compare input files against the fingerprints stored in the database metadata.
+
+        Args:
+            db: Database manager instance
+
+        Returns:
+            Tuple of (slices with a changed, new or removed input file,
+            current fingerprints keyed by metadata key)
+        """
+        metadata = db.get_metadata() if db.database_exists() else {}
+        changed = []
+        fingerprints = {}
+
+        for keyword, source_id, filename in self.get_all_slices():
+            slice_changed = False
+            for path in self.get_slice_inputs(keyword, source_id, filename):
+                key = self.fingerprint_key(path)
+                # A stored "null" fingerprint records a file that did not exist
+                stored = json.loads(metadata[key]) if key in metadata else None
+                if key not in fingerprints:
+                    fingerprints[key] = self.file_fingerprint(path, stored)
+                current = fingerprints[key]
+                if key not in metadata or (stored or {}).get("blake2b") != (current or {}).get("blake2b"):
+                    slice_changed = True
+            if slice_changed:
+                changed.append((keyword, source_id, filename))
+
+        return changed, fingerprints
+
+    def process_keyword_data(self, keyword: str, verbose: bool = False) -> Dict[str, List[Tuple[str, str, float]]]:
+        """
+        Process data for a specific keyword.
+
+        Args:
+            keyword: The keyword to process
+            verbose: Enable verbose output
+
+        Returns:
+            Dictionary mapping table names to data batches
+        """
+        processed_data = {}
+
+        # Process each source
+        for source_id, filename in self.get_source_files(keyword).items():
+            try:
+                table_name = SOURCE_TABLES[source_id]
+                data_batch = self.process_source_data(keyword, source_id, filename)
+                if data_batch is None:
+                    continue
                 processed_data[table_name] = data_batch
 
                 if verbose:
@@ -187,6 +385,40 @@ class DataProcessor:
 
         return processed_data
 
+    def process_source_data(self, keyword: str, source_id: int, filename: str) -> Optional[List[Tuple[str, str, float]]]:
+        """
+        Process one (keyword, source) slice from its raw CSV file.
+
+        Args:
+            keyword: The keyword to process
+            source_id: Source ID (1=Google Trends, 2=Google Books, etc.)
+            filename: Raw CSV filename
+
+        Returns:
+            List of tuples (date, keyword, value), or None if the raw file is missing or empty
+
+        Raises:
+            Whatever load_raw_data raises for a file that cannot be read or parsed
+        """
+        # Load and process raw data
+        df = self.load_raw_data(source_id, filename)
+        if df is None or df.empty:
+            return None
+
+        # Apply interpolation based on source type
+        if source_id in [3, 5]:  # Bain sources - cubic interpolation
+            interpolated_df = self.apply_cubic_interpolation(df)
+        elif source_id == 2:  # Google Books - pattern-based interpolation
+            interpolated_df = self.interpolate_gb_data(df, keyword)
+        else:  # Other sources - keep as-is (already monthly)
+            interpolated_df = df
+
+        # Normalize to 0-100 scale
+        normalized_df = self.normalize_data(interpolated_df)
+
+        # Convert to database format
+        return self.convert_to_batch_format(normalized_df, keyword)
+
     def load_raw_data(self, source: int, filename: str) -> Optional[pd.DataFrame]:
         """
         Load raw CSV data for a specific source.
@@ -196,7 +428,11 @@ class DataProcessor:
             filename: CSV filename
 
         Returns:
-            DataFrame with loaded data or None if error
+            DataFrame with loaded data, or None if the file does not exist
+
+        Raises:
+            Whatever reading or parsing the file raises, so that a corrupted input
+            is reported as an error instead of being stored as an empty slice
         """
         cache_key = f"{source}_{filename}"
         if cache_key in self._raw_data_cache:
@@ -209,40 +445,37 @@ class DataProcessor:
             return None
 
         try:
-            # Read CSV file
-            df = pd.read_csv(file_path, index_col=0)
-            df.index = df.index.str.strip()
-
-            # Convert index to datetime based on source type
-            if source == 2:  # Google Books Ngrams - keep as annual for now
-                df.index = pd.to_datetime(df.index.str.split('-').str[0], format='%Y')
-            else:  # Other sources
-                df.index = pd.to_datetime(df.index + '-01', format='%Y-%m-%d')
-
-            # Cache the raw data
-            self._raw_data_cache[cache_key] = df.copy()
+            # Read CSV file (parsed tables are reused from the raw data cache) and convert
+            # the index to datetime based on source type: Google Books Ngrams stays annual for now
+            df = load_dbase_csv(file_path, dates='annual' if source == 2 else 'monthly', loader=self._raw_loader)
+        except Exception as e:
+            print(f"Error loading data for source {source}: {e}")
+            raise
 
-            # Limit cache size
-            if len(self._raw_data_cache) > 20:
-                oldest_key = next(iter(self._raw_data_cache))
-                del self._raw_data_cache[oldest_key]
+        # Cache the raw data
+        self._raw_data_cache[cache_key] = df.copy()
 
-            return df
+        # Limit cache size
+        if len(self._raw_data_cache) > 20:
+            oldest_key = next(iter(self._raw_data_cache))
+            del self._raw_data_cache[oldest_key]
 
-        except Exception as e:
-            print(f"Error loading data for source {source}: {e}")
-            return None
+        return df
 
     def apply_cubic_interpolation(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Apply cubic interpolation to Bain data.
 
+        Columns sharing the same survey dates are fitted with one batched spline.
+
         Args:
             df: Input DataFrame
 
         Returns:
             DataFrame with interpolated monthly data
         """
+        self.prepare_cubic_interpolations([df])
+
         interpolated_data = pd.DataFrame()
 
         for column in df.columns:
@@ -251,6 +484,36 @@ class DataProcessor:
 
         return interpolated_data
 
+    def prepare_cubic_interpolations(self, frames: List[pd.DataFrame]):
+        """
+        Fit the cubic splines of many Bain series at once and cache the results.
+
+        The frames are aligned on their dates and every group of series with the
+        same survey dates is interpolated with a single spline call. Later calls to
+        cubic_interpolation for these series are served from the cache.
+
+        Args:
+            frames: Raw Bain DataFrames (annual points, one series per column)
+        """
+        pending = {}
+        for df in frames:
+            for column in df.columns:
+                cache_key = self._cubic_cache_key(df, column)
+                if cache_key not in self._interpolation_cache and cache_key not in pending:
+                    pending[cache_key] = df[column]
+
+        if not pending:
+            return
+
+        wide = pd.concat(list(pending.values()), axis=1, keys=list(pending.keys()), sort=True)
+        for cache_key, interpolated in batched_cubic_interpolation(wide).items():
+            self._interpolation_cache.put(cache_key, interpolated.rename(pending[cache_key].name), prefetched=True)
+
+    @staticmethod
+    def _cubic_cache_key(df: pd.DataFrame, kw: str) -> str:
+        """Build the interpolation cache key of a column from its values and dates."""
+        return interpolation_cache_key("cubic", df[kw], str(kw).encode())
+
     def cubic_interpolation(self, df: pd.DataFrame, kw: str) -> pd.Series:
         """
         Perform cubic interpolation for a specific column.
@@ -263,66 +526,28 @@ class DataProcessor:
             Series with interpolated values
         """
         # Create cache key
-        cache_key = f"cubic_{kw}_{hash(str(df[kw].values.tobytes()) if hasattr(df[kw].values, 'tobytes') else str(df[kw].values))}_{df.index.min()}_{df.index.max()}"
+        cache_key = self._cubic_cache_key(df, kw)
 
         # Check cache first
-        if cache_key in self._interpolation_cache:
-            return self._interpolation_cache[cache_key].copy()
+        cached = self._interpolation_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
         # Extract actual data points (non-NaN values)
         actual_data = df[~df[kw].isna()]
 
-        if actual_data.empty or len(actual_data) < 4:
+        if actual_data.empty or len(actual_data) < MIN_SPLINE_POINTS:
             # Fall back to linear interpolation
             result = self.linear_interpolation(df, kw)
-            self._interpolation_cache[cache_key] = result.copy()
+            self._interpolation_cache.put(cache_key, result)
             return result
 
-        # Get min and max values for clipping
-        original_min = actual_data[kw].min()
-        original_max = actual_data[kw].max()
-        clip_min = original_min
-        clip_max = original_max
-
-        # Ensure index is sorted and datetime
-        actual_data = actual_data.sort_index()
-        actual_data.index = pd.to_datetime(actual_data.index)
-
-        # Convert dates to numerical values
-        x = (actual_data.index - pd.Timestamp('1970-01-01')).days.values.astype(float)
-        y = actual_data[kw].values
-
-        # Create Cubic Spline
-        from scipy.interpolate import CubicSpline
-        cs = CubicSpline(x, y, bc_type='natural')
-
-        # Interpolate at monthly frequency
-        monthly_date_range = pd.date_range(
-            start=actual_data.index.min(),
-            end=actual_data.index.max(),
-            freq='MS'
-        )
-
-        if monthly_date_range.empty:
-            monthly_date_range = pd.date_range(start=actual_data.index.min(), periods=1, freq='MS')
-
-        x_interp_monthly = (monthly_date_range - pd.Timestamp('1970-01-01')).days.values.astype(float)
-        y_interp_monthly = cs(x_interp_monthly)
-
-        # Clip values
-        y_interp_monthly_clipped = np.clip(y_interp_monthly, clip_min, clip_max)
-        df_monthly = pd.Series(y_interp_monthly_clipped, index=monthly_date_range, name=kw)
-
-        # Force original points into monthly data
-        for idx, val in actual_data[kw].items():
-            idx_ts = pd.Timestamp(idx).normalize()
-            if idx_ts in df_monthly.index:
-                df_monthly.loc[idx_ts] = val
-
-        df_monthly = df_monthly.sort_index()
+        # Spline evaluated at monthly frequency, clipped to the original range,
+        # with the original points forced back in
+        df_monthly = batched_cubic_interpolation(df, [kw])[kw]
 
         # Cache the result
-        self._interpolation_cache[cache_key] = df_monthly.copy()
+        self._interpolation_cache.put(cache_key, df_monthly)
 
         return df_monthly
 
@@ -338,11 +563,12 @@ class DataProcessor:
             Series with interpolated values
         """
         # Create cache key
-        cache_key = f"linear_{kw}_{hash(str(df[kw].values.tobytes()) if hasattr(df[kw].values, 'tobytes') else str(df[kw].values))}_{df.index.min()}_{df.index.max()}"
+        cache_key = interpolation_cache_key("linear", df[kw], str(kw).encode())
 
         # Check cache first
-        if cache_key in self._interpolation_cache:
-            return self._interpolation_cache[cache_key].copy()
+        cached = self._interpolation_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
         # Extract actual data points
         actual_data = df[~df[kw].isna()]
@@ -350,7 +576,7 @@ class DataProcessor:
         if actual_data.empty:
             # Return original if no actual data
             result = pd.Series(df[kw].values, index=df.index, name=kw)
-            self._interpolation_cache[cache_key] = result.copy()
+            self._interpolation_cache.put(cache_key, result)
             return result
 
         # Create date range for interpolation
@@ -366,7 +592,7 @@ class DataProcessor:
                 df_interpolated.loc[idx] = actual_data.loc[idx, kw]
 
         # Cache the result
-        self._interpolation_cache[cache_key] = df_interpolated.copy()
+        self._interpolation_cache.put(cache_key, df_interpolated)
 
         return df_interpolated
 
@@ -384,49 +610,79 @@ class DataProcessor:
         if gb_df.empty:
             return gb_df
 
-        # Get the column name
-        gb_col = gb_df.columns[0]
-
-        # Create monthly index for all years in GB data
-        gb_years = gb_df.index.year.unique()
-        monthly_index = pd.date_range(start=f'{gb_years.min()}-01-01',
-                                      end=f'{gb_years.max()}-12-31',
-                                      freq='MS')
+        cache_key = self._gb_cache_key(gb_df, keyword)
+        if cache_key not in self._interpolation_cache:
+            self.prepare_gb_interpolations({keyword: gb_df})
 
-        # Get CSV filename for this keyword
-        csv_filename = self.keyword_to_csv.get(keyword)
+        return self._interpolation_cache.get(cache_key)
 
-        monthly_percentages = None
-        if csv_filename:
-            monthly_percentages = self.load_pattern_file(csv_filename)
-
-        # Use even distribution if no pattern found
-        if monthly_percentages is None:
-            monthly_percentages = np.full(12, 100/12)
-
-        # Initialize monthly data
-        monthly_data = []
-
-        for year in gb_years:
-            annual_value = gb_df.loc[gb_df.index.year == year, gb_col].iloc[0] if not gb_df.loc[gb_df.index.year == year].empty else 0
+    def prepare_gb_interpolations(self, frames: Dict[str, pd.DataFrame]):
+        """
+        Expand the Google Books series of many keywords to monthly values at once.
 
-            # Apply monthly percentages
-            monthly_values = (monthly_percentages / 100) * annual_value
+        The annual values of all keywords are aligned into a (keywords x years) array
+        and multiplied with the (keywords x 12) profile matrix, giving every monthly
+        value in one (keywords x years x 12) array. Results are cached for
+        interpolate_gb_data.
 
-            # Add monthly values for this year
-            year_start = pd.Timestamp(f'{year}-01-01')
-            for month in range(12):
-                monthly_data.append({
-                    'date': year_start + pd.DateOffset(months=month),
-                    gb_col: monthly_values[month]
-                })
+        Args:
+            frames: Mapping from keyword to its raw annual Google Books DataFrame
+        """
+        pending = {
+            keyword: gb_df for keyword, gb_df in frames.items()
+            if not gb_df.empty and self._gb_cache_key(gb_df, keyword) not in self._interpolation_cache
+        }
+        if not pending:
+            return
+
+        # The first value of each year, in order of appearance
+        series_years, series_values = {}, {}
+        for keyword, gb_df in pending.items():
+            years = gb_df.index.year
+            first = ~years.duplicated()
+            series_years[keyword] = years[first].to_numpy()
+            series_values[keyword] = gb_df.iloc[:, 0].to_numpy()[first]
+
+        all_years = np.unique(np.concatenate(list(series_years.values())))
+        positions = {keyword: np.searchsorted(all_years, years) for keyword, years in series_years.items()}
+
+        annual = np.full((len(pending), len(all_years)), np.nan)
+        for row, keyword in enumerate(pending):
+            annual[row, positions[keyword]] = series_values[keyword]
+
+        monthly = expand_annual_to_monthly(annual, self.get_profile_matrix(list(pending)))
+
+        for row, (keyword, gb_df) in enumerate(pending.items()):
+            years = series_years[keyword]
+            months = (years[:, None] * 12 + np.arange(12) - MONTH_EPOCH).ravel()
+            index = pd.DatetimeIndex(months.astype('datetime64[M]').astype('datetime64[ns]'), name=gb_df.index.name)
+            result_df = pd.DataFrame({gb_df.columns[0]: monthly[row, positions[keyword]].ravel()}, index=index)
+            self._interpolation_cache.put(self._gb_cache_key(gb_df, keyword), result_df, prefetched=True)
+
+    def get_profile_matrix(self, keywords: List[str]) -> np.ndarray:
+        """
+        Get the monthly distribution profiles of several keywords as one matrix.
 
-        # Create DataFrame
-        result_df = pd.DataFrame(monthly_data)
-        result_df = result_df.set_index('date')
-        result_df.index.name = gb_df.index.name
+        Args:
+            keywords: Keywords to look up
 
-        return result_df
+        Returns:
+            Array of shape (keywords, 12) with monthly percentages; keywords without a
+            profile get an even distribution
+        """
+        profiles = np.full((len(keywords), 12), 100 / 12)
+        for row, keyword in enumerate(keywords):
+            csv_filename = self.keyword_to_csv.get(keyword)
+            monthly_percentages = self.load_pattern_file(csv_filename) if csv_filename else None
+            if monthly_percentages is not None:
+                profiles[row] = monthly_percentages
+        return profiles
+
+    def _gb_cache_key(self, gb_df: pd.DataFrame, keyword: str) -> str:
+        """Build the interpolation cache key of a Google Books series and its monthly profile."""
+        profile = self.get_profile_matrix([keyword])
+        extra = f"{gb_df.columns[0]}|{gb_df.index.name}".encode() + profile.tobytes()
+        return interpolation_cache_key("gb", gb_df.iloc[:, 0], extra)
 
     def load_pattern_file(self, csv_filename: str) -> Optional[np.ndarray]:
         """
@@ -491,19 +747,11 @@ class DataProcessor:
         Returns:
             List of tuples (date, keyword, value)
         """
-        batch_data = []
-
-        # Reset index to get dates as column
-        df_reset = df.reset_index()
-        date_col = df_reset.columns[0]
-        value_col = df_reset.columns[1]
-
-        for _, row in df_reset.iterrows():
-            date_str = pd.to_datetime(row[date_col]).strftime('%Y-%m-%d')
-            value = float(row[value_col])
-            batch_data.append((date_str, keyword, value))
+        # Built column-wise from arrays: one strftime over the index instead of per row
+        dates = pd.DatetimeIndex(pd.to_datetime(df.index)).strftime('%Y-%m-%d')
+        values = df.iloc[:, 0].to_numpy(dtype=np.float64)
 
-        return batch_data
+        return list(zip(dates, [keyword] * len(values), values.tolist()))
 
     def clear_caches(self):
         """Clear all internal caches."""
@@ -511,16 +759,50 @@ class DataProcessor:
         self._pattern_cache.clear()
         self._interpolation_cache.clear()
 
-    def get_cache_stats(self) -> Dict[str, int]:
+    def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
+        interpolation_stats = self._interpolation_cache.stats()
         return {
             'raw_data_cache': len(self._raw_data_cache),
             'pattern_cache': len(self._pattern_cache),
             'interpolation_cache': len(self._interpolation_cache),
+            'interpolation_hits': interpolation_stats['hits'],
+            'interpolation_misses': interpolation_stats['misses'],
+            'interpolation_hit_rate': interpolation_stats['hit_rate'],
+            'interpolation_disk_hits': interpolation_stats['disk_hits'],
+            'interpolation_disk_writes': interpolation_stats['disk_writes'],
+            'interpolation_evictions': interpolation_stats['evictions'],
+            'raw_files_parsed': self._raw_loader.stats()['parsed'],
+            'raw_cache_hits': self._raw_loader.stats()['cache_hits'],
             'total_cached_items': len(self._raw_data_cache) + len(self._pattern_cache) + len(self._interpolation_cache)
         }
 
 
+# Data processor used by each worker process of a parallel build
+_worker_processor = None
+
+
+def _init_worker(config, disk_cache: bool = False):
+    """
+    Initialize a worker process with the parent's configuration.
+
+    Args:
+        config: Configuration instance of the parent process
+        disk_cache: Whether the parent uses the on-disk caches
+    """
+    global _worker_processor
+    _worker_processor = DataProcessor()
+    _worker_processor.config = config
+    if disk_cache:
+        _worker_processor.enable_disk_cache()
+
+
+def _process_keyword_slices_in_worker(group: Tuple[str, List[Tuple[int, str]]]):
+    """Process one keyword group inside a worker process."""
+    keyword, sources = group
+    return _worker_processor.process_keyword_slices(keyword, sources)
+
+
 # Global data processor instance
 _data_processor_instance = None
 
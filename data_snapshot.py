@@ -0,0 +1,240 @@
+"""
+Columnar snapshot of the database for the Management Tools Analysis Dashboard.
+
+The whole dataset is small (23 tools x 5 sources x a few hundred months), so it is
+also written as a dense value cube next to the SQLite file. Workers memory-map the
+arrays, and reading a keyword becomes array slicing instead of a SQL query.
+
+Layout (one .npy file per array):
+    months.npy    int64 month ordinals (year * 12 + month - 1), ascending
+    keywords.npy  unicode keyword names, sorted
+    sources.npy   int64 source IDs (1=Google Trends ... 5=Bain Satisfaction)
+    values.npy    float64 cube [keyword, source, month], NaN where there is no data
+    mask.npy      bool cube [keyword, source, month], True where there is data
+    manifest.json database identity used to detect a stale snapshot
+"""
+
+import json
+import os
+import shutil
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Any
+
+from database import SOURCE_TABLES, months_to_index
+
+ARRAY_NAMES = ("months", "keywords", "sources", "values", "mask")
+MANIFEST_NAME = "manifest.json"
+
+
+class DataSnapshot:
+    """
+    Read-only, memory-mapped view of the full dataset.
+
+    Arrays are opened with np.load(mmap_mode='r'), so a snapshot loaded before
+    gunicorn forks is shared by all workers through the OS page cache.
+    """
+
+    def __init__(self, directory: Path):
+        """
+        Memory-map a snapshot written by write_snapshot.
+
+        Args:
+            directory: Snapshot directory
+
+        Raises:
+            FileNotFoundError: If the snapshot is missing or incomplete
+        """
+        self.directory = Path(directory)
+        with open(self.directory / MANIFEST_NAME, encoding='utf-8') as f:
+            self.manifest = json.load(f)
+
+        self.months = np.load(self.directory / "months.npy", mmap_mode='r')
+        self.keywords = np.load(self.directory / "keywords.npy", mmap_mode='r')
+        self.sources = np.load(self.directory / "sources.npy", mmap_mode='r')
+        self.values = np.load(self.directory / "values.npy", mmap_mode='r')
+        self.mask = np.load(self.directory / "mask.npy", mmap_mode='r')
+
+        self._keyword_index = {str(keyword): i for i, keyword in enumerate(self.keywords)}
+        self._source_index = {int(source_id): i for i, source_id in enumerate(self.sources)}
+
+    def has_keyword(self, keyword: str) -> bool:
+        """Check whether the snapshot contains a keyword."""
+        return keyword in self._keyword_index
+
+    def get_views(self, keyword: str, sources: List[int]) -> Dict[int, Tuple[np.ndarray, np.ndarray]]:
+        """
+        Get zero-copy views of a keyword's series over the full month axis.
+
+        Args:
+            keyword: The keyword to read
+            sources: List of source IDs
+
+        Returns:
+            Dictionary mapping source ID to (values view, mask view); sources without
+            any data are omitted
+        """
+        keyword_pos = self._keyword_index.get(keyword)
+        if keyword_pos is None:
+            return {}
+
+        views = {}
+        for source_id in sources:
+            source_pos = self._source_index.get(source_id)
+            if source_pos is None or source_id in views:
+                continue
+            mask_view = self.mask[keyword_pos, source_pos]
+            if mask_view.any():
+                views[source_id] = (self.values[keyword_pos, source_pos], mask_view)
+        return views
+
+    def get_combined(self, keyword: str, sources: List[int],
+                     column_names: Optional[Dict[int, str]] = None) -> Tuple[pd.DataFrame, List[int]]:
+        """
+        Build the wide frame returned by DatabaseManager.get_combined_data_for_keyword.
+
+        Args:
+            keyword: The keyword to read
+            sources: List of source IDs
+            column_names: Optional mapping from source ID to column name
+
+        Returns:
+            Tuple of (wide DataFrame indexed by date, list of source IDs with data)
+        """
+        views = self.get_views(keyword, sources)
+        if not views:
+            return pd.DataFrame(), []
+
+        valid_sources = list(views.keys())
+        keyword_pos = self._keyword_index[keyword]
+        source_positions = [self._source_index[source_id] for source_id in valid_sources]
+
+        # Months where at least one of the selected sources has data
+        rows = self.mask[keyword_pos, source_positions].any(axis=0)
+
+        names = column_names or {}
+        wide = pd.DataFrame(
+            self.values[keyword_pos, source_positions][:, rows].T,
+            index=months_to_index(self.months[rows]),
+            columns=[names.get(source_id, source_id) for source_id in valid_sources]
+        )
+        return wide, valid_sources
+
+    def matches(self, identity: Dict[str, Any]) -> bool:
+        """
+        Check whether the snapshot was built from a database with the given identity.
+
+        Args:
+            identity: Result of snapshot_identity for the current database
+
+        Returns:
+            True if the snapshot is current
+        """
+        return self.manifest.get("identity") == identity
+
+
+def snapshot_identity(db_manager) -> Dict[str, Any]:
+    """
+    Describe the database contents a snapshot is built from.
+
+    Args:
+        db_manager: Database manager instance
+
+    Returns:
+        Dictionary of metadata values that change whenever the data is rebuilt
+    """
+    metadata = db_manager.get_metadata()
+    return {key: metadata.get(key) for key in ("schema_version", "created_at", "last_updated", "total_records")}
+
+
+def write_snapshot(db_manager, directory: Path) -> Dict[str, Any]:
+    """
+    Export all data tables into a columnar snapshot.
+
+    The arrays are written to a temporary directory that then replaces the old
+    snapshot, so readers never see a half-written snapshot.
+
+    Args:
+        db_manager: Database manager instance to read from
+        directory: Snapshot directory to create or replace
+
+    Returns:
+        Dictionary with the cube shape and size in bytes
+    """
+    directory = Path(directory)
+    source_ids = np.array(sorted(SOURCE_TABLES), dtype=np.int64)
+
+    with db_manager.get_connection() as conn:
+        keyword_rows = conn.execute("SELECT id, keyword FROM keywords ORDER BY keyword").fetchall()
+        table_rows = {
+            source_id: conn.execute(
+                f"SELECT keyword_id, month, value FROM {SOURCE_TABLES[source_id]}"
+            ).fetchall()
+            for source_id in source_ids.tolist()
+        }
+
+    keyword_ids = np.array([row[0] for row in keyword_rows], dtype=np.int64)
+    keywords = np.array([row[1] for row in keyword_rows], dtype=str)
+
+    all_months = [row[1] for rows in table_rows.values() for row in rows]
+    if all_months:
+        months = np.arange(min(all_months), max(all_months) + 1, dtype=np.int64)
+    else:
+        months = np.zeros(0, dtype=np.int64)
+
+    values = np.full((len(keywords), len(source_ids), len(months)), np.nan)
+    mask = np.zeros(values.shape, dtype=bool)
+
+    keyword_lookup = {keyword_id: pos for pos, keyword_id in enumerate(keyword_ids.tolist())}
+    for source_pos, source_id in enumerate(source_ids.tolist()):
+        rows = table_rows[source_id]
+        if not rows:
+            continue
+        ids, row_months, row_values = (np.asarray(col) for col in zip(*rows))
+        keyword_pos = np.array([keyword_lookup[keyword_id] for keyword_id in ids.tolist()], dtype=np.int64)
+        month_pos = row_months.astype(np.int64) - months[0]
+        values[keyword_pos, source_pos, month_pos] = row_values.astype(np.float64)
+        mask[keyword_pos, source_pos, month_pos] = True
+
+    staging = directory.with_name(directory.name + ".tmp")
+    if staging.exists():
+        shutil.rmtree(staging)
+    staging.mkdir(parents=True)
+
+    arrays = {"months": months, "keywords": keywords, "sources": source_ids, "values": values, "mask": mask}
+    for name in ARRAY_NAMES:
+        np.save(staging / f"{name}.npy", arrays[name])
+    with open(staging / MANIFEST_NAME, 'w', encoding='utf-8') as f:
+        json.dump({"identity": snapshot_identity(db_manager), "shape": list(values.shape)},
+                  f, indent=2, ensure_ascii=False)
+
+    if directory.exists():
+        retired = directory.with_name(directory.name + ".old")
+        if retired.exists():
+            shutil.rmtree(retired)
+        os.replace(directory, retired)
+        os.replace(staging, directory)
+        shutil.rmtree(retired)
+    else:
+        os.replace(staging, directory)
+
+    return {"shape": values.shape, "bytes": int(values.nbytes + mask.nbytes)}
+
+
+def load_snapshot(directory: Path) -> Optional[DataSnapshot]:
+    """
+    Memory-map a snapshot if one exists.
+
+    Args:
+        directory: Snapshot directory
+
+    Returns:
+        DataSnapshot instance, or None if the snapshot is missing or unreadable
+    """
+    try:
+        return DataSnapshot(directory)
+    except (OSError, ValueError) as e:
+        if Path(directory).exists():
+            print(f"Warning: Could not load data snapshot from {directory}: {e}")
+        return None
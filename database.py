@@ -3,20 +3,380 @@ Database operations module for the Management Tools Analysis Dashboard.
 Provides SQLite database management with connection pooling and data retrieval.
 """
 
+import hashlib
+import os
 import sqlite3
+import threading
+import numpy as np
 import pandas as pd
+from collections import deque
 from contextlib import contextmanager
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Callable, Dict, List, Any, Optional, Tuple
 from pathlib import Path
 import time
 import logging
 from datetime import datetime
 
 from config import get_config
+from query_metrics import QueryMetricsSink, create_metrics_sink
+from analytics import ANALYTICS_VERSION, deserialize_payload, serialize_payload, source_set_mask
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+# Source IDs (1=Google Trends, 2=Google Books, 3=Bain Usability, 4=Crossref, 5=Bain Satisfaction) to table names
+SOURCE_TABLES = {
+    1: "google_trends",
+    2: "google_books",
+    3: "bain_usability",
+    4: "crossref",
+    5: "bain_satisfaction"
+}
+
+# Layout written by create_schema: 2.0 = keyword dictionary, integer months, WITHOUT ROWID tables;
+# 2.1 = series_stats table maintained on ingest; 2.2 = analytics table of precomputed artifacts
+SCHEMA_VERSION = "2.2"
+
+# Data tables store dates as month ordinals (year * 12 + month - 1); this is the ordinal of 1970-01
+MONTH_EPOCH = 1970 * 12
+
+
+def date_to_month(date_value) -> int:
+    """
+    Convert a first-of-month date to its month ordinal.
+
+    Args:
+        date_value: ISO date string ('YYYY-MM-DD') or datetime-like value
+
+    Returns:
+        Month ordinal (year * 12 + month - 1)
+
+    Raises:
+        ValueError: If the date is not the first day of a month
+    """
+    if isinstance(date_value, str):
+        year, month, day = int(date_value[:4]), int(date_value[5:7]), int(date_value[8:10] or 1)
+    else:
+        timestamp = pd.Timestamp(date_value)
+        year, month, day = timestamp.year, timestamp.month, timestamp.day
+    if day != 1:
+        raise ValueError(f"Only monthly data can be stored, got date {date_value}")
+    return year * 12 + month - 1
+
+
+def months_to_index(months) -> pd.DatetimeIndex:
+    """
+    Convert month ordinals to a DatetimeIndex of first-of-month dates.
+
+    Args:
+        months: Sequence or array of month ordinals
+
+    Returns:
+        DatetimeIndex with nanosecond resolution
+    """
+    months = np.asarray(months, dtype=np.int64)
+    return pd.DatetimeIndex((months - MONTH_EPOCH).astype('datetime64[M]').astype('datetime64[ns]'))
+
+
+def date_to_month_bound(date_value, upper: bool = False) -> int:
+    """
+    Convert an arbitrary date to the month ordinal used as a range bound.
+
+    A lower bound in the middle of a month excludes that month (its data point is
+    dated on the 1st), an upper bound includes it.
+
+    Args:
+        date_value: ISO date string or datetime-like value
+        upper: True for an inclusive end bound, False for a start bound
+
+    Returns:
+        Month ordinal (year * 12 + month - 1)
+    """
+    timestamp = pd.Timestamp(date_value)
+    month = timestamp.year * 12 + timestamp.month - 1
+    if not upper and (timestamp.day != 1 or timestamp != timestamp.normalize()):
+        month += 1
+    return month
+
+
+def month_to_date_string(month: Optional[int]) -> Optional[str]:
+    """Format a month ordinal as an ISO date string ('YYYY-MM-01')."""
+    if month is None:
+        return None
+    return f"{month // 12:04d}-{month % 12 + 1:02d}-01"
+
+
+def schema_version_key(version: str) -> Tuple[int, ...]:
+    """
+    Turn a dotted schema version into a tuple that compares numerically.
+
+    Args:
+        version: Version string such as "2.2" or "2.10"
+
+    Returns:
+        Tuple of integer components (so "2.10" sorts after "2.9")
+    """
+    return tuple(int(part) for part in str(version).split('.'))
+
+
+def new_data_version() -> str:
+    """Create a unique identifier for a published version of the data."""
+    return f"{datetime.now().strftime('%Y%m%dT%H%M%S')}-{os.urandom(4).hex()}"
+
+
+def _frame_nbytes(df: Optional[pd.DataFrame]) -> int:
+    """Bytes held by a float DataFrame's values and index (0 for None)."""
+    # DataFrame.memory_usage costs ~0.5 ms; a single-dtype frame's to_numpy() is a free view
+    return df.index.nbytes + df.to_numpy().nbytes if df is not None else 0
+
+
+class ReadOnlyDatabaseError(RuntimeError):
+    """Raised when a write is attempted on a database opened in read-only serving mode."""
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of pre-configured SQLite connections.
+
+    Connections are created lazily up to ``max_connections`` and handed back to
+    the pool after use, so PRAGMA setup and the page cache survive between
+    callbacks. The pool belongs to the process that created it: after a fork
+    (gunicorn workers with ``preload_app``) inherited connections are dropped
+    and a fresh set is opened in the child.
+    """
+
+    def __init__(self, factory: Callable[[], sqlite3.Connection], max_connections: int = 10,
+                 timeout: float = 30.0, health_check_interval: float = 60.0):
+        """
+        Initialize the pool.
+
+        Args:
+            factory: Callable returning a new, fully configured connection
+            max_connections: Upper bound on open connections per process
+            timeout: Seconds to wait for a free connection before giving up
+            health_check_interval: Idle seconds after which a connection is pinged before reuse
+        """
+        self.factory = factory
+        self.max_connections = max(1, int(max_connections))
+        self.timeout = float(timeout)
+        self.health_check_interval = float(health_check_interval)
+
+        self._lock = threading.Lock()
+        self._available = threading.Condition(self._lock)
+        self._idle = deque()  # (connection, last_used) pairs, most recently used on the right
+        self._checked_out = {}  # id(connection) -> generation it was opened in
+        self._size = 0
+        self._generation = 0
+        self._pid = os.getpid()
+        self._reset_stats()
+
+        # Optional callable receiving each acquisition's wait time in seconds
+        self.wait_observer = None
+
+    def _reset_stats(self):
+        """Reset acquisition counters."""
+        self._stats = {
+            "acquisitions": 0,
+            "waits": 0,
+            "timeouts": 0,
+            "total_wait_time": 0.0,
+            "max_wait_time": 0.0,
+            "created": 0,
+            "discarded": 0,
+            "health_check_failures": 0
+        }
+
+    def _check_process(self):
+        """Forget connections inherited from a parent process. Caller holds the lock."""
+        if self._pid != os.getpid():
+            self._idle.clear()
+            self._checked_out.clear()
+            self._size = 0
+            self._generation += 1
+            self._pid = os.getpid()
+            self._reset_stats()
+
+    def acquire(self, timeout: Optional[float] = None) -> sqlite3.Connection:
+        """
+        Take a connection from the pool, opening a new one if below the limit.
+
+        Args:
+            timeout: Seconds to wait for a free connection (defaults to the pool timeout)
+
+        Returns:
+            SQLite connection object
+
+        Raises:
+            TimeoutError: If no connection becomes available in time
+        """
+        timeout = self.timeout if timeout is None else timeout
+        start = time.perf_counter()
+        deadline = start + timeout
+        conn, last_used = None, None
+        waited = False
+
+        with self._available:
+            self._check_process()
+            generation = self._generation
+            while True:
+                if self._idle:
+                    conn, last_used = self._idle.pop()
+                    break
+                if self._size < self.max_connections:
+                    self._size += 1
+                    break
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    self._stats["timeouts"] += 1
+                    raise TimeoutError(
+                        f"Timed out after {timeout:.1f}s waiting for a database connection "
+                        f"({self.max_connections} in use)"
+                    )
+                waited = True
+                self._available.wait(remaining)
+
+            wait_time = time.perf_counter() - start
+            self._stats["acquisitions"] += 1
+            self._stats["total_wait_time"] += wait_time
+            self._stats["max_wait_time"] = max(self._stats["max_wait_time"], wait_time)
+            if waited:
+                self._stats["waits"] += 1
+
+        observer = self.wait_observer
+        if observer is not None:
+            observer(wait_time)
+
+        if conn is not None and time.monotonic() - last_used > self.health_check_interval:
+            if not self._is_healthy(conn):
+                with self._lock:
+                    self._stats["health_check_failures"] += 1
+                    self._stats["discarded"] += 1
+                self._close_quietly(conn)
+                conn = None
+
+        if conn is None:
+            try:
+                conn = self.factory()
+            except Exception:
+                with self._available:
+                    self._size -= 1
+                    self._available.notify()
+                raise
+            with self._lock:
+                self._stats["created"] += 1
+
+        with self._lock:
+            self._checked_out[id(conn)] = generation
+        return conn
+
+    def release(self, conn: sqlite3.Connection, discard: bool = False):
+        """
+        Return a connection to the pool.
+
+        Args:
+            conn: Connection previously obtained from acquire()
+            discard: Close the connection instead of keeping it (e.g. after an error)
+        """
+        with self._available:
+            if self._pid != os.getpid():
+                # Connection belongs to the parent process; never reuse it here
+                return
+            generation = self._checked_out.pop(id(conn), None)
+            if discard or generation != self._generation:
+                # Broken, or opened before the last close_all(): do not reuse
+                if generation is not None:
+                    self._size -= 1
+                self._stats["discarded"] += 1
+                self._available.notify()
+            else:
+                self._idle.append((conn, time.monotonic()))
+                self._available.notify()
+                return
+        self._close_quietly(conn)
+
+    @contextmanager
+    def connection(self, timeout: Optional[float] = None):
+        """
+        Context manager that acquires a connection and always returns it.
+
+        Connections left inside a transaction are rolled back; connections that
+        cannot be rolled back are discarded instead of being reused.
+        """
+        conn = self.acquire(timeout)
+        try:
+            yield conn
+        finally:
+            self.release(conn, discard=not self._rollback(conn))
+
+    def close_all(self):
+        """
+        Retire every connection in the pool.
+
+        Idle connections are closed immediately; connections currently in use
+        are closed when they are released. Later acquisitions open new ones.
+        """
+        with self._available:
+            self._check_process()
+            idle = list(self._idle)
+            self._idle.clear()
+            # Connections retired by an earlier call are already off the count
+            retired = [key for key, generation in self._checked_out.items() if generation is not None]
+            self._size -= len(idle) + len(retired)
+            for key in retired:
+                self._checked_out[key] = None
+            self._generation += 1
+            self._available.notify_all()
+        for conn, _ in idle:
+            self._close_quietly(conn)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get pool usage statistics.
+
+        Returns:
+            Dictionary with pool size and acquire-wait metrics
+        """
+        with self._lock:
+            self._check_process()
+            stats = dict(self._stats)
+            stats.update({
+                "max_connections": self.max_connections,
+                "open_connections": self._size,
+                "idle_connections": len(self._idle),
+                "in_use_connections": self._size - len(self._idle)
+            })
+        acquisitions = stats["acquisitions"]
+        stats["avg_wait_ms"] = round(1000 * stats["total_wait_time"] / acquisitions, 3) if acquisitions else 0.0
+        return stats
+
+    @staticmethod
+    def _is_healthy(conn: sqlite3.Connection) -> bool:
+        """Check that a pooled connection still answers queries."""
+        try:
+            conn.execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+
+    @staticmethod
+    def _rollback(conn: sqlite3.Connection) -> bool:
+        """Roll back any open transaction. Returns False if the connection is unusable."""
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+            return True
+        except sqlite3.Error:
+            return False
+
+    @staticmethod
+    def _close_quietly(conn: sqlite3.Connection):
+        """Close a connection, ignoring errors from already-broken handles."""
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+
 class DatabaseManager:
     """
     SQLite database manager for pre-interpolated data storage and retrieval.
@@ -24,51 +384,471 @@ class DatabaseManager:
     Handles schema creation, data insertion, querying, and connection management.
     """
 
-    def __init__(self):
-        """Initialize database manager with configuration."""
+    def __init__(self, db_path: Optional[Path] = None, read_only: Optional[bool] = None):
+        """
+        Initialize database manager with configuration.
+
+        Args:
+            db_path: Optional database file path (defaults to the configured path)
+            read_only: Open the database in immutable read-only serving mode. Defaults to
+                the "read_only" config setting, or to whether the database is sealed.
+        """
         self.config = get_config()
-        self.db_path = self.config.database_path
+        self.db_path = Path(db_path) if db_path else self.config.database_path
 
         # Ensure database directory exists
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
+        # Warm connections shared by all callbacks in this worker process
+        pool_config = self.config.get_connection_config()
+        self.connection_timeout = float(pool_config.get("timeout", 30.0))
+        self.mmap_size = int(pool_config.get("mmap_size", 268435456))
+
+        # Sealed databases are served through immutable, memory-mapped connections
+        if read_only is None:
+            read_only = self.config.database_config.get("read_only")
+        self._read_only_setting = read_only
+        self.read_only = self.is_sealed() if read_only is None else bool(read_only)
+
+        # Memory-mapped columnar snapshot, loaded on first use
+        self.snapshot_path = self.db_path.with_name(self.db_path.stem + "_snapshot")
+        self._snapshot = None
+        self._snapshot_loaded = False
+
+        # Notes and DOI index, loaded on first use
+        self.notes_db_path = self.db_path.parent / "notes_and_doi.db"
+        self._notes_index = None
+
+        # Connection pinned by bulk_load() and the thread that owns it
+        self._bulk_conn = None
+        self._bulk_thread = None
+
+        # Connection holding the file's write lock inside write_lock()
+        self._lock_conn = None
+        self.pool = ConnectionPool(
+            self._create_connection,
+            max_connections=pool_config.get("max_connections", 10),
+            timeout=self.connection_timeout,
+            health_check_interval=pool_config.get("health_check_interval", 60.0)
+        )
+
+        # Query instrumentation sink (None when disabled)
+        self.metrics = None
+        self.set_query_metrics(create_metrics_sink(self.config.database_config.get("metrics")))
+
+        # Hot-swap detection: files last seen on disk and the data_version being served
+        self.reload_check_interval = float(pool_config.get("reload_check_interval", 5.0))
+        self._watched_files = self._stat_watched_files()
+        self.data_version = self._read_data_version() if self.db_path.exists() else None
+        self._next_reload_check = time.monotonic() + self.reload_check_interval
+        self._reload_lock = threading.Lock()
+
+    def _create_connection(self) -> sqlite3.Connection:
+        """
+        Open and configure a new SQLite connection for the pool.
+
+        Returns:
+            SQLite connection object
+        """
+        if self.read_only:
+            return self._create_read_only_connection()
+
+        conn = sqlite3.connect(
+            str(self.db_path),
+            timeout=self.connection_timeout,
+            isolation_level=None,  # Enable autocommit mode
+            check_same_thread=False  # Pooled connections move between threads
+        )
+        try:
+            # Databases keep the rollback journal they are published with. Nothing writes to a
+            # served file, and -wal/-shm files are found by path, so they could end up shared
+            # between the old and the new file of a hot swap (see replace_database_file)
+            conn.execute("PRAGMA synchronous=NORMAL")  # Balance between performance and safety
+            conn.execute("PRAGMA cache_size=-64000")  # 64MB cache
+            conn.execute("PRAGMA temp_store=MEMORY")  # Store temp tables in memory
+        except Exception:
+            conn.close()
+            raise
+        return conn
+
+    def _create_read_only_connection(self) -> sqlite3.Connection:
+        """
+        Open an immutable, memory-mapped connection for serving a sealed database.
+
+        SQLite skips all locking and never creates -wal/-shm files, and pages are
+        read through mmap so forked workers share the OS page cache.
+
+        Returns:
+            SQLite connection object
+        """
+        if not self.db_path.exists():
+            raise FileNotFoundError(f"Database not found: {self.db_path}")
+
+        conn = sqlite3.connect(
+            f"{self.db_path.resolve().as_uri()}?mode=ro&immutable=1",
+            uri=True,
+            isolation_level=None,
+            check_same_thread=False
+        )
+        try:
+            conn.execute(f"PRAGMA mmap_size={self.mmap_size}")
+            conn.execute("PRAGMA temp_store=MEMORY")
+        except Exception:
+            conn.close()
+            raise
+        return conn
+
+    def _ensure_writable(self, operation: str):
+        """
+        Refuse write operations in read-only serving mode.
+
+        Args:
+            operation: Description of the attempted operation for the error message
+
+        Raises:
+            ReadOnlyDatabaseError: If the database was opened read-only
+        """
+        if self.read_only:
+            raise ReadOnlyDatabaseError(
+                f"Cannot {operation}: {self.db_path} is open in read-only serving mode. "
+                "Rebuild it with create_database.py, which opens the database read-write."
+            )
+
+    def is_sealed(self) -> bool:
+        """
+        Check whether the database file has been sealed for read-only serving.
+
+        Returns:
+            True if the metadata table marks the database as sealed
+        """
+        if not self.db_path.exists():
+            return False
+        try:
+            conn = sqlite3.connect(f"{self.db_path.resolve().as_uri()}?mode=ro", uri=True)
+            try:
+                row = conn.execute("SELECT value FROM metadata WHERE key = 'sealed'").fetchone()
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            return False
+        return bool(row) and row[0] == "1"
+
+    def seal(self):
+        """
+        Mark the database as finished so workers serve it in read-only mode.
+
+        Checkpoints the WAL into the main file and switches to a rollback journal, so the
+        database is a single self-contained file. Managers created afterwards open it
+        immutable; this manager's pooled connections are closed.
+        """
+        self._ensure_writable("seal the database")
+        with self.get_connection() as conn:
+            conn.execute("INSERT OR REPLACE INTO metadata (key, value) VALUES ('sealed', '1')")
+            conn.execute("INSERT OR REPLACE INTO metadata (key, value) VALUES ('sealed_at', ?)",
+                         [datetime.now().isoformat()])
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        self.close()
+
+        # journal_mode can only change while no other connection is open
+        conn = sqlite3.connect(str(self.db_path), timeout=self.connection_timeout)
+        try:
+            conn.execute("PRAGMA journal_mode=DELETE")
+        finally:
+            conn.close()
+
+    def unseal(self):
+        """Clear the sealed flag before the database is modified again."""
+        self._ensure_writable("unseal the database")
+        with self.get_connection() as conn:
+            conn.execute("DELETE FROM metadata WHERE key IN ('sealed', 'sealed_at')")
+
     @contextmanager
-    def get_connection(self, timeout: float = 30.0):
+    def get_connection(self, timeout: Optional[float] = None):
         """
-        Context manager for database connections.
+        Context manager for pooled database connections.
 
         Args:
-            timeout: Connection timeout in seconds
+            timeout: Seconds to wait for a free pooled connection (defaults to config)
 
         Yields:
             SQLite connection object
         """
-        conn = None
+        bulk_conn = self._bulk_conn
+        if bulk_conn is not None and self._bulk_thread == threading.get_ident():
+            # Bulk loads run every statement on one pinned connection
+            yield bulk_conn
+            return
+
+        if self.reload_check_interval > 0 and time.monotonic() >= self._next_reload_check:
+            self.check_for_new_version()
+
+        with self.pool.connection(timeout) as conn:
+            yield conn
+
+    def _stat_watched_files(self) -> Tuple:
+        """(inode, mtime, size) of the database, its WAL file and the snapshot manifest."""
+        from data_snapshot import MANIFEST_NAME
+
+        identity = []
+        for path in (self.db_path, Path(f"{self.db_path}-wal"), self.snapshot_path / MANIFEST_NAME):
+            try:
+                stat = path.stat()
+                identity.append((stat.st_ino, stat.st_mtime_ns, stat.st_size))
+            except FileNotFoundError:
+                identity.append(None)
+        return tuple(identity)
+
+    def _read_data_version(self) -> Optional[str]:
+        """Read data_version from the file currently at db_path, bypassing the pool."""
+        try:
+            conn = sqlite3.connect(f"{self.db_path.resolve().as_uri()}?mode=ro", uri=True,
+                                   timeout=self.connection_timeout)
+            try:
+                row = conn.execute("SELECT value FROM metadata WHERE key = 'data_version'").fetchone()
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            return None
+        return row[0] if row else None
+
+    def check_for_new_version(self) -> bool:
+        """
+        Switch to a database published by another process, if there is one.
+
+        Called from get_connection at most every reload_check_interval seconds. It stats
+        the database files, and only when they changed reads data_version from the file
+        on disk. If the file was replaced or data_version changed, the pool is retired
+        with close_all(): requests already holding a connection finish on the old file,
+        and later ones open the new file. A changed snapshot is reloaded on next use.
+
+        Returns:
+            True if the connections were reopened
+        """
+        with self._reload_lock:
+            self._next_reload_check = time.monotonic() + self.reload_check_interval
+            watched = self._stat_watched_files()
+            previous = self._watched_files
+            if watched == previous:
+                return False
+            self._watched_files = watched
+
+            # Snapshot directory or database changed: map the snapshot again on next use
+            self._snapshot = None
+            self._snapshot_loaded = False
+            if watched[:2] == previous[:2]:
+                return False
+
+            version = self._read_data_version()
+            same_file = (watched[0] or (None,))[0] == (previous[0] or (None,))[0]
+            if same_file and version == self.data_version:
+                return False
+
+            self.data_version = version
+            logging.info(f"Database {self.db_path} changed (data_version={version}), reopening connections")
+            if self._read_only_setting is None:
+                self.read_only = self.is_sealed()
+            self.pool.close_all()
+            return True
+
+    def get_data_version(self) -> str:
+        """
+        Identify the data currently being served, for keying caches shared between workers.
+
+        Runs the hot-swap check when it is due, so a newly published file is noticed
+        even before the next query.
+
+        Returns:
+            data_version from the metadata, or the database file's inode, mtime and
+            size if it was never stamped
+        """
+        if self.reload_check_interval > 0 and time.monotonic() >= self._next_reload_check:
+            self.check_for_new_version()
+        if self.data_version is not None:
+            return self.data_version
+        db_identity = self._watched_files[0] if self._watched_files else None
+        return "file-" + "-".join(map(str, db_identity)) if db_identity else "missing"
+
+    @contextmanager
+    def bulk_load(self):
+        """
+        Run a large load on one connection inside a single transaction.
+
+        For the duration of the block, every get_connection() call from this thread
+        returns the same connection with synchronous=OFF and journal_mode=MEMORY, and
+        the per-insert series statistics refresh is deferred to the end. This trades
+        crash safety for speed, so it is meant for building a fresh database file that
+        is swapped into place afterwards (see replace_database_file).
+
+        Yields:
+            The pinned SQLite connection
+        """
+        self._ensure_writable("bulk load")
+
+        # journal_mode can only change while no other connection is open
+        self.pool.close_all()
+        conn = self._create_connection()
+        conn.execute("PRAGMA journal_mode=MEMORY")
+        conn.execute("PRAGMA synchronous=OFF")
+        conn.execute("BEGIN")
+
+        self._bulk_conn = conn
+        self._bulk_thread = threading.get_ident()
         try:
-            conn = sqlite3.connect(
-                str(self.db_path),
-                timeout=timeout,
-                isolation_level=None  # Enable autocommit mode
-            )
-            conn.execute("PRAGMA journal_mode=WAL")  # Write-Ahead Logging for better concurrency
-            conn.execute("PRAGMA synchronous=NORMAL")  # Balance between performance and safety
-            conn.execute("PRAGMA cache_size=-64000")  # 64MB cache
-            conn.execute("PRAGMA temp_store=MEMORY")  # Store temp tables in memory
             yield conn
-        except Exception as e:
-            if conn:
-                conn.rollback()
-            raise e
+            for table_name in SOURCE_TABLES.values():
+                self._refresh_series_stats(conn, table_name)
+            conn.execute("COMMIT")
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
         finally:
-            if conn:
+            self._bulk_conn = None
+            self._bulk_thread = None
+            try:
+                conn.execute("PRAGMA journal_mode=DELETE")
+            finally:
                 conn.close()
 
-    def create_schema(self):
+    @staticmethod
+    @contextmanager
+    def _transaction(conn: sqlite3.Connection):
+        """
+        Run a block atomically, nesting as a savepoint inside an open transaction.
+
+        Args:
+            conn: Connection in autocommit mode
+        """
+        if conn.in_transaction:
+            conn.execute("SAVEPOINT batch")
+            try:
+                yield
+            except Exception:
+                conn.execute("ROLLBACK TO batch")
+                conn.execute("RELEASE batch")
+                raise
+            conn.execute("RELEASE batch")
+        else:
+            conn.execute("BEGIN")
+            try:
+                yield
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    @contextmanager
+    def write_lock(self):
+        """
+        Hold the write lock of the database file, e.g. while its replacement is prepared.
+
+        Readers carry on, while other writers wait for the lock (and fail after the
+        connection timeout) instead of writing changes a swap would discard. A file
+        still in WAL mode is first switched to a rollback journal, which SQLite only
+        allows while no other connection has it open. Nested calls reuse the lock.
+
+        Yields:
+            Connection holding the lock, or None if the database does not exist yet
+
+        Raises:
+            RuntimeError: If the file is in WAL mode and open in another process
+        """
+        self._ensure_writable("lock the database")
+        if self._lock_conn is not None or not self.db_path.exists():
+            yield self._lock_conn
+            return
+
+        self.close()
+        conn = sqlite3.connect(str(self.db_path), timeout=self.connection_timeout,
+                               isolation_level=None, check_same_thread=False)
+        try:
+            try:
+                journal_mode = conn.execute("PRAGMA journal_mode=DELETE").fetchone()[0]
+            except sqlite3.OperationalError:
+                journal_mode = "wal"
+            if journal_mode.lower() == "wal":
+                raise RuntimeError(
+                    f"{self.db_path} is in WAL mode and open in another process. Stop the dashboard "
+                    "workers once so it can be switched to a rollback journal."
+                )
+            conn.execute("BEGIN IMMEDIATE")
+            self._lock_conn = conn
+            yield conn
+        finally:
+            self._lock_conn = None
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            conn.close()
+
+    def replace_database_file(self, new_path: Path):
+        """
+        Atomically replace the database file with a fully built one.
+
+        The new file is switched to a rollback journal and renamed over the database
+        under its write lock (see write_lock). No -wal/-shm files exist for either
+        file, so nothing is deleted that readers of the old file still use.
+
+        Args:
+            new_path: Path of the new database file (on the same filesystem)
+        """
+        self._ensure_writable("replace the database file")
+        conn = sqlite3.connect(str(new_path), timeout=self.connection_timeout)
+        try:
+            conn.execute("PRAGMA journal_mode=DELETE")
+        finally:
+            conn.close()
+
+        with self.write_lock():
+            self.close()
+            os.replace(new_path, self.db_path)
+
+        self._snapshot = None
+        self._snapshot_loaded = False
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """
+        Get connection pool statistics for this worker process.
+
+        Returns:
+            Dictionary with pool size, reuse and acquire-wait metrics
+        """
+        return self.pool.stats()
+
+    def set_query_metrics(self, sink: Optional[QueryMetricsSink]):
+        """
+        Report query latency, rows, bytes and pool wait times to a sink.
+
+        Args:
+            sink: Metrics sink, or None to disable instrumentation
+        """
+        self.metrics = sink
+        self.pool.wait_observer = sink.observe_pool_wait if sink is not None else None
+
+    def get_query_stats(self) -> Optional[Dict[str, Any]]:
+        """
+        Get the aggregated query metrics of this worker process.
+
+        Returns:
+            Metrics dictionary, or None if the sink does not aggregate in process
+        """
+        stats = getattr(self.metrics, "stats", None)
+        return stats() if stats is not None else None
+
+    def close(self):
+        """Close all pooled connections."""
+        self.pool.close_all()
+
+    def create_schema(self, defer_indexes: bool = False):
         """
         Create database schema with all required tables and indexes.
 
         This includes data tables for each source and metadata table.
+
+        Args:
+            defer_indexes: Skip the configured secondary indexes; call create_indexes()
+                after a bulk load instead
         """
+        self._ensure_writable("create the schema")
         schema_sql = self._get_schema_sql()
 
         with self.get_connection() as conn:
@@ -76,38 +856,11 @@ class DatabaseManager:
             for statement in schema_sql:
                 conn.execute(statement)
 
-            # Create indexes for better query performance
-            indexes = [
-                "CREATE INDEX IF NOT EXISTS idx_google_trends_keyword_date ON google_trends(keyword, date)",
-                "CREATE INDEX IF NOT EXISTS idx_crossref_keyword_date ON crossref(keyword, date)",
-                "CREATE INDEX IF NOT EXISTS idx_google_books_keyword_date ON google_books(keyword, date)",
-                "CREATE INDEX IF NOT EXISTS idx_bain_usability_keyword_date ON bain_usability(keyword, date)",
-                "CREATE INDEX IF NOT EXISTS idx_bain_satisfaction_keyword_date ON bain_satisfaction(keyword, date)",
-                "CREATE INDEX IF NOT EXISTS idx_google_trends_keyword ON google_trends(keyword)",
-                "CREATE INDEX IF NOT EXISTS idx_crossref_keyword ON crossref(keyword)",
-                "CREATE INDEX IF NOT EXISTS idx_google_books_keyword ON google_books(keyword)",
-                "CREATE INDEX IF NOT EXISTS idx_bain_usability_keyword ON bain_usability(keyword)",
-                "CREATE INDEX IF NOT EXISTS idx_bain_satisfaction_keyword ON bain_satisfaction(keyword)"
-            ]
-
-            for index_sql in indexes:
-                try:
-                    conn.execute(index_sql)
-                except sqlite3.OperationalError as e:
-                    print(f"Warning: Could not create index: {e}")
-
-            # Create additional indexes from config if any
-            for index_sql in self.config.database_config.get("indexes", []):
-                try:
-                    conn.execute(index_sql)
-                except sqlite3.OperationalError as e:
-                    print(f"Warning: Could not create config index: {e}")
-
             # Insert schema version
             conn.execute("""
                 INSERT OR REPLACE INTO metadata (key, value)
                 VALUES (?, ?)
-            """, ("schema_version", self.config.database_config.get("schema_version", "1.0")))
+            """, ("schema_version", SCHEMA_VERSION))
 
             # Insert creation timestamp
             conn.execute("""
@@ -115,7 +868,22 @@ class DatabaseManager:
                 VALUES (?, ?)
             """, ("created_at", datetime.now().isoformat()))
 
-            conn.commit()
+        if not defer_indexes:
+            self.create_indexes()
+
+    def create_indexes(self):
+        """
+        Create the secondary indexes listed in the configuration.
+
+        Data tables are clustered on (keyword_id, month), so none are needed by default.
+        """
+        self._ensure_writable("create indexes")
+        with self.get_connection() as conn:
+            for index_sql in self.config.database_config.get("indexes", []):
+                try:
+                    conn.execute(index_sql)
+                except sqlite3.OperationalError as e:
+                    print(f"Warning: Could not create config index: {e}")
 
     def _get_schema_sql(self) -> List[str]:
         """
@@ -124,56 +892,240 @@ class DatabaseManager:
         Returns:
             List of SQL statements to create tables
         """
-        return [
-            # Data tables for each source
+        statements = [
+            # Keyword dictionary shared by all data tables
             """
-            CREATE TABLE IF NOT EXISTS google_trends (
-                date TEXT NOT NULL,
-                keyword TEXT NOT NULL,
-                value REAL NOT NULL,
-                PRIMARY KEY (date, keyword)
+            CREATE TABLE IF NOT EXISTS keywords (
+                id INTEGER PRIMARY KEY,
+                keyword TEXT NOT NULL UNIQUE
             )
-            """,
             """
-            CREATE TABLE IF NOT EXISTS crossref (
-                date TEXT NOT NULL,
-                keyword TEXT NOT NULL,
-                value REAL NOT NULL,
-                PRIMARY KEY (date, keyword)
-            )
-            """,
-            """
-            CREATE TABLE IF NOT EXISTS google_books (
-                date TEXT NOT NULL,
-                keyword TEXT NOT NULL,
-                value REAL NOT NULL,
-                PRIMARY KEY (date, keyword)
-            )
-            """,
-            """
-            CREATE TABLE IF NOT EXISTS bain_usability (
-                date TEXT NOT NULL,
-                keyword TEXT NOT NULL,
-                value REAL NOT NULL,
-                PRIMARY KEY (date, keyword)
-            )
-            """,
-            """
-            CREATE TABLE IF NOT EXISTS bain_satisfaction (
-                date TEXT NOT NULL,
-                keyword TEXT NOT NULL,
+        ]
+
+        # Data tables for each source, clustered by keyword and month
+        for table_name in SOURCE_TABLES.values():
+            statements.append(f"""
+            CREATE TABLE IF NOT EXISTS {table_name} (
+                keyword_id INTEGER NOT NULL REFERENCES keywords(id),
+                month INTEGER NOT NULL,
                 value REAL NOT NULL,
-                PRIMARY KEY (date, keyword)
-            )
-            """,
-            # Metadata table
-            """
+                PRIMARY KEY (keyword_id, month)
+            ) WITHOUT ROWID
+            """)
+
+        # Per-table, per-keyword statistics maintained on every insert
+        statements.append("""
+            CREATE TABLE IF NOT EXISTS series_stats (
+                table_name TEXT NOT NULL,
+                keyword_id INTEGER NOT NULL REFERENCES keywords(id),
+                row_count INTEGER NOT NULL,
+                first_month INTEGER,
+                last_month INTEGER,
+                min_value REAL,
+                max_value REAL,
+                mean_value REAL,
+                content_hash TEXT,
+                PRIMARY KEY (table_name, keyword_id)
+            ) WITHOUT ROWID
+            """)
+
+        # Precomputed analytics per keyword, source set bitmask and artifact (see analytics.py)
+        statements.append("""
+            CREATE TABLE IF NOT EXISTS analytics (
+                keyword_id INTEGER NOT NULL REFERENCES keywords(id),
+                source_set INTEGER NOT NULL,
+                artifact TEXT NOT NULL,
+                version INTEGER NOT NULL,
+                payload BLOB NOT NULL,
+                PRIMARY KEY (keyword_id, source_set, artifact)
+            ) WITHOUT ROWID
+            """)
+
+        # Metadata table
+        statements.append("""
             CREATE TABLE IF NOT EXISTS metadata (
                 key TEXT PRIMARY KEY,
                 value TEXT
             )
-            """
-        ]
+            """)
+        return statements
+
+    def get_schema_version(self) -> Optional[str]:
+        """
+        Get the schema version recorded in the database.
+
+        Databases built before the version was recorded report "1.0".
+
+        Returns:
+            Schema version string, or None if the database has no schema yet
+        """
+        with self.get_connection() as conn:
+            has_metadata = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type='table' AND name='metadata'"
+            ).fetchone()
+            if not has_metadata:
+                return None
+            row = conn.execute("SELECT value FROM metadata WHERE key = 'schema_version'").fetchone()
+            return row[0] if row else "1.0"
+
+    def needs_migration(self) -> bool:
+        """
+        Check whether the database uses the v1 (text date/keyword) layout.
+
+        Returns:
+            True if the database exists and must be migrated to the current schema
+        """
+        if not self.database_exists():
+            return False
+        version = self.get_schema_version()
+        return version is not None and schema_version_key(version) < schema_version_key(SCHEMA_VERSION)
+
+    def migrate_schema(self, vacuum: bool = True) -> Dict[str, int]:
+        """
+        Migrate an older database in place to the current layout.
+
+        For 1.0 databases, text keywords move to the keywords table, ISO dates become
+        month ordinals, and the v1 tables (with their secondary indexes) are dropped.
+        Missing tables are created and the series statistics are rebuilt.
+
+        Args:
+            vacuum: Reclaim the space freed by the v1 tables afterwards
+
+        Returns:
+            Dictionary mapping table name to the number of migrated rows
+        """
+        self._ensure_writable("migrate the schema")
+        migrated = {}
+
+        with self.get_connection() as conn:
+            existing = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+            legacy_tables = [
+                table for table in SOURCE_TABLES.values()
+                if table in existing and "date" in {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+            ]
+
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                for table in legacy_tables:
+                    conn.execute(f"ALTER TABLE {table} RENAME TO {table}_v1")
+                for statement in self._get_schema_sql():
+                    conn.execute(statement)
+
+                for table in legacy_tables:
+                    conn.execute(f"INSERT OR IGNORE INTO keywords (keyword) SELECT DISTINCT keyword FROM {table}_v1")
+                for table in legacy_tables:
+                    cursor = conn.execute(f"""
+                        INSERT OR REPLACE INTO {table} (keyword_id, month, value)
+                        SELECT k.id,
+                               CAST(substr(t.date, 1, 4) AS INTEGER) * 12 + CAST(substr(t.date, 6, 2) AS INTEGER) - 1,
+                               t.value
+                        FROM {table}_v1 t JOIN keywords k ON k.keyword = t.keyword
+                    """)
+                    migrated[table] = cursor.rowcount
+                    conn.execute(f"DROP TABLE {table}_v1")
+
+                for table in SOURCE_TABLES.values():
+                    self._refresh_series_stats(conn, table)
+
+                conn.execute(
+                    "INSERT OR REPLACE INTO metadata (key, value) VALUES (?, ?)",
+                    ("schema_version", SCHEMA_VERSION)
+                )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+            if vacuum and legacy_tables:
+                conn.execute("VACUUM")
+                conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+        return migrated
+
+    def _get_keyword_ids(self, conn: sqlite3.Connection, keywords) -> Dict[str, int]:
+        """
+        Resolve keywords to their dictionary IDs, adding any that are new.
+
+        Args:
+            conn: Open connection to use
+            keywords: Iterable of keyword strings
+
+        Returns:
+            Dictionary mapping keyword to keyword ID
+        """
+        unique_keywords = list(dict.fromkeys(keywords))
+        conn.executemany(
+            "INSERT OR IGNORE INTO keywords (keyword) VALUES (?)",
+            [(keyword,) for keyword in unique_keywords]
+        )
+        placeholders = ",".join("?" * len(unique_keywords))
+        cursor = conn.execute(f"SELECT keyword, id FROM keywords WHERE keyword IN ({placeholders})", unique_keywords)
+        return dict(cursor.fetchall())
+
+    @staticmethod
+    def _lookup_keyword_id(conn: sqlite3.Connection, keyword: str) -> Optional[int]:
+        """Return the dictionary ID of a keyword, or None if it is unknown."""
+        row = conn.execute("SELECT id FROM keywords WHERE keyword = ?", [keyword]).fetchone()
+        return row[0] if row else None
+
+    @staticmethod
+    def _refresh_series_stats(conn: sqlite3.Connection, table_name: str, keyword_ids=None):
+        """
+        Recompute the series_stats rows of a data table.
+
+        The precomputed analytics of the refreshed keywords are dropped with them.
+
+        Args:
+            conn: Open connection to use
+            table_name: Data table to summarize
+            keyword_ids: Optional keyword IDs to refresh (defaults to every keyword in the table)
+        """
+        has_analytics = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'analytics'").fetchone() is not None
+
+        if keyword_ids is None:
+            conn.execute("DELETE FROM series_stats WHERE table_name = ?", [table_name])
+            if has_analytics:
+                conn.execute("DELETE FROM analytics")
+            rows = conn.execute(f"SELECT keyword_id, month, value FROM {table_name} ORDER BY keyword_id, month").fetchall()
+        else:
+            keyword_ids = list(keyword_ids)
+            placeholders = ",".join("?" * len(keyword_ids))
+            conn.execute(f"DELETE FROM series_stats WHERE table_name = ? AND keyword_id IN ({placeholders})",
+                         [table_name] + keyword_ids)
+            if has_analytics:
+                conn.execute(f"DELETE FROM analytics WHERE keyword_id IN ({placeholders})", keyword_ids)
+            rows = conn.execute(
+                f"SELECT keyword_id, month, value FROM {table_name} "
+                f"WHERE keyword_id IN ({placeholders}) ORDER BY keyword_id, month",
+                keyword_ids
+            ).fetchall()
+
+        if not rows:
+            return
+
+        ids, months, values = (np.asarray(col) for col in zip(*rows))
+        months = months.astype(np.int64)
+        values = values.astype(np.float64)
+        starts = np.flatnonzero(np.r_[True, ids[1:] != ids[:-1]])
+        ends = np.r_[starts[1:], len(ids)]
+
+        stats_rows = []
+        for start, end in zip(starts, ends):
+            series_months, series_values = months[start:end], values[start:end]
+            content_hash = hashlib.blake2b(series_months.tobytes() + series_values.tobytes(), digest_size=16).hexdigest()
+            stats_rows.append((
+                table_name, int(ids[start]), int(end - start),
+                int(series_months[0]), int(series_months[-1]),
+                float(series_values.min()), float(series_values.max()), float(series_values.mean()),
+                content_hash
+            ))
+
+        conn.executemany("""
+            INSERT INTO series_stats (table_name, keyword_id, row_count, first_month, last_month,
+                                      min_value, max_value, mean_value, content_hash)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, stats_rows)
 
     def insert_data_batch(self, table_name: str, data: List[Tuple[str, str, float]]):
         """
@@ -183,15 +1135,53 @@ class DatabaseManager:
             table_name: Name of the table to insert into
             data: List of tuples (date, keyword, value)
         """
+        self._ensure_writable("insert data")
         if not data:
             return
 
-        with self.get_connection() as conn:
+        with self.get_connection() as conn, self._transaction(conn):
+            keyword_ids = self._get_keyword_ids(conn, (row[1] for row in data))
             conn.executemany(
-                f"INSERT OR REPLACE INTO {table_name} (date, keyword, value) VALUES (?, ?, ?)",
-                data
+                f"INSERT OR REPLACE INTO {table_name} (keyword_id, month, value) VALUES (?, ?, ?)",
+                [(keyword_ids[keyword], date_to_month(date), value) for date, keyword, value in data]
             )
-            conn.commit()
+            if self._bulk_conn is None:
+                self._refresh_series_stats(conn, table_name, keyword_ids.values())
+
+    def replace_series(self, table_name: str, keyword: str, data: List[Tuple[str, str, float]]) -> int:
+        """
+        Replace all rows of one keyword in a table.
+
+        Dates present in the database but missing from the new data are deleted,
+        so the slice ends up exactly equal to the new batch.
+
+        Args:
+            table_name: Name of the table to update
+            keyword: Keyword whose rows are replaced
+            data: List of tuples (date, keyword, value); may be empty to remove the slice
+
+        Returns:
+            Number of rows deleted that are not part of the new data
+        """
+        self._ensure_writable("replace data")
+        new_rows = {date_to_month(date): value for date, _, value in data}
+
+        with self.get_connection() as conn, self._transaction(conn):
+            keyword_id = self._get_keyword_ids(conn, [keyword])[keyword]
+            existing = {row[0] for row in conn.execute(
+                f"SELECT month FROM {table_name} WHERE keyword_id = ?", [keyword_id])}
+            removed = sorted(existing - new_rows.keys())
+
+            conn.executemany(f"DELETE FROM {table_name} WHERE keyword_id = ? AND month = ?",
+                             [(keyword_id, month) for month in removed])
+            conn.executemany(
+                f"INSERT OR REPLACE INTO {table_name} (keyword_id, month, value) VALUES (?, ?, ?)",
+                [(keyword_id, month, value) for month, value in new_rows.items()]
+            )
+            if self._bulk_conn is None:
+                self._refresh_series_stats(conn, table_name, [keyword_id])
+
+        return len(removed)
 
     def get_data_for_keyword(self, keyword: str, sources: List[int]) -> Tuple[Dict[int, pd.DataFrame], List[int]]:
         """
@@ -205,13 +1195,7 @@ class DatabaseManager:
             Tuple of (datasets_norm, selected_sources) matching the original get_file_data2 format
         """
         # Map source IDs to table names
-        source_to_table = {
-            1: "google_trends",
-            2: "google_books",
-            3: "bain_usability",
-            4: "crossref",
-            5: "bain_satisfaction"
-        }
+        source_to_table = SOURCE_TABLES
 
         datasets_norm = {}
         valid_sources = []
@@ -219,6 +1203,11 @@ class DatabaseManager:
         logging.info(f"Getting data for keyword='{keyword}', sources={sources}")
         
         with self.get_connection() as conn:
+            keyword_id = self._lookup_keyword_id(conn, keyword)
+            if keyword_id is None:
+                logging.info(f"Keyword '{keyword}' not found in database")
+                return datasets_norm, valid_sources
+
             for source_id in sources:
                 table_name = source_to_table.get(source_id)
                 if not table_name:
@@ -227,24 +1216,33 @@ class DatabaseManager:
 
                 logging.info(f"Querying table '{table_name}' for keyword='{keyword}'")
                 try:
-                    # Query data for this source and keyword
-                    query = f"SELECT date, value FROM {table_name} WHERE keyword = ? ORDER BY date"
-                    df = pd.read_sql_query(
-                        query,
-                        conn,
-                        params=[keyword],
-                        index_col="date",
-                        parse_dates=["date"]
-                    )
-
-                    if not df.empty:
-                        # Normalize to 0-100 scale (assuming data is already normalized during insertion)
-                        df_norm = df.copy()
+                    metrics = self.metrics
+                    if metrics is not None:
+                        start = time.perf_counter()
+
+                    # Query data for this source and keyword (one range scan of the clustered key)
+                    query = f"SELECT month, value FROM {table_name} WHERE keyword_id = ? ORDER BY month"
+                    rows = conn.execute(query, [keyword_id]).fetchall()
+
+                    if metrics is not None:
+                        fetched = time.perf_counter()
+
+                    df_norm = None
+                    if rows:
+                        months, values = zip(*rows)
+                        index = months_to_index(months)
+                        index.name = "date"
+                        df_norm = pd.DataFrame({"value": np.asarray(values, dtype=np.float64)}, index=index)
                         datasets_norm[source_id] = df_norm
                         valid_sources.append(source_id)
                     else:
                         logging.info(f"No data found in {table_name} for keyword='{keyword}'")
 
+                    if metrics is not None:
+                        metrics.observe_query(
+                            "get_data_for_keyword", table_name, fetched - start, time.perf_counter() - fetched,
+                            rows=len(rows), nbytes=_frame_nbytes(df_norm))
+
                 except Exception as e:
                     logging.error(f"Could not retrieve data for source {source_id} ({table_name}): {e}")
                     import traceback
@@ -253,6 +1251,150 @@ class DatabaseManager:
 
         return datasets_norm, valid_sources
 
+    def get_combined_data_for_keyword(self, keyword: str, sources: List[int],
+                                      column_names: Optional[Dict[int, str]] = None) -> Tuple[pd.DataFrame, List[int]]:
+        """
+        Retrieve all requested sources for a keyword in a single query as one wide frame.
+
+        The sources are read from the columnar snapshot if present, otherwise fetched with
+        one UNION ALL round trip and pivoted in NumPy. Either way the result is an
+        outer join of the get_data_for_keyword frames: a date index covering every
+        date of every source, one column per source.
+
+        Args:
+            keyword: The keyword to retrieve data for
+            sources: List of source IDs (1=Google Trends, 2=Google Books, 3=Bain Usability, 4=Crossref, 5=Bain Satisfaction)
+            column_names: Optional mapping from source ID to column name (defaults to the source ID)
+
+        Returns:
+            Tuple of (wide DataFrame indexed by date, list of source IDs that returned data)
+        """
+        requested = []
+        for source_id in sources:
+            if source_id in SOURCE_TABLES and source_id not in requested:
+                requested.append(source_id)
+            elif source_id not in SOURCE_TABLES:
+                logging.warning(f"No table name for source_id={source_id}")
+
+        if not requested:
+            return pd.DataFrame(), []
+
+        metrics = self.metrics
+        if metrics is not None:
+            start = time.perf_counter()
+
+        # Served from the memory-mapped snapshot when one is available
+        snapshot = self.get_snapshot()
+        if snapshot is not None:
+            wide, valid_sources = snapshot.get_combined(keyword, requested, column_names)
+            if metrics is not None:
+                metrics.observe_query("get_combined_data_for_keyword", "snapshot", 0.0, time.perf_counter() - start,
+                                      rows=int(wide.count().sum()), nbytes=_frame_nbytes(wide))
+            return wide, valid_sources
+
+        query = " UNION ALL ".join(
+            f"SELECT {source_id} AS source_id, month, value FROM {SOURCE_TABLES[source_id]} WHERE keyword_id = ?"
+            for source_id in requested
+        )
+
+        with self.get_connection() as conn:
+            keyword_id = self._lookup_keyword_id(conn, keyword)
+            rows = conn.execute(query, [keyword_id] * len(requested)).fetchall() if keyword_id is not None else []
+
+        if metrics is not None:
+            fetched = time.perf_counter()
+
+        if not rows:
+            logging.info(f"No data found for keyword='{keyword}', sources={requested}")
+            if metrics is not None:
+                metrics.observe_query("get_combined_data_for_keyword", "union", fetched - start)
+            return pd.DataFrame(), []
+
+        source_col, month_col, value_col = zip(*rows)
+        source_ids = np.asarray(source_col, dtype=np.int64)
+        values = np.asarray(value_col, dtype=np.float64)
+
+        # unique() yields the sorted union of months across all sources
+        unique_months, row_positions = np.unique(np.asarray(month_col, dtype=np.int64), return_inverse=True)
+
+        present = set(source_ids.tolist())
+        valid_sources = [source_id for source_id in requested if source_id in present]
+        column_lookup = np.zeros(max(valid_sources) + 1, dtype=np.int64)
+        column_lookup[valid_sources] = np.arange(len(valid_sources))
+
+        matrix = np.full((len(unique_months), len(valid_sources)), np.nan)
+        matrix[row_positions, column_lookup[source_ids]] = values
+
+        names = column_names or {}
+        wide = pd.DataFrame(
+            matrix,
+            index=months_to_index(unique_months),
+            columns=[names.get(source_id, source_id) for source_id in valid_sources]
+        )
+
+        if metrics is not None:
+            metrics.observe_query("get_combined_data_for_keyword", "union", fetched - start,
+                                  time.perf_counter() - fetched, rows=len(rows), nbytes=_frame_nbytes(wide))
+        return wide, valid_sources
+
+    def get_snapshot(self):
+        """
+        Get the memory-mapped columnar snapshot of this database.
+
+        The snapshot is loaded once per manager and ignored if it was built from
+        different database contents. Runs the hot-swap check when it is due, so
+        workers serving only snapshot reads still pick up a newly published file.
+
+        Returns:
+            DataSnapshot instance, or None if no current snapshot exists
+        """
+        if self.reload_check_interval > 0 and time.monotonic() >= self._next_reload_check:
+            self.check_for_new_version()
+        if not self._snapshot_loaded:
+            from data_snapshot import load_snapshot, snapshot_identity
+
+            snapshot = load_snapshot(self.snapshot_path)
+            if snapshot is not None and not snapshot.matches(snapshot_identity(self)):
+                logging.warning(f"Ignoring stale data snapshot at {self.snapshot_path}")
+                snapshot = None
+            self._snapshot = snapshot
+            self._snapshot_loaded = True
+        return self._snapshot
+
+    def write_snapshot(self, directory: Optional[Path] = None) -> Dict[str, Any]:
+        """
+        Write the columnar snapshot of all data tables next to the database file.
+
+        Args:
+            directory: Snapshot directory (defaults to this database's snapshot path)
+
+        Returns:
+            Dictionary with the cube shape and size in bytes
+        """
+        from data_snapshot import write_snapshot
+
+        result = write_snapshot(self, Path(directory) if directory else self.snapshot_path)
+        self._snapshot = None
+        self._snapshot_loaded = False
+        return result
+
+    def get_snapshot_views(self, keyword: str, sources: List[int]) -> Optional[Dict[int, Tuple[np.ndarray, np.ndarray]]]:
+        """
+        Get zero-copy views of a keyword's series from the columnar snapshot.
+
+        Args:
+            keyword: The keyword to read
+            sources: List of source IDs
+
+        Returns:
+            Dictionary mapping source ID to (values, mask) arrays over the snapshot month
+            axis, or None if no current snapshot exists
+        """
+        snapshot = self.get_snapshot()
+        if snapshot is None:
+            return None
+        return snapshot.get_views(keyword, sources)
+
     def get_metadata(self, key: Optional[str] = None) -> Dict[str, str]:
         """
         Retrieve metadata from the database.
@@ -279,17 +1421,232 @@ class DatabaseManager:
             key: Metadata key
             value: Metadata value
         """
+        self._ensure_writable("update metadata")
         with self.get_connection() as conn:
             conn.execute(
                 "INSERT OR REPLACE INTO metadata (key, value) VALUES (?, ?)",
                 [key, value]
             )
-            conn.commit()
+
+    def update_metadata_values(self, values: Dict[str, str]):
+        """
+        Update or insert several metadata entries in one transaction.
+
+        Args:
+            values: Dictionary of metadata key-value pairs
+        """
+        self._ensure_writable("update metadata")
+        if not values:
+            return
+
+        with self.get_connection() as conn, self._transaction(conn):
+            conn.executemany(
+                "INSERT OR REPLACE INTO metadata (key, value) VALUES (?, ?)",
+                list(values.items())
+            )
 
     def get_table_stats(self) -> Dict[str, Dict[str, Any]]:
         """
         Get statistics for all data tables.
 
+        Read from the series_stats table maintained on insert, so the data tables
+        are not scanned.
+
+        Returns:
+            Dictionary with table statistics
+        """
+        if not self._has_table("series_stats"):
+            return self._scan_table_stats()
+
+        with self.get_connection() as conn:
+            cursor = conn.execute("""
+                SELECT table_name, SUM(row_count), COUNT(*), MIN(first_month), MAX(last_month)
+                FROM series_stats GROUP BY table_name
+            """)
+            aggregates = {row[0]: row[1:] for row in cursor.fetchall()}
+
+        stats = {}
+        for table in ["google_trends", "crossref", "google_books", "bain_usability", "bain_satisfaction"]:
+            row_count, keyword_count, min_month, max_month = aggregates.get(table, (0, 0, None, None))
+            stats[table] = {
+                "row_count": row_count,
+                "keyword_count": keyword_count,
+                "min_date": month_to_date_string(min_month),
+                "max_date": month_to_date_string(max_month)
+            }
+        return stats
+
+    def get_series_stats(self, keyword: str, sources: Optional[List[int]] = None) -> Dict[int, Dict[str, Any]]:
+        """
+        Get the maintained statistics of a keyword's series.
+
+        Args:
+            keyword: The keyword to look up
+            sources: Optional list of source IDs (defaults to all sources)
+
+        Returns:
+            Dictionary mapping source ID to row count, first/last date, min, max,
+            mean and content hash; sources without data are omitted
+        """
+        table_to_source = {table: source_id for source_id, table in SOURCE_TABLES.items()}
+        wanted = set(sources) if sources is not None else set(SOURCE_TABLES)
+
+        metrics = self.metrics
+        if metrics is not None:
+            start = time.perf_counter()
+
+        with self.get_connection() as conn:
+            cursor = conn.execute("""
+                SELECT s.table_name, s.row_count, s.first_month, s.last_month,
+                       s.min_value, s.max_value, s.mean_value, s.content_hash
+                FROM series_stats s JOIN keywords k ON k.id = s.keyword_id
+                WHERE k.keyword = ?
+            """, [keyword])
+            rows = cursor.fetchall()
+
+        if metrics is not None:
+            metrics.observe_query("get_series_stats", "series_stats", time.perf_counter() - start, rows=len(rows))
+
+        result = {}
+        for table, row_count, first_month, last_month, min_value, max_value, mean_value, content_hash in rows:
+            source_id = table_to_source.get(table)
+            if source_id not in wanted:
+                continue
+            result[source_id] = {
+                "row_count": row_count,
+                "first_date": month_to_date_string(first_month),
+                "last_date": month_to_date_string(last_month),
+                "min": min_value,
+                "max": max_value,
+                "mean": mean_value,
+                "content_hash": content_hash
+            }
+        return dict(sorted(result.items()))
+
+    def get_date_bounds(self, keyword: str, sources: List[int]) -> Dict[int, Tuple[pd.Timestamp, pd.Timestamp, int]]:
+        """
+        Get the date range of a keyword's series without reading any data rows.
+
+        Args:
+            keyword: The keyword to look up
+            sources: List of source IDs
+
+        Returns:
+            Dictionary mapping source ID to (first date, last date, number of points),
+            in the order of the requested sources; sources without data are omitted
+        """
+        tables = {SOURCE_TABLES[source_id]: source_id for source_id in sources if source_id in SOURCE_TABLES}
+        if not tables:
+            return {}
+
+        metrics = self.metrics
+        if metrics is not None:
+            start = time.perf_counter()
+
+        placeholders = ", ".join("?" for _ in tables)
+        with self.get_connection() as conn:
+            cursor = conn.execute(f"""
+                SELECT s.table_name, s.first_month, s.last_month, s.row_count
+                FROM series_stats s JOIN keywords k ON k.id = s.keyword_id
+                WHERE k.keyword = ? AND s.table_name IN ({placeholders}) AND s.row_count > 0
+            """, [keyword, *tables])
+            rows = {tables[table]: (first_month, last_month, row_count)
+                    for table, first_month, last_month, row_count in cursor.fetchall()}
+
+        if metrics is not None:
+            metrics.observe_query("get_date_bounds", "series_stats", time.perf_counter() - start, rows=len(rows))
+
+        bounds = {}
+        for source_id in tables.values():
+            if source_id in rows:
+                first_month, last_month, row_count = rows[source_id]
+                first_date, last_date = months_to_index([first_month, last_month])
+                bounds[source_id] = (first_date, last_date, row_count)
+        return bounds
+
+    def get_analytics(self, keyword: str, sources: List[int], artifact: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a precomputed analytics artifact.
+
+        Args:
+            keyword: The keyword to look up
+            sources: Source IDs of the selection, in any order
+            artifact: Artifact name (see analytics.ARTIFACTS)
+
+        Returns:
+            Artifact payload, or None if it was not precomputed for this
+            ANALYTICS_VERSION (or the database has no analytics table)
+        """
+        metrics = self.metrics
+        if metrics is not None:
+            start = time.perf_counter()
+
+        try:
+            with self.get_connection() as conn:
+                row = conn.execute("""
+                    SELECT a.payload FROM analytics a JOIN keywords k ON k.id = a.keyword_id
+                    WHERE k.keyword = ? AND a.source_set = ? AND a.artifact = ? AND a.version = ?
+                """, [keyword, source_set_mask(sources), artifact, ANALYTICS_VERSION]).fetchone()
+        except sqlite3.OperationalError as e:
+            logging.info(f"Precomputed analytics unavailable: {e}")
+            return None
+
+        if metrics is not None:
+            fetched = time.perf_counter()
+        payload = deserialize_payload(row[0]) if row is not None else None
+        if metrics is not None:
+            metrics.observe_query("get_analytics", "analytics", fetched - start, time.perf_counter() - fetched,
+                                  rows=int(row is not None), nbytes=len(row[0]) if row is not None else 0)
+        return payload
+
+    def get_analytics_keywords(self) -> set:
+        """
+        Get the keywords whose stored analytics are all from the current ANALYTICS_VERSION.
+
+        Returns:
+            Set of keywords (empty if the database has no analytics table)
+        """
+        try:
+            with self.get_connection() as conn:
+                rows = conn.execute("""
+                    SELECT k.keyword FROM analytics a JOIN keywords k ON k.id = a.keyword_id
+                    GROUP BY a.keyword_id HAVING MIN(a.version) = ? AND MAX(a.version) = ?
+                """, [ANALYTICS_VERSION, ANALYTICS_VERSION]).fetchall()
+        except sqlite3.OperationalError:
+            return set()
+        return {row[0] for row in rows}
+
+    def store_analytics(self, keyword: str, artifacts: List[Tuple[int, str, Dict[str, Any]]]):
+        """
+        Replace the precomputed analytics of a keyword.
+
+        Args:
+            keyword: Keyword the artifacts belong to
+            artifacts: (source set mask, artifact, payload) tuples, as returned by
+                analytics.compute_keyword_analytics
+        """
+        self._ensure_writable("store analytics")
+        with self.get_connection() as conn, self._transaction(conn):
+            keyword_id = self._get_keyword_ids(conn, [keyword])[keyword]
+            conn.execute("DELETE FROM analytics WHERE keyword_id = ?", [keyword_id])
+            conn.executemany(
+                "INSERT INTO analytics (keyword_id, source_set, artifact, version, payload) VALUES (?, ?, ?, ?, ?)",
+                [(keyword_id, mask, artifact, ANALYTICS_VERSION, serialize_payload(payload))
+                 for mask, artifact, payload in artifacts]
+            )
+
+    def _has_table(self, table_name: str) -> bool:
+        """Check whether a table exists in the database."""
+        with self.get_connection() as conn:
+            cursor = conn.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name = ?", [table_name])
+            return cursor.fetchone() is not None
+
+    def _scan_table_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Compute table statistics by scanning the data tables.
+
+        Used for databases created before the series_stats table existed.
+
         Returns:
             Dictionary with table statistics
         """
@@ -304,18 +1661,18 @@ class DatabaseManager:
                     row_count = cursor.fetchone()[0]
 
                     # Get keyword count
-                    cursor = conn.execute(f"SELECT COUNT(DISTINCT keyword) FROM {table}")
+                    cursor = conn.execute(f"SELECT COUNT(DISTINCT keyword_id) FROM {table}")
                     keyword_count = cursor.fetchone()[0]
 
                     # Get date range
-                    cursor = conn.execute(f"SELECT MIN(date), MAX(date) FROM {table}")
-                    min_date, max_date = cursor.fetchone()
+                    cursor = conn.execute(f"SELECT MIN(month), MAX(month) FROM {table}")
+                    min_month, max_month = cursor.fetchone()
 
                     stats[table] = {
                         "row_count": row_count,
                         "keyword_count": keyword_count,
-                        "min_date": min_date,
-                        "max_date": max_date
+                        "min_date": month_to_date_string(min_month),
+                        "max_date": month_to_date_string(max_month)
                     }
                 except Exception as e:
                     print(f"Warning: Could not get stats for table {table}: {e}")
@@ -330,9 +1687,15 @@ class DatabaseManager:
         Args:
             table_name: Name of the table to clear
         """
-        with self.get_connection() as conn:
+        self._ensure_writable("clear a table")
+        has_stats = table_name in SOURCE_TABLES.values() and self._has_table("series_stats")
+        has_analytics = table_name in SOURCE_TABLES.values() and self._has_table("analytics")
+        with self.get_connection() as conn, self._transaction(conn):
             conn.execute(f"DELETE FROM {table_name}")
-            conn.commit()
+            if has_stats:
+                conn.execute("DELETE FROM series_stats WHERE table_name = ?", [table_name])
+            if has_analytics:
+                conn.execute("DELETE FROM analytics")
 
     def drop_table(self, table_name: str):
         """
@@ -341,30 +1704,83 @@ class DatabaseManager:
         Args:
             table_name: Name of the table to drop
         """
-        with self.get_connection() as conn:
+        self._ensure_writable("drop a table")
+        has_stats = table_name in SOURCE_TABLES.values() and self._has_table("series_stats")
+        has_analytics = table_name in SOURCE_TABLES.values() and self._has_table("analytics")
+        with self.get_connection() as conn, self._transaction(conn):
             conn.execute(f"DROP TABLE IF EXISTS {table_name}")
-            conn.commit()
+            if has_stats:
+                conn.execute("DELETE FROM series_stats WHERE table_name = ?", [table_name])
+            if has_analytics:
+                conn.execute("DELETE FROM analytics")
 
-    def vacuum_database(self):
+    def vacuum_database(self, online: bool = False):
         """
         Optimize database by reclaiming unused space.
+
+        Args:
+            online: Write the compacted copy with VACUUM INTO and swap it into place, so
+                readers are never blocked. Other writers wait for the write lock until
+                the copy has been swapped in.
         """
+        self._ensure_writable("vacuum the database")
+        if online:
+            new_path = self.db_path.with_name(self.db_path.name + ".new")
+            if new_path.exists():
+                new_path.unlink()
+            with self.write_lock():
+                with self.get_connection() as conn:
+                    conn.execute("VACUUM INTO ?", [str(new_path)])
+                self.replace_database_file(new_path)
+            return
+
         with self.get_connection() as conn:
             conn.execute("VACUUM")
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
             conn.commit()
 
-    def backup_database(self, backup_path: Path):
+    def backup_database(self, backup_path: Path, pages: int = 256, pause: float = 0.001):
         """
-        Create a backup of the database.
+        Create a backup of the database with SQLite's online backup API.
+
+        The copy is made a few pages per step and the thread sleeps between steps, so
+        other connections keep reading (and writing) while it runs. The backup is
+        written to a temporary file and renamed into place when complete.
 
         Args:
             backup_path: Path where to save the backup
+            pages: Pages copied per step (0 or less copies everything in one step)
+            pause: Seconds to sleep between steps
         """
+        backup_path = Path(backup_path)
         backup_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = backup_path.with_name(backup_path.name + ".tmp")
+        if temp_path.exists():
+            temp_path.unlink()
+
+        def yield_between_steps(status, remaining, total):
+            if remaining and pause > 0:
+                time.sleep(pause)
 
         with self.get_connection() as source_conn:
-            with sqlite3.connect(str(backup_path)) as backup_conn:
-                source_conn.backup(backup_conn)
+            backup_conn = sqlite3.connect(str(temp_path))
+            try:
+                source_conn.backup(backup_conn, pages=pages if pages > 0 else -1,
+                                   progress=yield_between_steps)
+            finally:
+                backup_conn.close()
+        os.replace(temp_path, backup_path)
+
+    def bump_data_version(self) -> str:
+        """
+        Record a new data_version so serving workers pick up changed data.
+
+        Returns:
+            The new data_version
+        """
+        version = new_data_version()
+        self.update_metadata("data_version", version)
+        return version
 
     def get_keywords_list(self, source_id: Optional[int] = None) -> List[str]:
         """
@@ -379,26 +1795,27 @@ class DatabaseManager:
         tables = []
         if source_id:
             # Map source ID to table name
-            source_to_table = {
-                1: "google_trends",
-                2: "google_books",
-                3: "bain_usability",
-                4: "crossref",
-                5: "bain_satisfaction"
-            }
-            table_name = source_to_table.get(source_id)
+            table_name = SOURCE_TABLES.get(source_id)
             if table_name:
                 tables = [table_name]
         else:
             tables = ["google_trends", "crossref", "google_books", "bain_usability", "bain_satisfaction"]
 
         keywords = set()
+        metrics = self.metrics
 
         with self.get_connection() as conn:
             for table in tables:
                 try:
-                    cursor = conn.execute(f"SELECT DISTINCT keyword FROM {table}")
-                    keywords.update(row[0] for row in cursor.fetchall())
+                    if metrics is not None:
+                        start = time.perf_counter()
+                    cursor = conn.execute(
+                        f"SELECT keyword FROM keywords WHERE id IN (SELECT DISTINCT keyword_id FROM {table})"
+                    )
+                    rows = cursor.fetchall()
+                    if metrics is not None:
+                        metrics.observe_query("get_keywords_list", table, time.perf_counter() - start, rows=len(rows))
+                    keywords.update(row[0] for row in rows)
                 except Exception as e:
                     print(f"Warning: Could not get keywords from {table}: {e}")
 
@@ -433,50 +1850,48 @@ class DatabaseManager:
             return self.db_path.stat().st_size
         return 0
 
-    def get_tool_notes_and_doi(self, tool_name: str, source_name: Optional[str] = None) -> List[Dict[str, Any]]:
+    def get_notes_index(self):
+        """
+        Get the in-memory notes and DOI index, loading notes_and_doi.db on first use.
+
+        Returns:
+            NotesIndex instance (empty if the notes database is missing)
+        """
+        if self._notes_index is None:
+            from notes_index import NotesIndex
+            self._notes_index = NotesIndex.load(self.notes_db_path)
+        return self._notes_index
+
+    def get_tool_notes_and_doi(self, tool_name: str, source_name: Optional[str] = None,
+                               language: str = 'es') -> List[Dict[str, Any]]:
         """
         Get DOI links and notes for a specific tool and optionally filtered by source.
 
         Args:
             tool_name: Spanish name of the management tool
             source_name: Optional source name to filter (Google_Trends, Google_Books, IC, BAIN_Ind_Usabilidad, BAIN_Ind_Satisfacción, Crossref)
+            language: Language of the notes, if a translation was added to the notes index
 
         Returns:
             List of dictionaries containing DOI, notes, links, and keywords for each matching record
         """
-        notes_db_path = self.config.database_path.parent / "notes_and_doi.db"
-
-        if not notes_db_path.exists():
-            print(f"Warning: Notes database not found at {notes_db_path}")
-            return []
-
-        try:
-            with sqlite3.connect(str(notes_db_path)) as conn:
-                query = "SELECT DOI, Source, Notes, Links, Keywords FROM tool_notes WHERE Herramienta = ?"
-                params = [tool_name]
-
-                if source_name:
-                    query += " AND Source = ?"
-                    params.append(source_name)
+        return self.get_notes_index().get(tool_name, source_name, language)
 
-                cursor = conn.execute(query, params)
-                results = []
-
-                for row in cursor.fetchall():
-                    doi, source, notes, links, keywords = row
-                    results.append({
-                        'doi': doi,
-                        'source': source,
-                        'notes': notes,
-                        'links': links,
-                        'keywords': keywords
-                    })
+    def search_tool_notes(self, query: str, language: str = 'es', source_name: Optional[str] = None,
+                          limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        Full-text search over the notes and keywords of all tools.
 
-                return results
+        Args:
+            query: Plain search text
+            language: Language of the notes to search and return
+            source_name: Optional source name to filter
+            limit: Maximum number of results
 
-        except Exception as e:
-            print(f"Error retrieving tool notes: {e}")
-            return []
+        Returns:
+            List of dictionaries with tool, DOI, source, notes, links and keywords, best match first
+        """
+        return self.get_notes_index().search(query, language, source_name, limit)
 
     def __str__(self) -> str:
         """String representation of the database manager."""
@@ -512,4 +1927,6 @@ def reset_database_manager():
     Useful for testing or configuration changes.
     """
     global _db_manager_instance
+    if _db_manager_instance is not None:
+        _db_manager_instance.close()
     _db_manager_instance = None
\ No newline at end of file
@@ -31,6 +31,8 @@ workers = int(os.getenv('MAX_WORKERS', default_workers))
 # For CPU-intensive Dash apps, sync workers are more reliable
 # Explicitly set to 'sync' as Dash works best with sync workers
 worker_class = 'sync'  # os.getenv('WORKER_CLASS', 'sync')
+# Slow analyses can run outside the workers as Dash background callbacks:
+# set DASHBOARD_BACKGROUND_CALLBACKS=true (requires dash[diskcache])
 
 # Maximum number of simultaneous clients (for gevent/eventlet workers)
 worker_connections = 1000
@@ -0,0 +1,395 @@
+"""
+Batched interpolation kernels for the Management Tools Analysis Dashboard.
+
+Bain usability and satisfaction series are annual survey points that are
+interpolated to monthly values with a natural cubic spline. Series measured on
+the same survey dates share an x-grid, so they are stacked into one 2D array and
+fitted with a single CubicSpline call instead of one spline per column.
+
+The results are identical to fitting each column on its own: the spline values
+are clipped to each series' own min/max and the original survey points are
+written back into the monthly result. The daily method of the analysis scripts
+also keeps survey points that are not on the first of a month, as extra rows;
+the month-start method used for the database drops them, since every stored
+row is a month.
+
+Google Books series are annual totals spread over the months with a per-keyword
+profile; expand_annual_to_monthly does this for all keywords as one array product.
+
+Interpolated series are kept in an InterpolationCache: a bounded LRU keyed by a
+digest of the input points and the method, with an optional directory of pickled
+results shared by create_database.py runs and the CLI tools.
+"""
+
+import hashlib
+import os
+import threading
+import numpy as np
+import pandas as pd
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from scipy.interpolate import CubicSpline
+
+from config import get_config
+
+# A natural cubic spline needs at least this many points, shorter series use linear interpolation
+MIN_SPLINE_POINTS = 4
+
+EPOCH = pd.Timestamp('1970-01-01')
+
+
+def _days_since_epoch(index: pd.DatetimeIndex) -> np.ndarray:
+    """Convert dates to float days since 1970-01-01 (the spline x values)."""
+    return (index - EPOCH).days.values.astype(float)
+
+
+def group_columns_by_grid(df: pd.DataFrame, columns: Optional[List[str]] = None) -> List[List[str]]:
+    """
+    Group the columns that have data on exactly the same dates.
+
+    Args:
+        df: DataFrame with a date index and one series per column
+        columns: Columns to consider (defaults to all columns)
+
+    Returns:
+        List of column groups, in column order; columns with fewer than
+        MIN_SPLINE_POINTS data points are left out
+    """
+    groups = {}
+    for column in (columns if columns is not None else df.columns):
+        present = df[column].notna().to_numpy()
+        if present.sum() < MIN_SPLINE_POINTS:
+            continue
+        grid = pd.to_datetime(df.index[present]).sort_values()
+        groups.setdefault(grid.asi8.tobytes(), []).append(column)
+    return list(groups.values())
+
+
+def _fit_group(df: pd.DataFrame, columns: List[str], daily: bool) -> Dict[str, pd.Series]:
+    """
+    Fit one spline for a group of columns sharing an x-grid.
+
+    Args:
+        df: Input DataFrame
+        columns: Columns with identical non-NaN dates
+        daily: Evaluate daily and average per month instead of evaluating at month starts
+
+    Returns:
+        Dictionary mapping column name to its monthly Series (with daily=True, plus
+        the original points that are not on a month start)
+    """
+    actual_data = df.loc[df[columns[0]].notna(), columns].sort_index()
+    actual_data.index = pd.to_datetime(actual_data.index)
+    originals = actual_data.to_numpy(dtype=float)
+
+    # One spline over all columns: y has shape (points, columns)
+    cs = CubicSpline(_days_since_epoch(actual_data.index), originals, bc_type='natural')
+
+    # Each column is clipped to its own original range
+    clip_min = originals.min(axis=0)
+    clip_max = originals.max(axis=0)
+
+    freq = 'D' if daily else 'MS'
+    date_range = pd.date_range(start=actual_data.index.min(), end=actual_data.index.max(), freq=freq)
+    if date_range.empty:
+        date_range = pd.date_range(start=actual_data.index.min(), periods=1, freq=freq)
+
+    values = np.clip(cs(_days_since_epoch(date_range)), clip_min, clip_max)
+
+    if daily:
+        # Force original points into the daily values (adding those off the daily grid), then average per month
+        positions = date_range.get_indexer(actual_data.index)
+        found = positions >= 0
+        values[positions[found]] = originals[found]
+        daily_values = pd.DataFrame(values, index=date_range, columns=columns)
+        if not found.all():
+            off_grid = pd.DataFrame(originals[~found], index=actual_data.index[~found], columns=columns)
+            daily_values = pd.concat([daily_values, off_grid]).sort_index()
+        monthly = daily_values.resample('MS').mean()
+        date_range, values = monthly.index, monthly.to_numpy(copy=True)
+
+    # Force original points into the monthly values
+    original_dates = actual_data.index.normalize()
+    positions = date_range.get_indexer(original_dates)
+    found = positions >= 0
+    values[positions[found]] = originals[found]
+
+    if daily and not found.all():
+        # As in the analysis scripts, originals that are not on a month start are kept as extra rows
+        off_grid = pd.DataFrame(originals[~found], index=original_dates[~found], columns=columns)
+        off_grid = off_grid[~off_grid.index.duplicated(keep='last')]
+        merged = pd.concat([pd.DataFrame(values, index=date_range, columns=columns), off_grid]).sort_index()
+        date_range, values = merged.index, merged.to_numpy(copy=True)
+
+    return {
+        column: pd.Series(values[:, i].copy(), index=date_range, name=column)
+        for i, column in enumerate(columns)
+    }
+
+
+def batched_cubic_interpolation(df: pd.DataFrame, columns: Optional[List[str]] = None,
+                                daily: bool = False) -> Dict[str, pd.Series]:
+    """
+    Interpolate annual series to monthly values with one spline fit per shared x-grid.
+
+    Args:
+        df: DataFrame with a date index and one series per column
+        columns: Columns to interpolate (defaults to all columns)
+        daily: If True, evaluate the spline daily and take the monthly mean, as the
+            analysis scripts do; otherwise evaluate it at the first of each month
+
+    Returns:
+        Dictionary mapping column name to a monthly Series spanning its first to last
+        data point; columns with fewer than MIN_SPLINE_POINTS points are omitted
+    """
+    results = {}
+    for group in group_columns_by_grid(df, columns):
+        results.update(_fit_group(df, group, daily))
+    return results
+
+
+def expand_annual_to_monthly(annual: np.ndarray, profiles: np.ndarray) -> np.ndarray:
+    """
+    Distribute annual totals over the months of each year with a monthly profile.
+
+    Args:
+        annual: Array of shape (series, years) with annual values
+        profiles: Array of shape (series, 12) with monthly percentages (summing to 100)
+
+    Returns:
+        Array of shape (series, years, 12) with the monthly values
+    """
+    return (profiles / 100)[:, None, :] * annual[:, :, None]
+
+
+# Bump when an interpolation method changes its output, so stale disk entries are ignored
+CACHE_FORMAT_VERSION = 2
+
+
+def interpolation_cache_key(method: str, series: pd.Series, extra: bytes = b"") -> str:
+    """
+    Build a content-addressed cache key for an interpolation result.
+
+    Args:
+        method: Interpolation method name (e.g. 'cubic', 'linear', 'gb')
+        series: Input points; the key covers every value and date
+        extra: Further bytes the result depends on (column name, profile, ...)
+
+    Returns:
+        Hex blake2b digest
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    values = np.ascontiguousarray(series.to_numpy())
+    index = pd.DatetimeIndex(series.index).asi8
+    for part in (f"{method}/{CACHE_FORMAT_VERSION}".encode(), str(values.dtype).encode(),
+                 values.tobytes(), index.tobytes(), extra):
+        digest.update(len(part).to_bytes(8, 'little'))
+        digest.update(part)
+    return digest.hexdigest()
+
+
+class InterpolationCache:
+    """
+    Bounded LRU cache of interpolated series with an optional on-disk tier.
+
+    Entries evicted from memory stay available on disk when a directory is set;
+    a disk hit is promoted back into memory. Returned values are copies.
+    """
+
+    def __init__(self, max_entries: int = 512, directory: Optional[Path] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of results kept in memory
+            directory: Optional directory for the persistent tier
+        """
+        self.max_entries = max(1, int(max_entries))
+        self.directory = Path(directory) if directory is not None else None
+        self._entries = OrderedDict()
+        self._prefetched = set()
+        self._lock = threading.Lock()
+        self._reset_stats()
+
+    def _reset_stats(self):
+        """Reset hit and miss counters."""
+        self._stats = {"hits": 0, "misses": 0, "disk_hits": 0, "disk_writes": 0, "evictions": 0}
+
+    def _disk_file(self, key: str) -> Optional[Path]:
+        """Path of the disk entry for a key, or None without a disk tier."""
+        return self.directory / f"{key}.pkl" if self.directory is not None else None
+
+    def _store(self, key: str, value: Any):
+        """Insert into the memory tier and evict the least recently used entries. Caller holds the lock."""
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            evicted, _ = self._entries.popitem(last=False)
+            self._prefetched.discard(evicted)
+            self._stats["evictions"] += 1
+
+    def _lookup(self, key: str) -> Optional[Any]:
+        """Find an entry in memory or on disk without counting the lookup. Caller holds the lock."""
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+        disk_file = self._disk_file(key)
+        if disk_file is not None and disk_file.exists():
+            try:
+                value = pd.read_pickle(disk_file)
+            except Exception as e:
+                print(f"Warning: Ignoring unreadable interpolation cache entry {disk_file.name}: {e}")
+                return None
+            self._stats["disk_hits"] += 1
+            self._store(key, value)
+            return value
+        return None
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a cached result.
+
+        A result stored by a batched prefetch counts as a miss on its first read,
+        since it was computed for that read.
+
+        Args:
+            key: Key from interpolation_cache_key
+
+        Returns:
+            Copy of the cached value, or None on a miss
+        """
+        with self._lock:
+            value = self._lookup(key)
+            if value is None or key in self._prefetched:
+                self._prefetched.discard(key)
+                self._stats["misses"] += 1
+            else:
+                self._stats["hits"] += 1
+        return value.copy() if value is not None else None
+
+    def __contains__(self, key: str) -> bool:
+        """Check for an entry (memory or disk) without counting a hit or miss."""
+        with self._lock:
+            return self._lookup(key) is not None
+
+    def put(self, key: str, value: Any, prefetched: bool = False):
+        """
+        Store a result in memory and, if enabled, on disk.
+
+        Args:
+            key: Key from interpolation_cache_key
+            value: Series or DataFrame to cache
+            prefetched: True if computed ahead of the get() that will read it
+        """
+        value = value.copy()
+        with self._lock:
+            self._store(key, value)
+            if prefetched:
+                self._prefetched.add(key)
+
+        disk_file = self._disk_file(key)
+        if disk_file is not None and not disk_file.exists():
+            try:
+                disk_file.parent.mkdir(parents=True, exist_ok=True)
+                temp_file = disk_file.with_name(f"{disk_file.name}.{os.getpid()}.tmp")
+                value.to_pickle(temp_file)
+                os.replace(temp_file, disk_file)
+                with self._lock:
+                    self._stats["disk_writes"] += 1
+            except OSError as e:
+                print(f"Warning: Could not write interpolation cache entry: {e}")
+
+    def clear(self, disk: bool = False):
+        """
+        Drop all entries from memory and reset the counters.
+
+        Args:
+            disk: Also delete the persistent entries
+        """
+        with self._lock:
+            self._entries.clear()
+            self._prefetched.clear()
+            self._reset_stats()
+        if disk and self.directory is not None and self.directory.exists():
+            for disk_file in self.directory.glob("*.pkl"):
+                disk_file.unlink(missing_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with entry count, capacity, hit/miss counters and hit rate
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = len(self._entries)
+        stats["max_entries"] = self.max_entries
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        stats["disk_enabled"] = self.directory is not None
+        return stats
+
+
+def cached_batched_cubic_interpolation(df: pd.DataFrame, columns: Optional[List[str]] = None,
+                                       daily: bool = False,
+                                       cache: Optional[InterpolationCache] = None) -> Dict[str, pd.Series]:
+    """
+    batched_cubic_interpolation that reuses cached results per column.
+
+    Args:
+        df: DataFrame with a date index and one series per column
+        columns: Columns to interpolate (defaults to all columns)
+        daily: Evaluate daily and take the monthly mean (see batched_cubic_interpolation)
+        cache: Cache to use (defaults to the shared cache of get_interpolation_cache)
+
+    Returns:
+        Dictionary mapping column name to its monthly Series
+    """
+    cache = cache if cache is not None else get_interpolation_cache()
+    method = "cubic_daily" if daily else "cubic"
+    columns = list(df.columns) if columns is None else list(columns)
+
+    results, keys, missing = {}, {}, []
+    for column in columns:
+        keys[column] = interpolation_cache_key(method, df[column].dropna(), str(column).encode())
+        cached = cache.get(keys[column])
+        if cached is None:
+            missing.append(column)
+        else:
+            results[column] = cached
+
+    if missing:
+        for column, series in batched_cubic_interpolation(df, missing, daily).items():
+            cache.put(keys[column], series)
+            results[column] = series
+
+    return {column: results[column] for column in columns if column in results}
+
+
+# Global interpolation cache instance
+_interpolation_cache_instance = None
+
+def get_interpolation_cache() -> InterpolationCache:
+    """
+    Get the shared interpolation cache with its disk tier under the configured cache path.
+
+    Returns:
+        The global InterpolationCache instance
+    """
+    global _interpolation_cache_instance
+    if _interpolation_cache_instance is None:
+        _interpolation_cache_instance = InterpolationCache(directory=get_config().cache_path / "interpolation")
+    return _interpolation_cache_instance
+
+def reset_interpolation_cache():
+    """
+    Reset the global interpolation cache instance.
+    """
+    global _interpolation_cache_instance
+    _interpolation_cache_instance = None
@@ -0,0 +1,221 @@
+"""
+In-memory index of the tool notes and DOIs for the Management Tools Analysis Dashboard.
+
+notes_and_doi.db holds about 140 rows (one per tool and source), so each worker
+reads it once and answers lookups from dictionaries. Translated notes are
+computed once per language when a translator is registered, not on every
+callback.
+
+Full-text search over Notes and Keywords uses an in-memory SQLite FTS5 table
+built from the same rows on the first search in each process (SQLite connections
+must not cross a fork). If the SQLite build has no FTS5, search falls back to a
+substring scan of the loaded notes.
+"""
+
+import os
+import re
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, Any, Optional, Tuple
+
+# Columns exposed by get_tool_notes_and_doi, in the order of the notes table
+NOTE_FIELDS = ("doi", "source", "notes", "links", "keywords")
+
+
+class NotesIndex:
+    """
+    Notes and DOI records of all tools, grouped by tool and by (tool, source).
+    """
+
+    def __init__(self, rows: List[Tuple[str, str, str, str, str, str]]):
+        """
+        Build the index from notes table rows.
+
+        Args:
+            rows: (Herramienta, Source, DOI, Notes, Links, Keywords) tuples
+        """
+        self.records = []
+        self._by_tool = {}
+        self._by_tool_source = {}
+        self._translations = {}  # language -> notes per record, in record order
+        self._lock = threading.Lock()
+        self._search_conn = None
+        self._search_pid = None
+
+        for tool, source, doi, notes, links, keywords in rows:
+            record = {'tool': tool, 'doi': doi, 'source': source, 'notes': notes,
+                      'links': links, 'keywords': keywords}
+            position = len(self.records)
+            self.records.append(record)
+            self._by_tool.setdefault(tool, []).append(position)
+            self._by_tool_source.setdefault((tool, source), []).append(position)
+
+    @classmethod
+    def load(cls, db_path: Path) -> "NotesIndex":
+        """
+        Load the index from a notes database file.
+
+        Args:
+            db_path: Path to notes_and_doi.db
+
+        Returns:
+            NotesIndex instance (empty if the file does not exist or cannot be read)
+        """
+        db_path = Path(db_path)
+        if not db_path.exists():
+            print(f"Warning: Notes database not found at {db_path}")
+            return cls([])
+
+        try:
+            conn = sqlite3.connect(f"{db_path.resolve().as_uri()}?mode=ro", uri=True)
+            try:
+                rows = conn.execute(
+                    "SELECT Herramienta, Source, DOI, Notes, Links, Keywords FROM tool_notes ORDER BY rowid"
+                ).fetchall()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            print(f"Error retrieving tool notes: {e}")
+            rows = []
+        return cls(rows)
+
+    def _search_table(self) -> Optional[sqlite3.Connection]:
+        """
+        Get this process's FTS5 table over the notes in every loaded language.
+
+        Must be called with the lock held.
+
+        Returns:
+            In-memory SQLite connection, or None if FTS5 is not available
+        """
+        if self._search_pid == os.getpid():
+            return self._search_conn
+
+        self._search_pid = os.getpid()
+        self._search_conn = None
+        try:
+            conn = sqlite3.connect(":memory:", check_same_thread=False)
+            conn.execute(
+                "CREATE VIRTUAL TABLE notes_fts USING fts5("
+                "notes, keywords, position UNINDEXED, language UNINDEXED, "
+                "tokenize = 'unicode61 remove_diacritics 2')"
+            )
+        except sqlite3.OperationalError as e:
+            print(f"Warning: FTS5 is not available, notes search will scan all notes: {e}")
+            return None
+
+        languages = {'es': [record['notes'] for record in self.records], **self._translations}
+        for language, notes in languages.items():
+            conn.executemany(
+                "INSERT INTO notes_fts (notes, keywords, position, language) VALUES (?, ?, ?, ?)",
+                [(text or '', record['keywords'] or '', position, language)
+                 for position, (text, record) in enumerate(zip(notes, self.records))]
+            )
+        self._search_conn = conn
+        return conn
+
+    def add_translation(self, language: str, translator: Callable[[str], str]):
+        """
+        Precompute the notes of every record in another language.
+
+        Translated notes are also searchable under that language.
+
+        Args:
+            language: Language code (e.g. 'en')
+            translator: Function translating a Spanish notes text into the language
+        """
+        translated = [translator(record['notes']) if record['notes'] else record['notes']
+                      for record in self.records]
+        with self._lock:
+            self._translations[language] = translated
+            # Rebuilt with the new language on the next search
+            if self._search_conn is not None and self._search_pid == os.getpid():
+                self._search_conn.close()
+            self._search_conn = None
+            self._search_pid = None
+
+    def _record(self, position: int, language: str) -> Dict[str, Any]:
+        """Copy of a record with its notes in the given language, if translated."""
+        record = self.records[position]
+        result = {field: record[field] for field in NOTE_FIELDS}
+        translated = self._translations.get(language)
+        if translated is not None:
+            result['notes'] = translated[position]
+        return result
+
+    def get(self, tool_name: str, source_name: Optional[str] = None, language: str = 'es') -> List[Dict[str, Any]]:
+        """
+        Get the notes records of a tool, optionally for a single source.
+
+        Args:
+            tool_name: Spanish name of the management tool
+            source_name: Optional source name to filter
+            language: Language of the returned notes (Spanish if no translation was added)
+
+        Returns:
+            List of dictionaries with doi, source, notes, links and keywords
+        """
+        if source_name:
+            positions = self._by_tool_source.get((tool_name, source_name), [])
+        else:
+            positions = self._by_tool.get(tool_name, [])
+        return [self._record(position, language) for position in positions]
+
+    def search(self, query: str, language: str = 'es', source_name: Optional[str] = None,
+               limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        Search the notes and keywords of all tools.
+
+        Every word of the query must appear in the notes or keywords (accents and
+        case are ignored). Results are ranked by BM25 when FTS5 is available.
+
+        Args:
+            query: Plain search text; FTS syntax characters are treated as text
+            language: Language of the notes to search and return
+            source_name: Optional source name to filter
+            limit: Maximum number of results
+
+        Returns:
+            List of dictionaries with tool, doi, source, notes, links and keywords
+        """
+        words = re.findall(r"\w+", query or "")
+        if not words:
+            return []
+        if language != 'es' and language not in self._translations:
+            language = 'es'
+
+        match = " ".join(f'"{word}"' for word in words)
+        with self._lock:
+            conn = self._search_table()
+            if conn is not None:
+                positions = [row[0] for row in conn.execute(
+                    "SELECT position FROM notes_fts WHERE notes_fts MATCH ? AND language = ? ORDER BY bm25(notes_fts)",
+                    (match, language)
+                )]
+        if conn is None:
+            positions = self._scan(words, language)
+
+        results = []
+        for position in positions:
+            if source_name and self.records[position]['source'] != source_name:
+                continue
+            record = self._record(position, language)
+            record['tool'] = self.records[position]['tool']
+            results.append(record)
+            if len(results) >= limit:
+                break
+        return results
+
+    def _scan(self, words: List[str], language: str) -> List[int]:
+        """Substring search used when FTS5 is not available."""
+        words = [word.casefold() for word in words]
+        positions = []
+        for position, record in enumerate(self.records):
+            text = f"{self._record(position, language)['notes'] or ''} {record['keywords'] or ''}".casefold()
+            if all(word in text for word in words):
+                positions.append(position)
+        return positions
+
+    def __len__(self) -> int:
+        return len(self.records)
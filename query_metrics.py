@@ -0,0 +1,269 @@
+"""
+Query instrumentation for the Management Tools Analysis Dashboard database layer.
+
+DatabaseManager reports every read to an optional sink: latency split into the
+SQLite part (execute and fetch) and the pandas part (building the returned
+frame), rows returned, bytes materialized, and time spent waiting for a pooled
+connection. With no sink configured the read paths only test one attribute
+against None.
+
+Sinks:
+    InProcessQueryMetrics    thread-safe histograms kept in the worker, read with stats()
+    PrometheusQueryMetrics   prometheus_client histograms and counters (optional dependency)
+
+Select one with the "metrics" setting in config/database.json or the
+DASHBOARD_DATABASE_METRICS environment variable ("off", "memory" or "prometheus").
+"""
+
+import bisect
+import os
+import threading
+from typing import Any, Dict, Optional, Sequence
+
+# Latency bucket upper bounds in seconds (prometheus_client's defaults, plus finer low buckets)
+DEFAULT_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+                   0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class QueryMetricsSink:
+    """
+    Base class of the sinks DatabaseManager reports to.
+
+    Every method ignores its observation, so a sink only overrides what it records.
+    """
+
+    def observe_query(self, method: str, table: str, sql_seconds: float, frame_seconds: float = 0.0,
+                      rows: int = 0, nbytes: int = 0):
+        """
+        Record one read.
+
+        Args:
+            method: DatabaseManager method that ran the query
+            table: Table read, or 'snapshot'/'union' for reads spanning several tables
+            sql_seconds: Time spent executing the query and fetching rows
+            frame_seconds: Time spent building the returned pandas objects
+            rows: Number of rows returned by SQLite
+            nbytes: Size of the materialized DataFrame, including its index
+        """
+
+    def observe_pool_wait(self, seconds: float):
+        """
+        Record the time spent acquiring a pooled connection.
+
+        Args:
+            seconds: Wait time in seconds
+        """
+
+
+class _Histogram:
+    """Fixed-bucket latency histogram (not thread-safe; guarded by the owning sink)."""
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last slot is +Inf
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-quantile (the maximum for the +Inf bucket)."""
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        cumulative = 0
+        for position, count in enumerate(self.counts):
+            cumulative += count
+            if cumulative >= target:
+                return self.buckets[position] if position < len(self.buckets) else self.max
+        return self.max
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "total_ms": round(1000 * self.total, 3),
+            "avg_ms": round(1000 * self.total / self.count, 3) if self.count else 0.0,
+            "p50_ms": round(1000 * self.quantile(0.5), 3),
+            "p95_ms": round(1000 * self.quantile(0.95), 3),
+            "max_ms": round(1000 * self.max, 3),
+            "buckets": dict(zip([str(b) for b in self.buckets] + ["+Inf"], self.counts))
+        }
+
+
+class InProcessQueryMetrics(QueryMetricsSink):
+    """
+    Aggregates query metrics in the worker process.
+
+    Keeps one SQL and one DataFrame latency histogram per (method, table), with
+    row and byte totals, and a histogram of pool wait times.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        """
+        Initialize the aggregator.
+
+        Args:
+            buckets: Ascending histogram bucket upper bounds in seconds
+        """
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Discard everything recorded so far."""
+        with self._lock:
+            self._queries = {}
+            self._pool_wait = _Histogram(self.buckets)
+
+    def observe_query(self, method: str, table: str, sql_seconds: float, frame_seconds: float = 0.0,
+                      rows: int = 0, nbytes: int = 0):
+        key = (method, table)
+        with self._lock:
+            entry = self._queries.get(key)
+            if entry is None:
+                entry = self._queries[key] = {
+                    "sql": _Histogram(self.buckets),
+                    "frame": _Histogram(self.buckets),
+                    "rows": 0,
+                    "bytes": 0
+                }
+            entry["sql"].observe(sql_seconds)
+            entry["frame"].observe(frame_seconds)
+            entry["rows"] += rows
+            entry["bytes"] += nbytes
+
+    def observe_pool_wait(self, seconds: float):
+        with self._lock:
+            self._pool_wait.observe(seconds)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get the aggregated metrics.
+
+        Returns:
+            Dictionary with a "queries" entry per "method/table" (SQL and DataFrame
+            latency summaries, rows and bytes) and a "pool_wait" latency summary
+        """
+        with self._lock:
+            queries = {
+                f"{method}/{table}": {
+                    "sql": entry["sql"].summary(),
+                    "frame": entry["frame"].summary(),
+                    "rows": entry["rows"],
+                    "bytes": entry["bytes"]
+                }
+                for (method, table), entry in sorted(self._queries.items())
+            }
+            return {"queries": queries, "pool_wait": self._pool_wait.summary()}
+
+
+# Metric objects per registry, so re-creating a sink does not register duplicates
+_prometheus_metrics = {}
+_prometheus_lock = threading.Lock()
+
+
+class PrometheusQueryMetrics(QueryMetricsSink):
+    """
+    Exports query metrics through prometheus_client.
+
+    Metrics (with the default namespace):
+        dashboard_database_query_seconds{method, table, phase}   histogram, phase is "sql" or "frame"
+        dashboard_database_rows_total{method, table}              counter
+        dashboard_database_bytes_total{method, table}             counter
+        dashboard_database_pool_wait_seconds                      histogram
+    """
+
+    def __init__(self, registry=None, namespace: str = "dashboard_database",
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        """
+        Initialize the sink.
+
+        Args:
+            registry: prometheus_client CollectorRegistry (defaults to the global REGISTRY)
+            namespace: Metric name prefix
+            buckets: Histogram bucket upper bounds in seconds
+
+        Raises:
+            ImportError: If prometheus_client is not installed
+        """
+        import prometheus_client
+
+        self.registry = registry if registry is not None else prometheus_client.REGISTRY
+        with _prometheus_lock:
+            key = (id(self.registry), namespace)
+            if key not in _prometheus_metrics:
+                _prometheus_metrics[key] = (
+                    prometheus_client.Histogram(
+                        "query_seconds", "Database read latency by method, table and phase",
+                        ["method", "table", "phase"], namespace=namespace, buckets=buckets,
+                        registry=self.registry),
+                    prometheus_client.Counter(
+                        "rows", "Rows returned by database reads", ["method", "table"],
+                        namespace=namespace, registry=self.registry),
+                    prometheus_client.Counter(
+                        "bytes", "Bytes materialized into DataFrames by database reads", ["method", "table"],
+                        namespace=namespace, registry=self.registry),
+                    prometheus_client.Histogram(
+                        "pool_wait_seconds", "Time spent waiting for a pooled connection",
+                        namespace=namespace, buckets=buckets, registry=self.registry)
+                )
+            self._latency, self._rows, self._bytes, self._pool_wait = _prometheus_metrics[key]
+
+    def observe_query(self, method: str, table: str, sql_seconds: float, frame_seconds: float = 0.0,
+                      rows: int = 0, nbytes: int = 0):
+        self._latency.labels(method, table, "sql").observe(sql_seconds)
+        self._latency.labels(method, table, "frame").observe(frame_seconds)
+        if rows:
+            self._rows.labels(method, table).inc(rows)
+        if nbytes:
+            self._bytes.labels(method, table).inc(nbytes)
+
+    def observe_pool_wait(self, seconds: float):
+        self._pool_wait.observe(seconds)
+
+    def render(self) -> bytes:
+        """
+        Render the metrics in the Prometheus text exposition format.
+
+        In prometheus_client multiprocess mode (PROMETHEUS_MULTIPROC_DIR set) the
+        values of all gunicorn workers are merged.
+        """
+        from prometheus_client import CollectorRegistry, generate_latest
+
+        if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+            from prometheus_client import multiprocess
+            registry = CollectorRegistry()
+            multiprocess.MultiProcessCollector(registry)
+            return generate_latest(registry)
+        return generate_latest(self.registry)
+
+
+def create_metrics_sink(kind: Optional[str]) -> Optional[QueryMetricsSink]:
+    """
+    Create the sink selected in the configuration.
+
+    Args:
+        kind: "off" (or None/empty), "memory" or "prometheus"
+
+    Returns:
+        Sink instance, or None when instrumentation is off
+    """
+    kind = (kind or "off").strip().lower()
+    if kind in ("off", "none", "false"):
+        return None
+    if kind == "memory":
+        return InProcessQueryMetrics()
+    if kind == "prometheus":
+        try:
+            return PrometheusQueryMetrics()
+        except ImportError:
+            print("Warning: prometheus_client is not installed, keeping query metrics in memory")
+            return InProcessQueryMetrics()
+    print(f"Warning: Unknown query metrics sink '{kind}', instrumentation disabled")
+    return None
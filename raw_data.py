@@ -0,0 +1,200 @@
+"""
+Shared raw CSV loader for the Management Tools Analysis Dashboard.
+
+The dbase/ files are re-read by the database build and by the CLI analysis
+scripts. Each parsed table is kept as a pickled DataFrame under the configured
+cache path, validated against the size, modification time and content hash of
+the source CSV. Stale or missing entries are re-parsed transparently, so callers
+always get what pd.read_csv returns.
+
+Pickles are used rather than .npz archives: for files of a few hundred rows,
+opening an archive member by member is slower than parsing the CSV.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import threading
+import pandas as pd
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from config import get_config
+
+# Bump when the cache entry layout changes, so old entries are re-parsed
+RAW_CACHE_VERSION = 1
+
+
+def file_fingerprint(path: Path, previous: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+    """
+    Fingerprint a file by size, modification time and content hash.
+
+    The file is only hashed when its size or modification time differ from the
+    previous fingerprint.
+
+    Args:
+        path: File to fingerprint
+        previous: Previously stored fingerprint, if any
+
+    Returns:
+        Fingerprint dictionary, or None if the file does not exist
+    """
+    try:
+        stat = Path(path).stat()
+    except FileNotFoundError:
+        return None
+
+    if previous and previous.get("size") == stat.st_size and previous.get("mtime_ns") == stat.st_mtime_ns:
+        return previous
+
+    with open(path, 'rb') as f:
+        digest = hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "blake2b": digest}
+
+
+class RawDataLoader:
+    """
+    CSV loader with an optional on-disk cache of parsed tables.
+
+    Without a cache directory every call parses the CSV. With one, parsed tables are
+    written as pickled DataFrames and reused while the source file is unchanged.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        """
+        Initialize the loader.
+
+        Args:
+            cache_dir: Directory for the parsed-table cache (None disables it)
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self._cache_files = {}
+        self._lock = threading.Lock()
+        self._stats = {"parsed": 0, "cache_hits": 0, "cache_writes": 0}
+
+    def _count(self, key: str):
+        with self._lock:
+            self._stats[key] += 1
+
+    def _cache_file(self, path: Path, options: str) -> Path:
+        """Cache file for a source file read with the given pd.read_csv options."""
+        cache_file = self._cache_files.get((path, options))
+        if cache_file is None:
+            identity = hashlib.blake2b(f"{path.resolve()}|{options}".encode(), digest_size=10).hexdigest()
+            cache_file = self.cache_dir / f"{path.stem}-{identity}.pkl"
+            self._cache_files[(path, options)] = cache_file
+        return cache_file
+
+    def read_csv(self, path: Path, **read_csv_kwargs) -> pd.DataFrame:
+        """
+        Read a CSV file, from the parsed-table cache when it is current.
+
+        Args:
+            path: CSV file to read
+            **read_csv_kwargs: Options passed to pd.read_csv
+
+        Returns:
+            DataFrame as returned by pd.read_csv
+
+        Raises:
+            Whatever pd.read_csv raises for the file (FileNotFoundError, UnicodeDecodeError, ...)
+        """
+        path = Path(path)
+        if self.cache_dir is None:
+            self._count("parsed")
+            return pd.read_csv(path, **read_csv_kwargs)
+
+        options = json.dumps(read_csv_kwargs, sort_keys=True, default=str)
+        cache_file = self._cache_file(path, options)
+
+        try:
+            with open(cache_file, 'rb') as f:
+                header, df = pickle.load(f)
+            fingerprint = file_fingerprint(path, header["source"])
+            if (header.get("version") == RAW_CACHE_VERSION and fingerprint is not None
+                    and fingerprint["blake2b"] == header["source"]["blake2b"]):
+                self._count("cache_hits")
+                if fingerprint is not header["source"]:
+                    # Touched but unchanged: remember the new mtime to skip hashing next time
+                    self._write(cache_file, df, fingerprint)
+                return df
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Warning: Ignoring unreadable raw data cache {cache_file.name}: {e}")
+
+        df = pd.read_csv(path, **read_csv_kwargs)
+        self._count("parsed")
+        fingerprint = file_fingerprint(path)
+        if fingerprint is not None:
+            self._write(cache_file, df, fingerprint)
+        return df
+
+    def _write(self, cache_file: Path, df: pd.DataFrame, fingerprint: Dict[str, Any]):
+        """Write a parsed table to the cache, atomically."""
+        header = {"version": RAW_CACHE_VERSION, "source": fingerprint}
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+            with open(temp_file, 'wb') as f:
+                pickle.dump((header, df), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_file, cache_file)
+            self._count("cache_writes")
+        except OSError as e:
+            print(f"Warning: Could not write raw data cache {cache_file.name}: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the number of parsed files, cache hits and cache writes."""
+        with self._lock:
+            stats = dict(self._stats)
+        stats["cache_enabled"] = self.cache_dir is not None
+        return stats
+
+
+def load_dbase_csv(path: Path, dates: Optional[str] = None,
+                   loader: Optional[RawDataLoader] = None) -> pd.DataFrame:
+    """
+    Load a dbase/ time series file: first column as stripped index, optionally as dates.
+
+    Args:
+        path: CSV file in the dbase/ format ('YYYY-MM' or 'YYYY' first column)
+        dates: None to keep the index as text, 'monthly' for 'YYYY-MM' dates, or
+            'annual' to keep only the year (Google Books)
+        loader: Loader to use (defaults to the shared get_raw_data_loader instance)
+
+    Returns:
+        DataFrame with one column per series
+    """
+    loader = loader if loader is not None else get_raw_data_loader()
+    df = loader.read_csv(path, index_col=0)
+    df.index = df.index.str.strip()
+
+    if dates == 'annual':
+        df.index = pd.to_datetime(df.index.str.split('-').str[0], format='%Y')
+    elif dates == 'monthly':
+        df.index = pd.to_datetime(df.index + '-01', format='%Y-%m-%d')
+    return df
+
+
+# Global raw data loader instance
+_raw_data_loader_instance = None
+
+def get_raw_data_loader() -> RawDataLoader:
+    """
+    Get the shared raw data loader, caching parsed files under the configured cache path.
+
+    Returns:
+        The global RawDataLoader instance
+    """
+    global _raw_data_loader_instance
+    if _raw_data_loader_instance is None:
+        _raw_data_loader_instance = RawDataLoader(get_config().cache_path / "raw")
+    return _raw_data_loader_instance
+
+def reset_raw_data_loader():
+    """
+    Reset the global raw data loader instance.
+    """
+    global _raw_data_loader_instance
+    _raw_data_loader_instance = None